@@ -3,6 +3,7 @@ from typing import Dict, Iterable, Optional
 from iota import AdapterSpec, Address, BundleHash, ProposedTransaction, Tag, \
     TransactionHash, TransactionTrytes, TryteString, TrytesCompatible
 from iota.crypto.addresses import AddressGenerator
+from iota.crypto.cache import BaseAddressCache
 from iota.api_async import AsyncStrictIota, AsyncIota
 import asyncio
 
@@ -882,6 +883,7 @@ class Iota(StrictIota, AsyncIota):
             addresses: Optional[Iterable[Address]] = None,
             tags: Optional[Iterable[Tag]] = None,
             approvees: Optional[Iterable[TransactionHash]] = None,
+            verify_hashes: float = 0,
     ) -> dict:
         """
         A more extensive version of :py:meth:`find_transactions` that
@@ -911,6 +913,12 @@ class Iota(StrictIota, AsyncIota):
         :param Optional[Iterable[TransactionHash]] approvees:
             List of approvee transaction IDs.
 
+        :param float verify_hashes:
+            Fraction (between 0 and 1) of the transaction hashes to check
+            against the trytes that the node returns, chosen at random.
+
+            By default, the hashes are trusted without checking.
+
         :return:
             ``dict`` with the following structure::
 
@@ -928,6 +936,7 @@ class Iota(StrictIota, AsyncIota):
                         addresses,
                         tags,
                         approvees,
+                        verify_hashes,
                 )
         )
 
@@ -936,7 +945,10 @@ class Iota(StrictIota, AsyncIota):
             start: int = 0,
             stop: Optional[int] = None,
             inclusion_states: bool = False,
-            security_level: Optional[int] = None
+            security_level: Optional[int] = None,
+            verify_hashes: float = 0,
+            workers: Optional[int] = None,
+            cache: Optional[BaseAddressCache] = None,
     ) -> dict:
         """
         More comprehensive version of :py:meth:`get_transfers` that
@@ -986,6 +998,21 @@ class Iota(StrictIota, AsyncIota):
             If not set, defaults to
             :py:attr:`AddressGenerator.DEFAULT_SECURITY_LEVEL`.
 
+        :param float verify_hashes:
+            Fraction (between 0 and 1) of the transaction hashes to check
+            against the trytes that the node returns, chosen at random.
+
+            By default, the hashes are trusted without checking.
+
+        :param Optional[int] workers:
+            If set, addresses are generated in parallel, using a pool of
+            this many worker processes.
+
+        :param Optional[BaseAddressCache] cache:
+            Cache to check before deriving each address, and to store
+            newly derived digests and addresses in.  See
+            :py:class:`AddressGenerator` for more info.
+
         :return:
             ``dict`` with the following structure::
 
@@ -1013,12 +1040,16 @@ class Iota(StrictIota, AsyncIota):
                         stop,
                         inclusion_states,
                         security_level,
+                        verify_hashes,
+                        workers,
+                        cache,
                 )
         )
 
     def get_bundles(
             self,
-            transactions: Iterable[TransactionHash]
+            transactions: Iterable[TransactionHash],
+            verify_hashes: float = 0,
     ) -> dict:
         """
         Returns the bundle(s) associated with the specified transaction
@@ -1027,6 +1058,12 @@ class Iota(StrictIota, AsyncIota):
         :param Iterable[TransactionHash] transactions:
             Transaction hashes.  Must be a tail transaction.
 
+        :param float verify_hashes:
+            Fraction (between 0 and 1) of the transaction hashes to check
+            against the trytes that the node returns, chosen at random.
+
+            By default, the hashes are trusted without checking.
+
         :return:
             ``dict`` with the following structure::
 
@@ -1047,7 +1084,10 @@ class Iota(StrictIota, AsyncIota):
         # Execute original coroutine inside an event loop to make this method
         # synchronous
         return asyncio.get_event_loop().run_until_complete(
-                super().get_bundles(transactions)
+                super().get_bundles(
+                        transactions,
+                        verify_hashes,
+                )
         )
 
     def get_inputs(
@@ -1056,6 +1096,8 @@ class Iota(StrictIota, AsyncIota):
             stop: Optional[int] = None,
             threshold: Optional[int] = None,
             security_level: Optional[int] = None,
+            workers: Optional[int] = None,
+            cache: Optional[BaseAddressCache] = None,
     ) -> dict:
         """
         Gets all possible inputs of a seed and returns them, along with
@@ -1121,6 +1163,15 @@ class Iota(StrictIota, AsyncIota):
             If not set, defaults to
             :py:attr:`AddressGenerator.DEFAULT_SECURITY_LEVEL`.
 
+        :param Optional[int] workers:
+            If set, addresses are generated in parallel, using a pool of
+            this many worker processes.
+
+        :param Optional[BaseAddressCache] cache:
+            Cache to check before deriving each address, and to store
+            newly derived digests and addresses in.  See
+            :py:class:`AddressGenerator` for more info.
+
         :return:
             ``dict`` with the following structure::
 
@@ -1161,6 +1212,8 @@ class Iota(StrictIota, AsyncIota):
                         stop,
                         threshold,
                         security_level,
+                        workers,
+                        cache,
                 )
         )
 
@@ -1170,6 +1223,8 @@ class Iota(StrictIota, AsyncIota):
             count: int = 1,
             security_level: int = AddressGenerator.DEFAULT_SECURITY_LEVEL,
             checksum: bool = False,
+            workers: Optional[int] = None,
+            cache: Optional[BaseAddressCache] = None,
     ):
         """
         Generates one or more new addresses from the seed.
@@ -1211,6 +1266,15 @@ class Iota(StrictIota, AsyncIota):
             Specify whether to return the address with the checksum.
             Defaults to ``False``.
 
+        :param Optional[int] workers:
+            If set, addresses are generated in parallel, using a pool of
+            this many worker processes.
+
+        :param Optional[BaseAddressCache] cache:
+            Cache to check before deriving each address, and to store
+            newly derived digests and addresses in.  See
+            :py:class:`AddressGenerator` for more info.
+
         :return:
             ``dict`` with the following structure::
 
@@ -1232,12 +1296,15 @@ class Iota(StrictIota, AsyncIota):
                         index=index,
                         security_level=security_level,
                         checksum=checksum,
+                        workers=workers,
+                        cache=cache,
                 )
         )
 
     def get_transaction_objects(
             self,
             hashes: [Iterable[TransactionHash]],
+            verify_hashes: float = 0,
     ) -> dict:
         """
         Fetches transaction objects from the Tangle given their
@@ -1252,6 +1319,12 @@ class Iota(StrictIota, AsyncIota):
         :param Iterable[TransactionHash] hashes:
           List of transaction IDs (transaction hashes).
 
+        :param float verify_hashes:
+            Fraction (between 0 and 1) of the transaction hashes to check
+            against the trytes that the node returns, chosen at random.
+
+            By default, the hashes are trusted without checking.
+
         :return:
             ``dict`` with the following structure::
 
@@ -1263,14 +1336,20 @@ class Iota(StrictIota, AsyncIota):
         # Execute original coroutine inside an event loop to make this method
         # synchronous
         return asyncio.get_event_loop().run_until_complete(
-                super().get_transaction_objects(hashes)
+                super().get_transaction_objects(
+                        hashes,
+                        verify_hashes,
+                )
         )
 
     def get_transfers(
             self,
             start: int = 0,
             stop: Optional[int] = None,
-            inclusion_states: bool = False
+            inclusion_states: bool = False,
+            verify_hashes: float = 0,
+            workers: Optional[int] = None,
+            cache: Optional[BaseAddressCache] = None,
     ) -> dict:
         """
         Returns all transfers associated with the seed.
@@ -1307,6 +1386,21 @@ class Iota(StrictIota, AsyncIota):
             This requires an additional API call to the node, so it is
             disabled by default.
 
+        :param float verify_hashes:
+            Fraction (between 0 and 1) of the transaction hashes to check
+            against the trytes that the node returns, chosen at random.
+
+            By default, the hashes are trusted without checking.
+
+        :param Optional[int] workers:
+            If set, addresses are generated in parallel, using a pool of
+            this many worker processes.
+
+        :param Optional[BaseAddressCache] cache:
+            Cache to check before deriving each address, and to store
+            newly derived digests and addresses in.  See
+            :py:class:`AddressGenerator` for more info.
+
         :return:
             ``dict`` with the following structure::
 
@@ -1330,6 +1424,9 @@ class Iota(StrictIota, AsyncIota):
                         start,
                         stop,
                         inclusion_states,
+                        verify_hashes,
+                        workers,
+                        cache,
                 )
         )
 
@@ -1674,7 +1771,11 @@ class Iota(StrictIota, AsyncIota):
                 )
         )
 
-    def traverse_bundle(self, tail_hash: TransactionHash) -> dict:
+    def traverse_bundle(
+            self,
+            tail_hash: TransactionHash,
+            verify_hashes: float = 0,
+    ) -> dict:
         """
         Fetches and traverses a bundle from the Tangle given a tail transaction
         hash.
@@ -1687,6 +1788,12 @@ class Iota(StrictIota, AsyncIota):
         :param TransactionHash tail_hash:
             Tail transaction hash of the bundle.
 
+        :param float verify_hashes:
+            Fraction (between 0 and 1) of the transaction hashes to check
+            against the trytes that the node returns, chosen at random.
+
+            By default, the hashes are trusted without checking.
+
         :return:
             ``dict`` with the following structure::
 
@@ -1702,5 +1809,6 @@ class Iota(StrictIota, AsyncIota):
         return asyncio.get_event_loop().run_until_complete(
                 super().traverse_bundle(
                         tail_hash,
+                        verify_hashes,
                 )
         )
@@ -5,6 +5,7 @@ from iota import AdapterSpec, Address, BundleHash, ProposedTransaction, Tag, \
 from iota.adapter import BaseAdapter, resolve_adapter
 from iota.commands import CustomCommand, core, extended
 from iota.crypto.addresses import AddressGenerator
+from iota.crypto.cache import BaseAddressCache
 from iota.crypto.types import Seed
 
 __all__ = [
@@ -821,6 +822,7 @@ class AsyncIota(AsyncStrictIota):
             addresses: Optional[Iterable[Address]] = None,
             tags: Optional[Iterable[Tag]] = None,
             approvees: Optional[Iterable[TransactionHash]] = None,
+            verify_hashes: float = 0,
     ) -> dict:
         """
         A more extensive version of :py:meth:`find_transactions` that
@@ -850,6 +852,12 @@ class AsyncIota(AsyncStrictIota):
         :param Optional[Iterable[TransactionHash]] approvees:
             List of approvee transaction IDs.
 
+        :param float verify_hashes:
+            Fraction (between 0 and 1) of the transaction hashes to check
+            against the trytes that the node returns, chosen at random.
+
+            By default, the hashes are trusted without checking.
+
         :return:
             ``dict`` with the following structure::
 
@@ -864,6 +872,7 @@ class AsyncIota(AsyncStrictIota):
                 addresses=addresses,
                 tags=tags,
                 approvees=approvees,
+                verifyHashes=verify_hashes,
         )
 
     async def get_account_data(
@@ -871,7 +880,10 @@ class AsyncIota(AsyncStrictIota):
             start: int = 0,
             stop: Optional[int] = None,
             inclusion_states: bool = False,
-            security_level: Optional[int] = None
+            security_level: Optional[int] = None,
+            verify_hashes: float = 0,
+            workers: Optional[int] = None,
+            cache: Optional[BaseAddressCache] = None,
     ) -> dict:
         """
         More comprehensive version of :py:meth:`get_transfers` that
@@ -921,6 +933,21 @@ class AsyncIota(AsyncStrictIota):
             If not set, defaults to
             :py:attr:`AddressGenerator.DEFAULT_SECURITY_LEVEL`.
 
+        :param float verify_hashes:
+            Fraction (between 0 and 1) of the transaction hashes to check
+            against the trytes that the node returns, chosen at random.
+
+            By default, the hashes are trusted without checking.
+
+        :param Optional[int] workers:
+            If set, addresses are generated in parallel, using a pool of
+            this many worker processes.
+
+        :param Optional[BaseAddressCache] cache:
+            Cache to check before deriving each address, and to store
+            newly derived digests and addresses in.  See
+            :py:class:`AddressGenerator` for more info.
+
         :return:
             ``dict`` with the following structure::
 
@@ -945,12 +972,16 @@ class AsyncIota(AsyncStrictIota):
                 start=start,
                 stop=stop,
                 inclusionStates=inclusion_states,
-                security_level=security_level
+                security_level=security_level,
+                verifyHashes=verify_hashes,
+                workers=workers,
+                cache=cache,
         )
 
     async def get_bundles(
             self,
-            transactions: Iterable[TransactionHash]
+            transactions: Iterable[TransactionHash],
+            verify_hashes: float = 0,
     ) -> dict:
         """
         Returns the bundle(s) associated with the specified transaction
@@ -959,6 +990,12 @@ class AsyncIota(AsyncStrictIota):
         :param Iterable[TransactionHash] transactions:
             Transaction hashes.  Must be a tail transaction.
 
+        :param float verify_hashes:
+            Fraction (between 0 and 1) of the transaction hashes to check
+            against the trytes that the node returns, chosen at random.
+
+            By default, the hashes are trusted without checking.
+
         :return:
             ``dict`` with the following structure::
 
@@ -978,6 +1015,7 @@ class AsyncIota(AsyncStrictIota):
         """
         return await extended.GetBundlesCommand(self.adapter)(
                 transactions=transactions,
+                verifyHashes=verify_hashes,
         )
 
     async def get_inputs(
@@ -986,6 +1024,8 @@ class AsyncIota(AsyncStrictIota):
             stop: Optional[int] = None,
             threshold: Optional[int] = None,
             security_level: Optional[int] = None,
+            workers: Optional[int] = None,
+            cache: Optional[BaseAddressCache] = None,
     ) -> dict:
         """
         Gets all possible inputs of a seed and returns them, along with
@@ -1051,6 +1091,15 @@ class AsyncIota(AsyncStrictIota):
             If not set, defaults to
             :py:attr:`AddressGenerator.DEFAULT_SECURITY_LEVEL`.
 
+        :param Optional[int] workers:
+            If set, addresses are generated in parallel, using a pool of
+            this many worker processes.
+
+        :param Optional[BaseAddressCache] cache:
+            Cache to check before deriving each address, and to store
+            newly derived digests and addresses in.  See
+            :py:class:`AddressGenerator` for more info.
+
         :return:
             ``dict`` with the following structure::
 
@@ -1088,7 +1137,9 @@ class AsyncIota(AsyncStrictIota):
                 start=start,
                 stop=stop,
                 threshold=threshold,
-                securityLevel=security_level
+                securityLevel=security_level,
+                workers=workers,
+                cache=cache,
         )
 
     async def get_new_addresses(
@@ -1097,6 +1148,8 @@ class AsyncIota(AsyncStrictIota):
             count: int = 1,
             security_level: int = AddressGenerator.DEFAULT_SECURITY_LEVEL,
             checksum: bool = False,
+            workers: Optional[int] = None,
+            cache: Optional[BaseAddressCache] = None,
     ):
         """
         Generates one or more new addresses from the seed.
@@ -1138,6 +1191,15 @@ class AsyncIota(AsyncStrictIota):
             Specify whether to return the address with the checksum.
             Defaults to ``False``.
 
+        :param Optional[int] workers:
+            If set, addresses are generated in parallel, using a pool of
+            this many worker processes.
+
+        :param Optional[BaseAddressCache] cache:
+            Cache to check before deriving each address, and to store
+            newly derived digests and addresses in.  See
+            :py:class:`AddressGenerator` for more info.
+
         :return:
             ``dict`` with the following structure::
 
@@ -1157,11 +1219,14 @@ class AsyncIota(AsyncStrictIota):
                 securityLevel=security_level,
                 checksum=checksum,
                 seed=self.seed,
+                workers=workers,
+                cache=cache,
         )
 
     async def get_transaction_objects(
             self,
             hashes: [Iterable[TransactionHash]],
+            verify_hashes: float = 0,
     ) -> dict:
         """
         Fetches transaction objects from the Tangle given their
@@ -1176,6 +1241,12 @@ class AsyncIota(AsyncStrictIota):
         :param Iterable[TransactionHash] hashes:
           List of transaction IDs (transaction hashes).
 
+        :param float verify_hashes:
+            Fraction (between 0 and 1) of the transaction hashes to check
+            against the trytes that the node returns, chosen at random.
+
+            By default, the hashes are trusted without checking.
+
         :return:
             ``dict`` with the following structure::
 
@@ -1186,13 +1257,17 @@ class AsyncIota(AsyncStrictIota):
         """
         return await extended.GetTransactionObjectsCommand(self.adapter)(
                 hashes=hashes,
+                verifyHashes=verify_hashes,
         )
 
     async def get_transfers(
             self,
             start: int = 0,
             stop: Optional[int] = None,
-            inclusion_states: bool = False
+            inclusion_states: bool = False,
+            verify_hashes: float = 0,
+            workers: Optional[int] = None,
+            cache: Optional[BaseAddressCache] = None,
     ) -> dict:
         """
         Returns all transfers associated with the seed.
@@ -1229,6 +1304,21 @@ class AsyncIota(AsyncStrictIota):
             This requires an additional API call to the node, so it is
             disabled by default.
 
+        :param float verify_hashes:
+            Fraction (between 0 and 1) of the transaction hashes to check
+            against the trytes that the node returns, chosen at random.
+
+            By default, the hashes are trusted without checking.
+
+        :param Optional[int] workers:
+            If set, addresses are generated in parallel, using a pool of
+            this many worker processes.
+
+        :param Optional[BaseAddressCache] cache:
+            Cache to check before deriving each address, and to store
+            newly derived digests and addresses in.  See
+            :py:class:`AddressGenerator` for more info.
+
         :return:
             ``dict`` with the following structure::
 
@@ -1250,6 +1340,9 @@ class AsyncIota(AsyncStrictIota):
                 start=start,
                 stop=stop,
                 inclusionStates=inclusion_states,
+                verifyHashes=verify_hashes,
+                workers=workers,
+                cache=cache,
         )
 
     async def is_promotable(
@@ -1581,7 +1674,11 @@ class AsyncIota(AsyncStrictIota):
                 addresses=addresses
         )
 
-    async def traverse_bundle(self, tail_hash: TransactionHash) -> dict:
+    async def traverse_bundle(
+            self,
+            tail_hash: TransactionHash,
+            verify_hashes: float = 0,
+    ) -> dict:
         """
         Fetches and traverses a bundle from the Tangle given a tail transaction
         hash.
@@ -1594,6 +1691,12 @@ class AsyncIota(AsyncStrictIota):
         :param TransactionHash tail_hash:
             Tail transaction hash of the bundle.
 
+        :param float verify_hashes:
+            Fraction (between 0 and 1) of the transaction hashes to check
+            against the trytes that the node returns, chosen at random.
+
+            By default, the hashes are trusted without checking.
+
         :return:
             ``dict`` with the following structure::
 
@@ -1605,5 +1708,6 @@ class AsyncIota(AsyncStrictIota):
 
         """
         return await extended.TraverseBundleCommand(self.adapter)(
-                transaction=tail_hash
+                transaction=tail_hash,
+                verifyHashes=verify_hashes,
         )
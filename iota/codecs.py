@@ -1,11 +1,14 @@
-from codecs import Codec, CodecInfo, register as lookup_function
-from typing import Union, Tuple
+from codecs import BufferedIncrementalDecoder, Codec, CodecInfo, \
+    IncrementalEncoder, register as lookup_function
+from typing import Optional, Union, Tuple
 from warnings import warn
 
 from iota.exceptions import with_context
 
 __all__ = [
     'AsciiTrytesCodec',
+    'AsciiTrytesIncrementalDecoder',
+    'AsciiTrytesIncrementalEncoder',
     'TrytesDecodeError',
 ]
 
@@ -62,6 +65,8 @@ class AsciiTrytesCodec(Codec):
         codec_info = {
             'encode': codec.encode,
             'decode': codec.decode,
+            'incrementalencoder': AsciiTrytesIncrementalEncoder,
+            'incrementaldecoder': AsciiTrytesIncrementalDecoder,
             
             # In Python 2, all codecs are made equal.
             # In Python 3, some codecs are more equal than others.
@@ -91,18 +96,11 @@ class AsciiTrytesCodec(Codec):
                 },
             )
 
-        # :bc: In Python 2, iterating over a byte string yields
-        # characters instead of integers.
-        if not isinstance(input, bytearray):
-            input = bytearray(input)
-
-        trytes = bytearray()
-
-        for c in input:
-            second, first = divmod(c, len(self.alphabet))
-
-            trytes.append(self.alphabet[first])
-            trytes.append(self.alphabet[second])
+        # Each byte is encoded as two trytes: ``c % 27`` followed by
+        # ``c // 27``.  Look up both halves in C, then interleave them.
+        trytes = bytearray(2 * len(input))
+        trytes[0::2] = input.translate(_FIRST_TRYTES)
+        trytes[1::2] = input.translate(_SECOND_TRYTES)
 
         return bytes(trytes), len(input)
 
@@ -127,6 +125,14 @@ class AsciiTrytesCodec(Codec):
                 },
             )
 
+        if not len(input) % 2:
+            decoded = self._decode_valid(input)
+
+            if decoded is not None:
+                return decoded, len(input)
+
+        # The input is not a valid tryte sequence; take the slow path,
+        # which knows how to deal with errors.
         # :bc: In Python 2, iterating over a byte string yields
         # characters instead of integers.
         if not isinstance(input, bytearray):
@@ -187,6 +193,100 @@ class AsciiTrytesCodec(Codec):
 
         return bytes(bytes_), len(input)
 
+    def _decode_valid(self, input: Union[bytes, bytearray]) -> Optional[bytes]:
+        """
+        Decodes an even-length tryte string, or returns ``None`` if it
+        contains anything that can't be decoded.
+        """
+        length = len(input) // 2
+
+        # Treat the first and second tryte of each pair as the digits of
+        # two (base 256) integers, so that we can combine every pair at
+        # once.  As long as every pair decodes to a value < 256, none of
+        # the digits carry.
+        first = int.from_bytes(input[0::2].translate(_TRYTE_VALUES), 'little')
+        second = int.from_bytes(input[1::2].translate(_TRYTE_VALUES), 'little')
+
+        try:
+            decoded = (first + second * len(self.index)).to_bytes(
+                length,
+                'little',
+            )
+        except OverflowError:
+            return None
+
+        # Invalid characters or pairs, or a carry, would all change the
+        # result; re-encoding it is a cheap way to make sure that it is
+        # correct.
+        if self.encode(decoded)[0] != input:
+            return None
+
+        return decoded
+
+
+class AsciiTrytesIncrementalEncoder(IncrementalEncoder):
+    """
+    Encodes a byte string into trytes, one piece at a time.
+
+    Use :py:func:`codecs.getincrementalencoder` to get this class::
+
+        encoder = codecs.getincrementalencoder(AsciiTrytesCodec.name)()
+    """
+
+    def encode(self, input: bytes, final: bool = False) -> bytes:
+        # Each byte is encoded independently, so there is nothing to
+        # carry over between calls.
+        return AsciiTrytesCodec().encode(input, self.errors)[0]
+
+
+class AsciiTrytesIncrementalDecoder(BufferedIncrementalDecoder):
+    """
+    Decodes a tryte string into bytes, one piece at a time.
+
+    Use :py:func:`codecs.getincrementaldecoder` to get this class::
+
+        decoder = codecs.getincrementaldecoder(AsciiTrytesCodec.name)()
+
+    If a piece has an odd number of trytes, the last one is held back
+    until the next call (or until ``final=True``).
+    """
+
+    def _buffer_decode(
+            self,
+            input: bytes,
+            errors: str,
+            final: bool,
+    ) -> Tuple[bytes, int]:
+        if not final:
+            input = input[:len(input) - (len(input) % 2)]
+
+        return AsciiTrytesCodec().decode(input, errors)
+
+
+_FIRST_TRYTES = bytes(
+    AsciiTrytesCodec.alphabet[c % len(AsciiTrytesCodec.alphabet)]
+    for c in range(256)
+)
+"""
+Translation table for the first tryte of each encoded byte.
+"""
+
+_SECOND_TRYTES = bytes(
+    AsciiTrytesCodec.alphabet[c // len(AsciiTrytesCodec.alphabet)]
+    for c in range(256)
+)
+"""
+Translation table for the second tryte of each encoded byte.
+"""
+
+_TRYTE_VALUES = bytes(AsciiTrytesCodec.index.get(c, 0) for c in range(256))
+"""
+Translation table from tryte characters to their values.
+
+Invalid characters map to 0; :py:meth:`AsciiTrytesCodec._decode_valid`
+catches them when it re-encodes the result.
+"""
+
 
 @lookup_function
 def check_trytes_codec(encoding):
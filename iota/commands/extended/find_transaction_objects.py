@@ -1,7 +1,11 @@
 from typing import Iterable, List, Optional
 
+import filters as f
+
 from iota import Address, BundleHash, Tag, Transaction, TransactionHash
+from iota.commands import RequestFilter
 from iota.commands.core import GetTrytesCommand, FindTransactionsCommand
+from iota.filters import AddressNoChecksum, StringifiedTrytesArray
 
 __all__ = [
     'FindTransactionObjectsCommand',
@@ -16,6 +20,9 @@ class FindTransactionObjectsCommand(FindTransactionsCommand):
     """
     command = 'findTransactionObjects'
 
+    def get_request_filter(self):
+        return FindTransactionObjectsRequestFilter()
+
     def get_response_filter(self):
         pass
 
@@ -28,6 +35,7 @@ class FindTransactionObjectsCommand(FindTransactionsCommand):
             .get('tags')
         approvees: Optional[Iterable[TransactionHash]] = request\
             .get('approvees')
+        verify_hashes: float = request['verifyHashes']
 
         ft_response = await FindTransactionsCommand(adapter=self.adapter)(
             bundles=bundles,
@@ -41,11 +49,44 @@ class FindTransactionObjectsCommand(FindTransactionsCommand):
         if hashes:
             gt_response = await GetTrytesCommand(adapter=self.adapter)(hashes=hashes)
 
-            transactions: List[Transaction] = list(map(
-                Transaction.from_tryte_string,
-                gt_response.get('trytes') or [],
-            ))
+            trytes = gt_response.get('trytes')
+            if trytes:
+                # We already know the hashes, so there's no need to
+                # compute them.
+                transactions: List[Transaction] = \
+                    Transaction.from_tryte_strings(
+                        trytes,
+                        hashes=hashes,
+                        verify_hashes=verify_hashes,
+                    )
 
         return {
             'transactions': transactions,
         }
+
+
+class FindTransactionObjectsRequestFilter(RequestFilter):
+    def __init__(self) -> None:
+        super(FindTransactionObjectsRequestFilter, self).__init__(
+            {
+                # Search terms; at least one of them is required, but
+                # that is checked by :py:class:`FindTransactionsCommand`.
+                'addresses':
+                    f.Array | f.FilterRepeater(
+                        f.Required |
+                        AddressNoChecksum() |
+                        f.Unicode(encoding='ascii', normalize=False),
+                    ),
+
+                'approvees': StringifiedTrytesArray(TransactionHash),
+                'bundles': StringifiedTrytesArray(BundleHash),
+                'tags': StringifiedTrytesArray(Tag),
+
+                # Optional parameters.
+                'verifyHashes':
+                    f.Type((int, float)) |
+                    f.Min(0) | f.Max(1) | f.Optional(0),
+            },
+
+            allow_missing_keys=True,
+        )
@@ -10,6 +10,7 @@ from iota.commands.core.get_balances import GetBalancesCommand
 from iota.commands.extended.utils import get_bundles_from_transaction_hashes, \
     iter_used_addresses
 from iota.crypto.addresses import AddressGenerator
+from iota.crypto.cache import BaseAddressCache
 from iota.crypto.types import Seed
 from iota.filters import Trytes, SecurityLevel
 
@@ -38,19 +39,34 @@ class GetAccountDataCommand(FilterCommand):
         start: int = request['start']
         stop: Optional[int] = request['stop']
         security_level: Optional[int] = request['security_level']
+        verify_hashes: float = request['verifyHashes']
+        workers: Optional[int] = request['workers']
+        cache: Optional[BaseAddressCache] = request['cache']
 
         if stop is None:
             my_addresses: List[Address] = []
             my_hashes: List[TransactionHash] = []
 
-            async for addy, hashes in iter_used_addresses(self.adapter, seed, start, security_level):
+            async for addy, hashes in iter_used_addresses(
+                    self.adapter,
+                    seed,
+                    start,
+                    security_level,
+                    workers=workers,
+                    cache=cache,
+            ):
                 my_addresses.append(addy)
                 my_hashes.extend(hashes)
         else:
             ft_command = FindTransactionsCommand(self.adapter)
 
             my_addresses = (
-                AddressGenerator(seed, security_level).get_addresses(start, stop - start)
+                AddressGenerator(
+                    seed,
+                    security_level,
+                    workers=workers,
+                    cache=cache,
+                ).get_addresses(start, stop - start)
             )
             my_hashes = (await ft_command(addresses=my_addresses)).get('hashes') or []
 
@@ -76,6 +92,7 @@ class GetAccountDataCommand(FilterCommand):
                     adapter=self.adapter,
                     transaction_hashes=my_hashes,
                     inclusion_states=inclusion_states,
+                    verify_hashes=verify_hashes,
                 ),
         }
 
@@ -101,14 +118,22 @@ class GetAccountDataRequestFilter(RequestFilter):
                 'stop': f.Type(int) | f.Min(0),
                 'start': f.Type(int) | f.Min(0) | f.Optional(0),
                 'inclusionStates': f.Type(bool) | f.Optional(False),
-                'security_level': SecurityLevel
+                'security_level': SecurityLevel,
+                'verifyHashes':
+                    f.Type((int, float)) |
+                    f.Min(0) | f.Max(1) | f.Optional(0),
+                'workers': f.Type(int) | f.Min(1),
+                'cache': f.Type(BaseAddressCache),
             },
 
             allow_missing_keys={
                 'stop',
                 'start',
                 'inclusionStates',
-                'security_level'
+                'security_level',
+                'verifyHashes',
+                'workers',
+                'cache',
             },
         )
 
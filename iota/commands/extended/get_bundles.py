@@ -6,7 +6,7 @@ from iota import BadApiResponse, TransactionHash
 from iota.commands import FilterCommand, RequestFilter
 from iota.commands.extended.traverse_bundle import TraverseBundleCommand
 from iota.exceptions import with_context
-from iota.transaction.validator import BundleValidator
+from iota.transaction.validator import validate_bundles
 from iota.filters import Trytes
 import asyncio
 
@@ -31,15 +31,23 @@ class GetBundlesCommand(FilterCommand):
 
     async def _execute(self, request: dict) -> dict:
         transaction_hashes: Iterable[TransactionHash] = request['transactions']
+        verify_hashes: float = request['verifyHashes']
 
-        async def fetch_and_validate(tx_hash):
-            bundle = (await TraverseBundleCommand(self.adapter)(
-                transaction=tx_hash
+        async def fetch(tx_hash):
+            return (await TraverseBundleCommand(self.adapter)(
+                transaction=tx_hash,
+                verifyHashes=verify_hashes,
             ))['bundles'][0]  # Currently 1 bundle only
 
-            validator = BundleValidator(bundle)
+        # Fetch bundles asynchronously
+        bundles = await asyncio.gather(
+            *[fetch(tx_hash) for tx_hash in transaction_hashes]
+        )
 
-            if not validator.is_valid():
+        # Validate bundles in an executor, so that signature validation
+        # doesn't block the event loop.
+        for bundle, errors in zip(bundles, await validate_bundles(bundles)):
+            if errors:
                 raise with_context(
                     exc=BadApiResponse(
                         'Bundle failed validation (``exc.context`` has more info).',
@@ -47,17 +55,10 @@ class GetBundlesCommand(FilterCommand):
 
                     context={
                         'bundle': bundle,
-                        'errors': validator.errors,
+                        'errors': errors,
                     },
                 )
 
-            return bundle
-
-        # Fetch bundles asynchronously
-        bundles = await asyncio.gather(
-            *[fetch_and_validate(tx_hash) for tx_hash in transaction_hashes]
-        )
-
         return {
             'bundles': bundles,
         }
@@ -65,9 +66,21 @@ class GetBundlesCommand(FilterCommand):
 
 class GetBundlesRequestFilter(RequestFilter):
     def __init__(self) -> None:
-        super(GetBundlesRequestFilter, self).__init__({
-            'transactions':
-                f.Required | f.Array | f.FilterRepeater(
-                    f.Required | Trytes(TransactionHash)
-                )
-        })
+        super(GetBundlesRequestFilter, self).__init__(
+            {
+                # Required parameters.
+                'transactions':
+                    f.Required | f.Array | f.FilterRepeater(
+                        f.Required | Trytes(TransactionHash)
+                    ),
+
+                # Optional parameters.
+                'verifyHashes':
+                    f.Type((int, float)) |
+                    f.Min(0) | f.Max(1) | f.Optional(0),
+            },
+
+            allow_missing_keys={
+                'verifyHashes',
+            },
+        )
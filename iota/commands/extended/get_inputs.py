@@ -7,6 +7,7 @@ from iota.commands import FilterCommand, RequestFilter
 from iota.commands.core.get_balances import GetBalancesCommand
 from iota.commands.extended.utils import iter_used_addresses
 from iota.crypto.addresses import AddressGenerator
+from iota.crypto.cache import BaseAddressCache
 from iota.crypto.types import Seed
 from iota.exceptions import with_context
 from iota.filters import SecurityLevel, Trytes
@@ -36,6 +37,8 @@ class GetInputsCommand(FilterCommand):
         start: int = request['start']
         threshold: Optional[int] = request['threshold']
         security_level: int = request['securityLevel']
+        workers: Optional[int] = request['workers']
+        cache: Optional[BaseAddressCache] = request['cache']
 
         # Determine the addresses we will be scanning.
         if stop is None:
@@ -43,11 +46,18 @@ class GetInputsCommand(FilterCommand):
                 adapter=self.adapter,
                 seed=seed,
                 start=start,
-                security_level=security_level
+                security_level=security_level,
+                workers=workers,
+                cache=cache,
             )]
         else:
             addresses = (
-                AddressGenerator(seed, security_level).get_addresses(
+                AddressGenerator(
+                    seed,
+                    security_level,
+                    workers=workers,
+                    cache=cache,
+                ).get_addresses(
                     start=start,
                     count=stop - start,
                 )
@@ -124,6 +134,8 @@ class GetInputsRequestFilter(RequestFilter):
                 'threshold': f.Type(int) | f.Min(0),
 
                 'securityLevel': SecurityLevel,
+                'workers': f.Type(int) | f.Min(1),
+                'cache': f.Type(BaseAddressCache),
 
                 # These arguments are required.
                 'seed': f.Required | Trytes(Seed),
@@ -134,6 +146,8 @@ class GetInputsRequestFilter(RequestFilter):
                 'start',
                 'threshold',
                 'securityLevel',
+                'workers',
+                'cache',
             }
         )
 
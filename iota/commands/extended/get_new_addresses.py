@@ -1,3 +1,4 @@
+from concurrent.futures import ProcessPoolExecutor
 from typing import List, Optional
 
 import filters as f
@@ -8,6 +9,7 @@ from iota.commands.core.find_transactions import FindTransactionsCommand
 from iota.commands.core.were_addresses_spent_from import \
     WereAddressesSpentFromCommand
 from iota.crypto.addresses import AddressGenerator
+from iota.crypto.cache import BaseAddressCache
 from iota.crypto.types import Seed
 from iota.filters import SecurityLevel, Trytes
 import asyncio
@@ -32,11 +34,13 @@ class GetNewAddressesCommand(FilterCommand):
         pass
 
     async def _execute(self, request: dict) -> dict:
+        cache: Optional[BaseAddressCache] = request['cache']
         checksum: bool = request['checksum']
         count: Optional[int] = request['count']
         index: int = request['index']
         security_level: int = request['securityLevel']
         seed: Seed = request['seed']
+        workers: Optional[int] = request['workers']
 
         return {
             'addresses':
@@ -46,6 +50,8 @@ class GetNewAddressesCommand(FilterCommand):
                     count,
                     security_level,
                     checksum,
+                    workers,
+                    cache,
                 ),
         }
 
@@ -55,16 +61,41 @@ class GetNewAddressesCommand(FilterCommand):
             index: int,
             count: Optional[int],
             security_level: int,
-            checksum: bool
+            checksum: bool,
+            workers: Optional[int],
+            cache: Optional[BaseAddressCache],
     ) -> List[Address]:
         """
         Find addresses matching the command parameters.
         """
-        generator = AddressGenerator(seed, security_level, checksum)
+        generator = AddressGenerator(
+            seed,
+            security_level,
+            checksum,
+            workers=workers,
+            cache=cache,
+        )
 
         if count is None:
-            # Connect to Tangle and find the first unused address.
-            for addy in generator.create_iterator(start=index):
+            return [await self._find_unused_address(generator, index)]
+
+        return generator.get_addresses(start=index, count=count)
+
+    async def _find_unused_address(
+            self,
+            generator: AddressGenerator,
+            index: int,
+    ) -> Address:
+        """
+        Connect to Tangle and find the first unused address, starting at
+        ``index``.
+        """
+        workers = generator.workers
+        executor = ProcessPoolExecutor(workers) if workers else None
+        addresses = generator.create_async_iterator(index, executor=executor)
+
+        try:
+            async for addy in addresses:
                 # We use addy.address here because the commands do
                 # not work on an address with a checksum
                 # Execute two checks concurrently
@@ -81,9 +112,14 @@ class GetNewAddressesCommand(FilterCommand):
                 if responses[0]['states'][0] or responses[1].get('hashes'):
                     continue
 
-                return [addy]
+                return addy
+        finally:
+            # Cancel any addresses that were scheduled ahead of time.
+            await addresses.aclose()
 
-        return generator.get_addresses(start=index, count=count)
+            # Don't block the event loop while the worker processes exit.
+            if executor:
+                executor.shutdown(wait=False)
 
 
 class GetNewAddressesRequestFilter(RequestFilter):
@@ -91,18 +127,22 @@ class GetNewAddressesRequestFilter(RequestFilter):
         super(GetNewAddressesRequestFilter, self).__init__(
             {
                 # Everything except ``seed`` is optional.
+                'cache': f.Type(BaseAddressCache),
                 'checksum': f.Type(bool) | f.Optional(default=False),
                 'count': f.Type(int) | f.Min(1),
                 'index': f.Type(int) | f.Min(0) | f.Optional(default=0),
                 'securityLevel': SecurityLevel,
+                'workers': f.Type(int) | f.Min(1),
 
                 'seed': f.Required | Trytes(Seed),
             },
 
             allow_missing_keys={
+                'cache',
                 'checksum',
                 'count',
                 'index',
                 'securityLevel',
+                'workers',
             },
         )
@@ -29,15 +29,22 @@ class GetTransactionObjectsCommand(FilterCommand):
     async def _execute(self, request: dict) -> dict:
         hashes: Iterable[TransactionHash] = request\
             .get('hashes')
+        verify_hashes: float = request['verifyHashes']
 
         transactions = []
         if hashes:
             gt_response = await GetTrytesCommand(adapter=self.adapter)(hashes=hashes)
 
-            transactions: List[Transaction] = list(map(
-                Transaction.from_tryte_string,
-                gt_response.get('trytes') or [],
-            ))
+            trytes = gt_response.get('trytes')
+            if trytes:
+                # We already know the hashes, so there's no need to
+                # compute them.
+                transactions: List[Transaction] = \
+                    Transaction.from_tryte_strings(
+                        trytes,
+                        hashes=hashes,
+                        verify_hashes=verify_hashes,
+                    )
 
         return {
             'transactions': transactions,
@@ -46,7 +53,19 @@ class GetTransactionObjectsCommand(FilterCommand):
 
 class GetTransactionObjectsRequestFilter(RequestFilter):
     def __init__(self) -> None:
-        super(GetTransactionObjectsRequestFilter, self).__init__({
-            'hashes':
-                StringifiedTrytesArray(TransactionHash) | f.Required
-        })
+        super(GetTransactionObjectsRequestFilter, self).__init__(
+            {
+                # Required parameters.
+                'hashes':
+                    StringifiedTrytesArray(TransactionHash) | f.Required,
+
+                # Optional parameters.
+                'verifyHashes':
+                    f.Type((int, float)) |
+                    f.Min(0) | f.Max(1) | f.Optional(0),
+            },
+
+            allow_missing_keys={
+                'verifyHashes',
+            },
+        )
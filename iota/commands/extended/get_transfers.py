@@ -8,6 +8,7 @@ from iota.commands.core.find_transactions import FindTransactionsCommand
 from iota.commands.extended.utils import get_bundles_from_transaction_hashes, \
     iter_used_addresses
 from iota.crypto.addresses import AddressGenerator
+from iota.crypto.cache import BaseAddressCache
 from iota.crypto.types import Seed
 from iota.filters import Trytes
 
@@ -35,6 +36,9 @@ class GetTransfersCommand(FilterCommand):
         seed: Seed = request['seed']
         start: int = request['start']
         stop: Optional[int] = request['stop']
+        verify_hashes: float = request['verifyHashes']
+        workers: Optional[int] = request['workers']
+        cache: Optional[BaseAddressCache] = request['cache']
 
         # Determine the addresses we will be scanning, and pull their
         # transaction hashes.
@@ -42,14 +46,24 @@ class GetTransfersCommand(FilterCommand):
             my_hashes = list(chain(*(
                 [
                     hashes async for _, hashes in
-                    iter_used_addresses(self.adapter, seed, start)
+                    iter_used_addresses(
+                        self.adapter,
+                        seed,
+                        start,
+                        workers=workers,
+                        cache=cache,
+                    )
                 ]
             )))
         else:
             ft_response = \
                 await FindTransactionsCommand(self.adapter)(
                     addresses=
-                    AddressGenerator(seed).get_addresses(start, stop - start),
+                    AddressGenerator(
+                        seed,
+                        workers=workers,
+                        cache=cache,
+                    ).get_addresses(start, stop - start),
                 )
 
             my_hashes = ft_response['hashes']
@@ -60,6 +74,7 @@ class GetTransfersCommand(FilterCommand):
                     adapter=self.adapter,
                     transaction_hashes=my_hashes,
                     inclusion_states=inclusion_states,
+                    verify_hashes=verify_hashes,
                 ),
         }
 
@@ -86,12 +101,22 @@ class GetTransfersRequestFilter(RequestFilter):
                 'start': f.Type(int) | f.Min(0) | f.Optional(0),
 
                 'inclusionStates': f.Type(bool) | f.Optional(False),
+
+                'verifyHashes':
+                    f.Type((int, float)) |
+                    f.Min(0) | f.Max(1) | f.Optional(0),
+
+                'workers': f.Type(int) | f.Min(1),
+                'cache': f.Type(BaseAddressCache),
             },
 
             allow_missing_keys={
                 'stop',
                 'inclusionStates',
                 'start',
+                'verifyHashes',
+                'workers',
+                'cache',
             },
         )
 
@@ -69,10 +69,12 @@ class IsPromotableCommand(FilterCommand):
                 'info': cc_response['info'],
             }
       
-        transactions = [
-            Transaction.from_tryte_string(x) for x in
-            (await GetTrytesCommand(self.adapter)(hashes=tails))['trytes']
-        ]
+        # We already know the hashes, so there's no need to compute
+        # them.
+        transactions = Transaction.from_tryte_strings(
+            (await GetTrytesCommand(self.adapter)(hashes=tails))['trytes'],
+            hashes=tails,
+        )
 
         response = {
             'promotable': True,
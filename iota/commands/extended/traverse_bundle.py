@@ -30,8 +30,11 @@ class TraverseBundleCommand(FilterCommand):
 
     async def _execute(self, request: dict) -> dict:
         txn_hash: TransactionHash = request['transaction']
+        verify_hashes: float = request['verifyHashes']
 
-        bundle = Bundle(await self._traverse_bundle(txn_hash, None))
+        bundle = Bundle(
+            await self._traverse_bundle(txn_hash, None, verify_hashes),
+        )
 
         # No bundle validation
 
@@ -42,7 +45,8 @@ class TraverseBundleCommand(FilterCommand):
     async def _traverse_bundle(
             self,
             txn_hash: TransactionHash,
-            target_bundle_hash: Optional[TransactionHash]
+            target_bundle_hash: Optional[TransactionHash],
+            verify_hashes: float,
     ) -> List[Transaction]:
         """
         Recursively traverse the Tangle, collecting transactions until
@@ -71,7 +75,11 @@ class TraverseBundleCommand(FilterCommand):
                 },
             )
 
-        transaction = Transaction.from_tryte_string(trytes[0])
+        transaction = Transaction.from_tryte_strings(
+            trytes[:1],
+            hashes=[txn_hash],
+            verify_hashes=verify_hashes,
+        )[0]
 
         if (not target_bundle_hash) and transaction.current_index:
             raise with_context(
@@ -101,12 +109,25 @@ class TraverseBundleCommand(FilterCommand):
         # transaction in the bundle.
         return [transaction] + await self._traverse_bundle(
             transaction.trunk_transaction_hash,
-            target_bundle_hash
+            target_bundle_hash,
+            verify_hashes,
         )
 
 
 class TraverseBundleRequestFilter(RequestFilter):
     def __init__(self) -> None:
-        super(TraverseBundleRequestFilter, self).__init__({
-            'transaction': f.Required | Trytes(TransactionHash),
-        })
+        super(TraverseBundleRequestFilter, self).__init__(
+            {
+                # Required parameters.
+                'transaction': f.Required | Trytes(TransactionHash),
+
+                # Optional parameters.
+                'verifyHashes':
+                    f.Type((int, float)) |
+                    f.Min(0) | f.Max(1) | f.Optional(0),
+            },
+
+            allow_missing_keys={
+                'verifyHashes',
+            },
+        )
@@ -1,3 +1,4 @@
+from concurrent.futures import ProcessPoolExecutor
 from typing import Iterable, List, Optional, Tuple
 
 from iota import Address, Bundle, Transaction, \
@@ -13,6 +14,7 @@ from iota.commands.extended.get_bundles import GetBundlesCommand
 from iota.commands.core.get_inclusion_states import \
     GetInclusionStatesCommand
 from iota.crypto.addresses import AddressGenerator
+from iota.crypto.cache import BaseAddressCache
 from iota.crypto.types import Seed
 
 
@@ -21,6 +23,8 @@ async def iter_used_addresses(
         seed: Seed,
         start: int,
         security_level: Optional[int] = None,
+        workers: Optional[int] = None,
+        cache: Optional[BaseAddressCache] = None,
         # 'typing' only supports AsyncGenerator from python 3.6.1, so put it
         # as string literal here.
 ) -> 'AsyncGenerator[Tuple[Address, List[TransactionHash]], None]':
@@ -34,6 +38,14 @@ async def iter_used_addresses(
     .. important::
         This is an async generator!
 
+    :param workers:
+        If set, addresses are generated using a pool of this many worker
+        processes.  See :py:class:`AddressGenerator` for more info.
+
+    :param cache:
+        Cache to check before deriving each address, and to store newly
+        derived digests and addresses in.  See
+        :py:class:`AddressGenerator` for more info.
     """
     if security_level is None:
         security_level = AddressGenerator.DEFAULT_SECURITY_LEVEL
@@ -41,31 +53,55 @@ async def iter_used_addresses(
     ft_command = FindTransactionsCommand(adapter)
     wasf_command = WereAddressesSpentFromCommand(adapter)
 
-    for addy in AddressGenerator(seed, security_level).create_iterator(start):
-        ft_response = await ft_command(addresses=[addy])
+    generator = AddressGenerator(
+        seed,
+        security_level,
+        workers=workers,
+        cache=cache,
+    )
 
-        if ft_response['hashes']:
-            yield addy, ft_response['hashes']
-        else:
-            wasf_response = await wasf_command(addresses=[addy])
-            if wasf_response['states'][0]:
-                yield addy, []
+    executor = ProcessPoolExecutor(workers) if workers else None
+    addresses = generator.create_async_iterator(start, executor=executor)
+
+    try:
+        async for addy in addresses:
+            ft_response = await ft_command(addresses=[addy])
+
+            if ft_response['hashes']:
+                yield addy, ft_response['hashes']
             else:
-                break
+                wasf_response = await wasf_command(addresses=[addy])
+                if wasf_response['states'][0]:
+                    yield addy, []
+                else:
+                    break
 
-        # Reset the commands so that we can call them again.
-        ft_command.reset()
-        wasf_command.reset()
+            # Reset the commands so that we can call them again.
+            ft_command.reset()
+            wasf_command.reset()
+    finally:
+        # Cancel any addresses that were scheduled ahead of time, so
+        # that we only have to wait for the ones that are in progress.
+        await addresses.aclose()
+
+        # Don't block the event loop while the worker processes exit.
+        if executor:
+            executor.shutdown(wait=False)
 
 
 async def get_bundles_from_transaction_hashes(
         adapter: BaseAdapter,
         transaction_hashes: Iterable[TransactionHash],
         inclusion_states: bool,
+        verify_hashes: float = 0,
 ) -> List[Bundle]:
     """
     Given a set of transaction hashes, returns the corresponding bundles,
     sorted by tail transaction timestamp.
+
+    ``verify_hashes`` is the fraction of transaction hashes to check
+    against the trytes that the node returns; see
+    :py:meth:`Transaction.from_tryte_strings`.
     """
     transaction_hashes = list(transaction_hashes)
     if not transaction_hashes:
@@ -91,10 +127,11 @@ async def get_bundles_from_transaction_hashes(
                         'returned_transaction_trytes': tx_trytes,
                     },
             )
-    all_transactions: List[Transaction] = list(map(
-        Transaction.from_tryte_string,
+    all_transactions: List[Transaction] = Transaction.from_tryte_strings(
         gt_response['trytes'],
-    ))
+        hashes=transaction_hashes,
+        verify_hashes=verify_hashes,
+    )
 
     for txn in all_transactions:
         if txn.is_tail:
@@ -108,6 +145,7 @@ async def get_bundles_from_transaction_hashes(
     if non_tail_bundle_hashes:
         for txn in (await FindTransactionObjectsCommand(adapter=adapter)(
                 bundles=list(non_tail_bundle_hashes),
+                verifyHashes=verify_hashes,
         ))['transactions']:
             if txn.is_tail:
                 if txn.hash not in tail_transaction_hashes:
@@ -132,7 +170,8 @@ async def get_bundles_from_transaction_hashes(
 
     # Find the bundles for each transaction.
     txn_bundles: List[Bundle] = (await GetBundlesCommand(adapter)(
-        transactions=[txn.hash for txn in tail_transactions]
+        transactions=[txn.hash for txn in tail_transactions],
+        verifyHashes=verify_hashes,
     ))['bundles']
 
     if inclusion_states:
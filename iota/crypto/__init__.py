@@ -1,11 +1,15 @@
 # Load curl library.
 # If a compiled c extension is available, we will prefer to load that;
-# otherwise fall back to pure-Python implementation.
+# otherwise fall back to the NumPy implementation if NumPy is
+# installed, and finally to the pure-Python implementation.
 # https://pypi.python.org/pypi/PyOTA-CCurl
 try:
     from ccurl import *
 except ImportError:
-    from .pycurl import *
+    try:
+        from .npcurl import *
+    except ImportError:
+        from .pycurl import *
 
 FRAGMENT_LENGTH = 2187
 """
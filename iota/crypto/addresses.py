@@ -1,6 +1,13 @@
-from typing import Generator, Iterable, List
+from asyncio import wrap_future
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from functools import partial
+from os import cpu_count
+from typing import Callable, Deque, Generator, Iterable, List, Optional, \
+    Union
 
 from iota import Address, TRITS_PER_TRYTE, TrytesCompatible
+from iota.crypto.cache import BaseAddressCache
 from iota.crypto.kerl import Kerl
 from iota.crypto.signing import KeyGenerator, KeyIterator
 from iota.crypto.types import Digest, PrivateKey, Seed
@@ -42,6 +49,20 @@ class AddressGenerator(Iterable[Address]):
     :param bool checksum:
         Whether to generate address with or without checksum.
 
+    :param Optional[int] workers:
+        If set, :py:meth:`get_addresses` generates addresses in parallel,
+        using a pool of this many worker processes.
+
+        To generate addresses in parallel using an iterator, pass an
+        executor to :py:meth:`create_iterator` or
+        :py:meth:`create_async_iterator` instead.
+
+        Addresses are always returned in index order.
+
+    :param Optional[BaseAddressCache] cache:
+        Cache to check before deriving each address, and to store newly
+        derived digests and addresses in.
+
     :returns: :py:class:`iota.crypto.addresses.AddressGenerator` object.
     """
     DEFAULT_SECURITY_LEVEL = 2
@@ -63,12 +84,17 @@ class AddressGenerator(Iterable[Address]):
             seed: TrytesCompatible,
             security_level: int = DEFAULT_SECURITY_LEVEL,
             checksum: bool = False,
+            workers: Optional[int] = None,
+            cache: Optional[BaseAddressCache] = None,
     ) -> None:
         super(AddressGenerator, self).__init__()
 
         self.security_level = security_level
         self.checksum = checksum
         self.seed = Seed(seed)
+        self.workers = workers
+
+        self.cache = cache
 
     def __iter__(self) -> Generator[Address, None, None]:
         """
@@ -143,6 +169,31 @@ class AddressGenerator(Iterable[Address]):
                 },
             )
 
+        if self.workers:
+            if start < 0:
+                raise with_context(
+                    exc=ValueError('``start`` cannot be negative.'),
+
+                    context={
+                        'start': start,
+                        'count': count,
+                        'step': step,
+                    },
+                )
+
+            indexes = [
+                index
+                for index in range(start, start + (count * step), step)
+                if index >= 0
+            ]
+
+            with ProcessPoolExecutor(self.workers) as executor:
+                return self._get_addresses_parallel(
+                    executor,
+                    indexes,
+                    chunksize=max(1, len(indexes) // (self.workers * 4)),
+                )
+
         generator = self.create_iterator(start, step)
 
         addresses = []
@@ -159,7 +210,8 @@ class AddressGenerator(Iterable[Address]):
     def create_iterator(
             self,
             start: int = 0,
-            step: int = 1
+            step: int = 1,
+            executor: Optional[Executor] = None,
     ) -> Generator[Address, None, None]:
         """
         Creates an iterator that can be used to progressively generate new
@@ -183,10 +235,23 @@ class AddressGenerator(Iterable[Address]):
                 The generator may take awhile to advance between
                 iterations if ``step`` is a large number!
 
+        :param Optional[Executor] executor:
+            If provided, addresses are generated in this executor (e.g.,
+            a :py:class:`concurrent.futures.ProcessPoolExecutor`), a few
+            indexes ahead of the ones that have been consumed.
+
+            The executor is not shut down when the iterator is closed;
+            any addresses that were generated ahead of time but not
+            consumed are cancelled (or discarded).
+
         :return:
             ``Generator[Address, None, None]`` object that you can iterate to
             generate addresses.
         """
+        if executor:
+            yield from self._create_parallel_iterator(start, step, executor)
+            return
+
         key_iterator = (
             KeyGenerator(self.seed).create_iterator(
                 start,
@@ -196,7 +261,180 @@ class AddressGenerator(Iterable[Address]):
         )
 
         while True:
-            yield self._generate_address(key_iterator)
+            yield self._get_address(key_iterator)
+
+    async def create_async_iterator(
+            self,
+            start: int = 0,
+            step: int = 1,
+            executor: Optional[Executor] = None,
+            # 'typing' only supports AsyncGenerator from python 3.6.1, so
+            # put it as string literal here.
+    ) -> 'AsyncGenerator[Address, None]':
+        """
+        Same as :py:meth:`create_iterator`, except that it returns an
+        async generator.
+
+        If ``executor`` is provided, the event loop is not blocked while
+        the (CPU-intensive) work is being done.
+
+        .. important::
+            This is an async generator!
+
+        :param int start:
+            Starting index.
+
+        :param int step:
+            Number of indexes to advance after each address.
+
+        :param Optional[Executor] executor:
+            If provided, addresses are generated in this executor.  See
+            :py:meth:`create_iterator` for more info.
+
+        :return:
+            ``AsyncGenerator[Address, None]`` object that you can
+            iterate (using ``async for``) to generate addresses.
+        """
+        if not executor:
+            for addy in self.create_iterator(start, step):
+                yield addy
+
+            return
+
+        self._check_parallel_start(start, step)
+
+        pending: Deque[Future] = deque()
+
+        try:
+            while self._schedule_addresses(pending, start, step, executor):
+                yield self._resolve_address(
+                    await wrap_future(pending.popleft()),
+                )
+
+                start += step
+        finally:
+            for future in pending:
+                future.cancel()
+
+    def _create_parallel_iterator(
+            self,
+            start: int,
+            step: int,
+            executor: Executor,
+    ) -> Generator[Address, None, None]:
+        """
+        Generates addresses in an executor, keeping a bounded number of
+        indexes scheduled ahead of the ones that have been consumed.
+        """
+        self._check_parallel_start(start, step)
+
+        pending: Deque[Future] = deque()
+
+        try:
+            while self._schedule_addresses(pending, start, step, executor):
+                yield self._resolve_address(pending.popleft().result())
+
+                start += step
+        finally:
+            for future in pending:
+                future.cancel()
+
+    @staticmethod
+    def _check_parallel_start(start: int, step: int) -> None:
+        """
+        Worker processes can't deal with negative indexes, so they have
+        to be rejected up front.
+        """
+        if start < 0:
+            raise with_context(
+                exc=ValueError('``start`` cannot be negative.'),
+
+                context={
+                    'start': start,
+                    'step': step,
+                },
+            )
+
+    def _schedule_addresses(
+            self,
+            pending: Deque[Future],
+            start: int,
+            step: int,
+            executor: Executor,
+    ) -> bool:
+        """
+        Tops up ``pending`` so that it holds the futures for the next few
+        addresses, beginning at index ``start``.
+
+        Each future resolves to either a cached :py:class:`Address` or a
+        new :py:class:`Digest`; see :py:meth:`_resolve_address`.
+
+        :return:
+            Whether there are any addresses left to generate.
+        """
+        get_digest = self._get_digest_function()
+        look_ahead = 2 * (self.workers or cpu_count() or 1)
+
+        index = start + (len(pending) * step)
+        while len(pending) < look_ahead and index >= 0:
+            address = self._get_cached_address(index)
+
+            if address is None:
+                future = executor.submit(get_digest, index)
+            else:
+                future = Future()
+                future.set_result(address)
+
+            pending.append(future)
+            index += step
+
+        return bool(pending)
+
+    def _resolve_address(self, result: Union[Address, Digest]) -> Address:
+        """
+        Converts the result of a future scheduled by
+        :py:meth:`_schedule_addresses` into an address.
+        """
+        if isinstance(result, Digest):
+            return self._address_from_new_digest(result)
+
+        return result
+
+    def _get_addresses_parallel(
+            self,
+            executor: ProcessPoolExecutor,
+            indexes: List[int],
+            chunksize: int = 1,
+    ) -> List[Address]:
+        """
+        Generates the addresses at the specified indexes, using worker
+        processes for any that aren't already cached.
+        """
+        addresses = {
+            index: self._get_cached_address(index)
+            for index in indexes
+        }
+
+        misses = [index for index in indexes if addresses[index] is None]
+
+        if misses:
+            digests = executor.map(
+                self._get_digest_function(),
+                misses,
+                chunksize=chunksize,
+            )
+
+            for index, digest in zip(misses, digests):
+                addresses[index] = self._address_from_new_digest(digest)
+
+        return [addresses[index] for index in indexes]
+
+    def _get_digest_function(self) -> Callable[[int], Digest]:
+        """
+        Returns a function that can be sent to a worker process to
+        generate the digest at a given index.
+        """
+        return partial(_get_digest_at, bytes(self.seed), self.security_level)
 
     @staticmethod
     def address_from_digest(digest: Digest) -> Address:
@@ -216,20 +454,58 @@ class AddressGenerator(Iterable[Address]):
             security_level=digest.security_level,
         )
 
+    def _get_address(self, key_iterator: KeyIterator) -> Address:
+        """
+        Returns the next address from the cache, or generates it if it
+        hasn't been cached.
+        """
+        # Let the key iterator deal with negative indexes.
+        if key_iterator.current >= 0:
+            address = self._get_cached_address(key_iterator.current)
+
+            if address is not None:
+                key_iterator.advance()
+                return address
+
+        return self._generate_address(key_iterator)
+
+    def _get_cached_address(self, index: int) -> Optional[Address]:
+        """
+        Returns the address at the specified index, if it has been
+        cached.
+        """
+        if self.cache is None:
+            return None
+
+        address = self.cache.get_address(self.seed, self.security_level, index)
+
+        if address is not None and self.checksum:
+            return address.with_valid_checksum()
+
+        return address
+
     def _generate_address(self, key_iterator: KeyIterator) -> Address:
         """
         Generates a new address.
 
         Used in the event of a cache miss.
         """
+        return self._address_from_new_digest(self._get_digest(key_iterator))
+
+    def _address_from_new_digest(self, digest: Digest) -> Address:
+        """
+        Generates an address from a newly-created digest, and stores both
+        in the cache.
+        """
+        address = self.address_from_digest(digest)
+
+        if self.cache is not None:
+            self.cache.set(self.seed, digest, address)
+
         if self.checksum:
-            return (
-                self.address_from_digest(
-                    digest=self._get_digest(key_iterator),
-                ).with_valid_checksum()
-            )
+            return address.with_valid_checksum()
         else:
-            return self.address_from_digest(self._get_digest(key_iterator))
+            return address
 
     @staticmethod
     def _get_digest(key_iterator: KeyIterator) -> Digest:
@@ -241,3 +517,15 @@ class AddressGenerator(Iterable[Address]):
         """
         private_key: PrivateKey = next(key_iterator)
         return private_key.get_digest()
+
+
+def _get_digest_at(seed: bytes, security_level: int, index: int) -> Digest:
+    """
+    Generates a single digest.
+
+    Defined at the module level so that it can be invoked in a worker
+    process.
+    """
+    return AddressGenerator._get_digest(
+        KeyGenerator(seed).create_iterator(index, 1, security_level),
+    )
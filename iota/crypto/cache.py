@@ -0,0 +1,467 @@
+from abc import ABCMeta, abstractmethod as abstract_method
+from collections import OrderedDict, deque
+from hashlib import sha256
+from sqlite3 import connect
+from threading import Lock
+from time import monotonic
+from typing import Optional, Tuple
+
+from iota import Address
+from iota.crypto.types import Digest, Seed
+from iota.exceptions import with_context
+
+__all__ = [
+    'BaseAddressCache',
+    'DigestCache',
+    'MemoryAddressCache',
+    'SqliteAddressCache',
+]
+
+CacheKey = Tuple[str, int, int]
+"""
+``(seed fingerprint, security level, key index)``.
+"""
+
+CacheValue = Tuple[str, str]
+"""
+``(digest trytes, address trytes)``.
+"""
+
+
+class BaseAddressCache(object, metaclass=ABCMeta):
+    """
+    Stores digests and addresses that have already been generated, so
+    that :py:class:`iota.crypto.addresses.AddressGenerator` doesn't have
+    to derive them again.
+
+    Entries are keyed by a fingerprint of the seed (a one-way hash; the
+    seed itself is never stored), the security level and the key index.
+
+    .. important::
+        Only digests and addresses are ever stored in the cache; private
+        keys are never written to it.
+    """
+
+    def __init__(self) -> None:
+        super(BaseAddressCache, self).__init__()
+
+        self.lock = Lock()
+
+    def get_address(
+            self,
+            seed: Seed,
+            security_level: int,
+            index: int,
+    ) -> Optional[Address]:
+        """
+        Returns the cached address (without checksum) for the specified
+        seed, security level and key index, or ``None`` if it hasn't
+        been cached.
+        """
+        value = self._lookup(seed, security_level, index)
+
+        if value is None:
+            return None
+
+        return Address(
+            value[1],
+            key_index=index,
+            security_level=security_level,
+        )
+
+    def get_digest(
+            self,
+            seed: Seed,
+            security_level: int,
+            index: int,
+    ) -> Optional[Digest]:
+        """
+        Returns the cached digest for the specified seed, security level
+        and key index, or ``None`` if it hasn't been cached.
+        """
+        value = self._lookup(seed, security_level, index)
+
+        if value is None:
+            return None
+
+        return Digest(value[0], key_index=index)
+
+    def set(self, seed: Seed, digest: Digest, address: Address) -> None:
+        """
+        Stores a digest and its corresponding address in the cache.
+
+        The key index and security level are taken from ``digest``.
+        """
+        if not isinstance(digest, Digest):
+            raise with_context(
+                exc=TypeError(
+                    '``digest`` must be a {cls} (got {type}).'.format(
+                        cls=Digest.__name__,
+                        type=type(digest).__name__,
+                    ),
+                ),
+
+                context={
+                    'digest': digest,
+                },
+            )
+
+        if digest.key_index is None:
+            raise with_context(
+                exc=ValueError('``digest`` must have a key index.'),
+
+                context={
+                    'digest': digest,
+                },
+            )
+
+        key = (
+            self.get_seed_fingerprint(seed),
+            digest.security_level,
+            digest.key_index,
+        )
+
+        value = (
+            str(digest),
+            # Always store the address without its checksum; it's easy
+            # enough to add it back on if needed.
+            str(address)[:Address.LEN],
+        )
+
+        with self.lock:
+            self._set(key, value)
+
+    @staticmethod
+    def get_seed_fingerprint(seed: Seed) -> str:
+        """
+        Returns the value used to identify a seed in the cache.
+
+        The fingerprint is a one-way hash, so the seed can't be recovered
+        from the contents of the cache.
+        """
+        return sha256(b'iota.crypto.cache:' + bytes(seed)).hexdigest()
+
+    def _lookup(
+            self,
+            seed: Seed,
+            security_level: int,
+            index: int,
+    ) -> Optional[CacheValue]:
+        key = (self.get_seed_fingerprint(seed), security_level, index)
+
+        with self.lock:
+            return self._get(key)
+
+    @abstract_method
+    def _get(self, key: CacheKey) -> Optional[CacheValue]:
+        """
+        Retrieves a value from the cache.
+
+        Always invoked while holding :py:attr:`lock`.
+        """
+        raise NotImplementedError(
+            'Not implemented in {cls}.'.format(cls=type(self).__name__),
+        )
+
+    @abstract_method
+    def _set(self, key: CacheKey, value: CacheValue) -> None:
+        """
+        Stores a value in the cache.
+
+        Always invoked while holding :py:attr:`lock`.
+        """
+        raise NotImplementedError(
+            'Not implemented in {cls}.'.format(cls=type(self).__name__),
+        )
+
+
+class MemoryAddressCache(BaseAddressCache):
+    """
+    Keeps cached digests and addresses in memory.
+
+    :param int max_size:
+        Maximum number of entries to keep.  Once the cache is full, the
+        least recently used entries are discarded first.
+    """
+    DEFAULT_MAX_SIZE = 10000
+
+    def __init__(self, max_size: int = DEFAULT_MAX_SIZE) -> None:
+        super(MemoryAddressCache, self).__init__()
+
+        if max_size < 1:
+            raise with_context(
+                exc=ValueError('``max_size`` must be positive.'),
+
+                context={
+                    'max_size': max_size,
+                },
+            )
+
+        self.max_size = max_size
+        self._entries: 'OrderedDict[CacheKey, CacheValue]' = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _get(self, key: CacheKey) -> Optional[CacheValue]:
+        try:
+            self._entries.move_to_end(key)
+        except KeyError:
+            return None
+
+        return self._entries[key]
+
+    def _set(self, key: CacheKey, value: CacheValue) -> None:
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+
+class SqliteAddressCache(BaseAddressCache):
+    """
+    Stores cached digests and addresses in a SQLite database, so that
+    they persist across restarts.
+
+    :param str path:
+        Path to the database file.  The file (and the table inside it) is
+        created if it doesn't already exist.
+    """
+
+    def __init__(self, path: str) -> None:
+        super(SqliteAddressCache, self).__init__()
+
+        self.path = path
+
+        # All access goes through :py:attr:`lock`, so it's safe to share
+        # the connection between threads.
+        self._connection = connect(path, check_same_thread=False)
+
+        with self._connection:
+            self._connection.execute(
+                'CREATE TABLE IF NOT EXISTS addresses ('
+                'seed_fingerprint TEXT NOT NULL, '
+                'security_level INTEGER NOT NULL, '
+                'key_index INTEGER NOT NULL, '
+                'digest TEXT NOT NULL, '
+                'address TEXT NOT NULL, '
+                'PRIMARY KEY (seed_fingerprint, security_level, key_index))'
+            )
+
+    def close(self) -> None:
+        """
+        Closes the connection to the database.
+        """
+        with self.lock:
+            self._connection.close()
+
+    def _get(self, key: CacheKey) -> Optional[CacheValue]:
+        row = self._connection.execute(
+            'SELECT digest, address FROM addresses '
+            'WHERE seed_fingerprint = ? AND security_level = ? '
+            'AND key_index = ?',
+            key,
+        ).fetchone()
+
+        return tuple(row) if row else None
+
+    def _set(self, key: CacheKey, value: CacheValue) -> None:
+        with self._connection:
+            self._connection.execute(
+                'INSERT OR REPLACE INTO addresses '
+                '(seed_fingerprint, security_level, key_index, digest, '
+                'address) VALUES (?, ?, ?, ?, ?)',
+                key + value,
+            )
+
+
+class DigestCache(object):
+    """
+    Remembers recently-generated key digests for a limited time, so that
+    :py:class:`iota.crypto.signing.KeyGenerator` doesn't have to derive
+    the same keys over and over (e.g., while co-signers are negotiating
+    a multisig transfer).
+
+    Entries are keyed by a fingerprint of the seed (see
+    :py:meth:`BaseAddressCache.get_seed_fingerprint`), the security level
+    and the key index.  Private keys are never stored.
+
+    When an entry is evicted (because it expired, the cache is full or
+    :py:meth:`clear` was called), its buffer is overwritten with zeroes
+    before it is discarded.
+
+    :param int max_size:
+        Maximum number of digests to keep.  Once the cache is full, the
+        least recently used digests are discarded first.
+
+    :param float ttl:
+        Number of seconds to keep each digest.
+    """
+    DEFAULT_MAX_SIZE = 1000
+    DEFAULT_TTL = 300.0
+
+    def __init__(
+            self,
+            max_size: int = DEFAULT_MAX_SIZE,
+            ttl: float = DEFAULT_TTL,
+    ) -> None:
+        super(DigestCache, self).__init__()
+
+        if max_size < 1:
+            raise with_context(
+                exc=ValueError('``max_size`` must be positive.'),
+
+                context={
+                    'max_size': max_size,
+                    'ttl': ttl,
+                },
+            )
+
+        if ttl <= 0:
+            raise with_context(
+                exc=ValueError('``ttl`` must be positive.'),
+
+                context={
+                    'max_size': max_size,
+                    'ttl': ttl,
+                },
+            )
+
+        self.max_size = max_size
+        self.ttl = ttl
+
+        self.lock = Lock()
+
+        # Values are ``(expiration time, digest trytes)``.
+        # Ordered from least to most recently used.
+        self._entries: 'OrderedDict[CacheKey, Tuple[float, bytearray]]' = (
+            OrderedDict()
+        )
+
+        # ``(expiration time, key)`` for each digest, ordered by
+        # expiration time (every digest has the same TTL).  Items whose
+        # digest has since been evicted or replaced are skipped when
+        # they reach the front.
+        self._expiry: 'deque[Tuple[float, CacheKey]]' = deque()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(
+            self,
+            seed: Seed,
+            security_level: int,
+            index: int,
+    ) -> Optional[Digest]:
+        """
+        Returns the digest for the specified seed, security level and key
+        index, or ``None`` if it is not cached (or it has expired).
+
+        The returned digest is a copy; wiping the cache does not affect
+        it.
+        """
+        key = (
+            BaseAddressCache.get_seed_fingerprint(seed),
+            security_level,
+            index,
+        )
+
+        with self.lock:
+            self._expire()
+
+            try:
+                self._entries.move_to_end(key)
+            except KeyError:
+                return None
+
+            return Digest(bytes(self._entries[key][1]), key_index=index)
+
+    def set(self, seed: Seed, digest: Digest) -> None:
+        """
+        Adds a digest to the cache.
+
+        The key index and security level are taken from ``digest``.
+        """
+        if not isinstance(digest, Digest):
+            raise with_context(
+                exc=TypeError(
+                    '``digest`` must be a {cls} (got {type}).'.format(
+                        cls=Digest.__name__,
+                        type=type(digest).__name__,
+                    ),
+                ),
+
+                context={
+                    'digest': digest,
+                },
+            )
+
+        if digest.key_index is None:
+            raise with_context(
+                exc=ValueError('``digest`` must have a key index.'),
+
+                context={
+                    'digest': digest,
+                },
+            )
+
+        key = (
+            BaseAddressCache.get_seed_fingerprint(seed),
+            digest.security_level,
+            digest.key_index,
+        )
+
+        with self.lock:
+            if key in self._entries:
+                self._evict(key)
+
+            expires = monotonic() + self.ttl
+
+            self._entries[key] = (expires, bytearray(bytes(digest)))
+            self._expiry.append((expires, key))
+
+            self._expire()
+
+            while len(self._entries) > self.max_size:
+                self._evict(next(iter(self._entries)))
+
+    def clear(self) -> None:
+        """
+        Removes (and wipes) every digest in the cache.
+        """
+        with self.lock:
+            while self._entries:
+                self._evict(next(iter(self._entries)))
+
+            self._expiry.clear()
+
+    def _expire(self) -> None:
+        """
+        Removes expired digests.
+        """
+        now = monotonic()
+
+        while self._expiry and self._expiry[0][0] <= now:
+            expires, key = self._expiry.popleft()
+
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == expires:
+                self._evict(key)
+
+        # Drop stale items left behind by digests that were replaced or
+        # evicted before they expired, so that the queue doesn't grow
+        # without bound.
+        if len(self._expiry) > 2 * self.max_size:
+            self._expiry = deque(
+                item
+                for item in self._expiry
+                if self._entries.get(item[1], (None,))[0] == item[0]
+            )
+
+    def _evict(self, key: CacheKey) -> None:
+        """
+        Removes a digest from the cache, overwriting its buffer first.
+        """
+        _, buffer = self._entries.pop(key)
+        buffer[:] = bytes(len(buffer))
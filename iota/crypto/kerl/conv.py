@@ -1,4 +1,4 @@
-from typing import List, Dict
+from typing import Dict, List, Sequence
 
 
 BYTE_HASH_LENGTH = 48
@@ -38,6 +38,50 @@ tryte_table: Dict[str, List[int]] = {
 trit_table = {tuple(v): k for k, v in tryte_table.items()}
 
 
+_BYTE_HASH_MASK = (1 << (BYTE_HASH_LENGTH * 8)) - 1
+"""
+Used to convert a signed integer into its two's complement
+representation.
+"""
+
+_INCREMENT = (1).__add__
+
+_TERNARY_DIGITS = bytes.maketrans(b'\x00\x01\x02', b'012')
+"""
+Translation table that converts digit values into ASCII characters.
+"""
+
+_BALANCED_OFFSETS: Dict[int, int] = {
+    TRIT_HASH_LENGTH: (3 ** TRIT_HASH_LENGTH - 1) // 2,
+}
+"""
+Precomputed results of :py:func:`_balanced_offset` for common lengths.
+"""
+
+_TRITS_PER_CHUNK = 6
+
+_CHUNK_BASE = 3 ** _TRITS_PER_CHUNK
+
+
+def _trits_from_chunk(value: int) -> List[int]:
+    trits = []
+
+    for _ in range(_TRITS_PER_CHUNK):
+        value, digit = divmod(value, 3)
+        trits.append(digit - 1)
+
+    return trits
+
+
+_TRITS_FROM_CHUNK: List[List[int]] = [
+    _trits_from_chunk(value) for value in range(_CHUNK_BASE)
+]
+"""
+Lookup table that converts an unbalanced value into balanced trits,
+least-significant trit first.
+"""
+
+
 def trytes_to_trits(trytes: str) -> List[int]:
     trits = []
     for tryte in trytes:
@@ -68,63 +112,96 @@ def convertToBytes(trits: List[int]) -> List[int]:
     return bytes_k
 
 
-def convertBytesToBigInt(ba: List[int]) -> int:
-    # copy of array
-    bytesArray = list(map(lambda x: x, ba))
+def trits_to_bytes(trits: Sequence[int]) -> bytes:
+    """
+    Converts a hash worth of trits into the (unsigned) bytes that are
+    fed into Keccak.
 
-    # number sign in MSB
-    signum = (1 if bytesArray[0] >= 0 else -1)
+    Equivalent to ``bytes(convert_sign(b) for b in convertToBytes(trits))``,
+    but without building the intermediate list of signed bytes.
+    """
+    return (
+        (convertBaseToBigint(trits, 3) & _BYTE_HASH_MASK)
+            .to_bytes(BYTE_HASH_LENGTH, 'big')
+    )
 
-    if signum == -1:
-        # sub1
-        for pos in reversed(range(len(bytesArray))):
-            sub = (bytesArray[pos] & 0xFF) - 1
-            bytesArray[pos] = (sub if sub <= 0x7F else sub - 0x100)
-            if bytesArray[pos] != -1:
-                break
 
-        # 1-compliment
-        bytesArray = list(map(lambda x: ~x, bytesArray))
+def bytes_to_trits(bytes_: bytes) -> List[int]:
+    """
+    Converts the (unsigned) bytes returned by Keccak into a hash worth of
+    trits.
 
-    # sum magnitudes and set sign
-    return sum((x & 0xFF) << pos * 8 for (pos, x) in
-               enumerate(reversed(bytesArray))) * signum
+    Equivalent to ``convertToTrits([convert_sign(b) for b in bytes_])``,
+    but without building the intermediate list of signed bytes.
+    """
+    return convertBigintToBase(
+        int.from_bytes(bytes_, 'big', signed=True),
+        3,
+        TRIT_HASH_LENGTH,
+    )
 
 
-def convertBigIntToBytes(big: int) -> List[int]:
-    bytesArrayTemp = [(abs(big) >> pos * 8) % (1 << 8) for pos in
-                      range(48)]
+def convertBytesToBigInt(ba: List[int]) -> int:
+    # Bytes are signed and big-endian; the number is stored in two's
+    # complement.
+    return int.from_bytes(
+        bytes(b & 0xFF for b in ba),
+        'big',
+        signed=True,
+    )
 
-    # big endian and balanced
-    bytesArray = list(map(
-        lambda x: (x if x <= 0x7F else x - 0x100),
-        reversed(bytesArrayTemp)
-    ))
 
-    if big < 0:
-        # 1-compliment
-        bytesArray = list(map(lambda x: ~x, bytesArray))
+def convertBigIntToBytes(big: int) -> List[int]:
+    # Values that don't fit into 48 bytes are truncated, keeping the
+    # least-significant bytes.
+    return [
+        (b if b <= 0x7F else b - 0x100)
+        for b in (big & _BYTE_HASH_MASK).to_bytes(BYTE_HASH_LENGTH, 'big')
+    ]
+
+
+def convertBaseToBigint(array: Sequence[int], base: int) -> int:
+    if base == 3 and array and min(array) >= -1 and max(array) <= 1:
+        # Shift each balanced trit into the range 0..2 and let Python
+        # parse the result as an (unbalanced) base-3 number, most
+        # significant digit first; then shift the whole thing back.
+        # Other values must go through the generic loop below;
+        # otherwise ``int`` would happily parse them as the wrong
+        # characters (e.g., 47 shifts to ``'0'``).
+        digits = bytes(map(_INCREMENT, reversed(array)))
+
+        return (
+            int(digits.translate(_TERNARY_DIGITS), 3)
+            - _balanced_offset(len(digits))
+        )
+
+    # Horner evaluation; avoids computing ``base ** i`` for every digit.
+    bigint = 0
 
-        # add1
-        for pos in reversed(range(len(bytesArray))):
-            add = (bytesArray[pos] & 0xFF) + 1
-            bytesArray[pos] = (add if add <= 0x7F else add - 0x100)
-            if bytesArray[pos] != 0:
-                break
+    for digit in reversed(array):
+        bigint = bigint * base + digit
 
-    return bytesArray
+    return bigint
 
 
-def convertBaseToBigint(array: List[int], base: int) -> int:
-    bigint = 0
+def convertBigintToBase(bigInt: int, base: int, length: int) -> List[int]:
+    if base == 3:
+        offset = _balanced_offset(length)
 
-    for i in range(len(array)):
-        bigint += array[i] * (base ** i)
+        if -offset <= bigInt <= offset:
+            # Adding the offset turns every balanced trit into an
+            # unbalanced digit in the range 0..2, so we can peel off
+            # several trits at a time using a lookup table.
+            quotient = bigInt + offset
 
-    return bigint
+            result = []
+            for _ in range(-(-length // _TRITS_PER_CHUNK)):
+                quotient, remainder = divmod(quotient, _CHUNK_BASE)
+                result.extend(_TRITS_FROM_CHUNK[remainder])
 
+            del result[length:]
+            return result
 
-def convertBigintToBase(bigInt: int, base: int, length: int) -> List[int]:
     result = []
 
     is_negative = bigInt < 0
@@ -159,3 +236,14 @@ def convert_sign(byte: int) -> int:
     elif byte > 127:
         return -256 + byte
     return byte
+
+
+def _balanced_offset(length: int) -> int:
+    """
+    Returns the largest value that can be represented by ``length``
+    balanced trits (i.e., ``length`` 1s).
+    """
+    try:
+        return _BALANCED_OFFSETS[length]
+    except KeyError:
+        return (3 ** length - 1) // 2
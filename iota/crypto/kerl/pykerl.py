@@ -1,8 +1,9 @@
-from typing import MutableSequence, Optional
+from typing import List, MutableSequence, Optional, Sequence
 
 from sha3 import keccak_384
 
 from iota.crypto.kerl import conv
+from iota.crypto.kerl.conv import _BYTE_HASH_MASK
 from iota.exceptions import with_context
 
 __all__ = [
@@ -12,6 +13,17 @@ __all__ = [
 BYTE_HASH_LENGTH = 48
 TRIT_HASH_LENGTH = 243
 
+_LAST_TRIT_VALUE = 3 ** (TRIT_HASH_LENGTH - 1)
+"""
+Place value of the last trit in a hash.
+"""
+
+_LAST_TRIT_THRESHOLD = (_LAST_TRIT_VALUE - 1) // 2
+"""
+Largest value that can be represented without using the last trit in
+a hash.
+"""
+
 
 class Kerl(object):
     k: keccak_384 = None
@@ -39,10 +51,11 @@ class Kerl(object):
         """
         # Pad input if necessary, so that it can be divided evenly into
         # hashes.
-        # Note that this operation creates a COPY of ``trits``; the
-        # incoming buffer is not modified!
+        # Note that ``extend`` (rather than ``+=``) also works for
+        # ``array('b')`` buffers (see
+        # :py:meth:`iota.TryteString.as_trit_array`).
         pad = ((len(trits) % TRIT_HASH_LENGTH) or TRIT_HASH_LENGTH)
-        trits += [0] * (TRIT_HASH_LENGTH - pad)
+        trits.extend([0] * (TRIT_HASH_LENGTH - pad))
 
         if length is None:
             length = len(trits)
@@ -65,16 +78,7 @@ class Kerl(object):
             if stop - offset == TRIT_HASH_LENGTH:
                 trits[stop - 1] = 0
 
-            signed_nums = conv.convertToBytes(trits[offset:stop])
-
-            # Convert signed bytes into their equivalent unsigned
-            # representation, in order to use Python's built-in bytes
-            # type.
-            unsigned_bytes = bytearray(
-                conv.convert_sign(b) for b in signed_nums
-            )
-
-            self.k.update(unsigned_bytes)
+            self.k.update(conv.trits_to_bytes(trits[offset:stop]))
 
             offset += TRIT_HASH_LENGTH
 
@@ -125,16 +129,16 @@ class Kerl(object):
         while offset < length:
             unsigned_hash = self.k.digest()
 
-            signed_hash = [conv.convert_sign(b) for b in unsigned_hash]
-
-            trits_from_hash = conv.convertToTrits(signed_hash)
+            trits_from_hash = conv.bytes_to_trits(unsigned_hash)
             trits_from_hash[TRIT_HASH_LENGTH - 1] = 0
 
             stop = min(TRIT_HASH_LENGTH, length - offset)
             trits[offset:offset + stop] = trits_from_hash[0:stop]
 
-            flipped_bytes = bytearray(
-                conv.convert_sign(~b) for b in unsigned_hash
+            # Flip every bit of the hash (i.e., ``~b`` for each byte).
+            flipped_bytes = (
+                (int.from_bytes(unsigned_hash, 'big') ^ _BYTE_HASH_MASK)
+                    .to_bytes(BYTE_HASH_LENGTH, 'big')
             )
 
             # Reset internal state before feeding back in.
@@ -143,5 +147,68 @@ class Kerl(object):
 
             offset += TRIT_HASH_LENGTH
 
+    @staticmethod
+    def chain(trits: Sequence[int], count: int) -> List[int]:
+        """
+        Hashes a single hash worth of trits, ``count`` times in a row.
+
+        The result is the same as::
+
+            for _ in range(count):
+                sponge = Kerl()
+                sponge.absorb(trits)
+                sponge.squeeze(trits)
+
+        but the intermediate values are kept as integers; the trits are
+        only converted once on the way in and once on the way out.
+
+        :param trits:
+            Trits to hash.  Must be exactly one hash long.
+            Note: this object is not modified.
+
+        :param count:
+            Number of times to hash the trits.
+
+        :return:
+            The resulting trits.
+        """
+        if len(trits) != TRIT_HASH_LENGTH:
+            raise with_context(
+                exc=ValueError('Invalid length passed to ``chain``.'),
+
+                context={
+                    'trits': trits,
+                    'count': count,
+                },
+            )
+
+        if count < 1:
+            return list(trits)
+
+        # ``absorb`` zeroes the last trit of each hash.
+        value = (
+            conv.convertBaseToBigint(trits[:TRIT_HASH_LENGTH - 1], 3)
+        )
+
+        for _ in range(count):
+            value = int.from_bytes(
+                keccak_384(
+                    (value & _BYTE_HASH_MASK).to_bytes(BYTE_HASH_LENGTH, 'big'),
+                ).digest(),
+
+                'big',
+                signed=True,
+            )
+
+            # ``squeeze`` also zeroes the last trit of each hash, which
+            # we can do without converting to trits by subtracting its
+            # place value.
+            if value > _LAST_TRIT_THRESHOLD:
+                value -= _LAST_TRIT_VALUE
+            elif value < -_LAST_TRIT_THRESHOLD:
+                value += _LAST_TRIT_VALUE
+
+        return conv.convertBigintToBase(value, 3, TRIT_HASH_LENGTH)
+
     def reset(self) -> None:
         self.k = keccak_384()
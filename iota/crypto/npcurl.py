@@ -0,0 +1,71 @@
+"""
+NumPy-accelerated implementation of Curl.
+
+This module is only importable if NumPy is installed; :py:mod:`iota.crypto`
+falls back to :py:mod:`iota.crypto.pycurl` otherwise.
+"""
+
+import numpy as np
+
+from .pycurl import Curl as PyCurl, HASH_LENGTH, NUMBER_OF_ROUNDS, \
+    STATE_LENGTH, TRUTH_TABLE
+
+__all__ = [
+    'Curl',
+    'HASH_LENGTH',
+]
+
+_TRUTH_TABLE = np.array(TRUTH_TABLE, dtype=np.int8)
+"""
+:py:data:`iota.crypto.pycurl.TRUTH_TABLE`, as a NumPy array so that it
+can be indexed with a whole state at once.
+"""
+
+# The pure-Python transform walks the state in a fixed order, stepping
+# the read index by +364 (or -365, which is the same thing modulo
+# :py:data:`STATE_LENGTH`) for each trit it writes.  That means the
+# pair of trits that feeds each output position never changes, so we
+# can compute the whole permutation up front.
+_INDEXES = (np.arange(STATE_LENGTH + 1) * 364) % STATE_LENGTH
+
+_LEFT_INDEXES = _INDEXES[:-1]
+"""
+Index of the "previous" trit used to compute each position in the new
+state.
+"""
+
+_RIGHT_INDEXES = _INDEXES[1:]
+"""
+Index of the "next" trit used to compute each position in the new
+state.
+"""
+
+
+class Curl(PyCurl):
+    """
+    NumPy implementation of Curl.
+
+    Produces exactly the same output as
+    :py:class:`iota.crypto.pycurl.Curl`, but each round of the transform
+    is performed as a single gather and table lookup over the entire
+    state, instead of one trit at a time.
+
+    **IMPORTANT: Not thread-safe!**
+    """
+
+    def _transform(self) -> None:
+        """
+        Transforms internal state.
+        """
+        truth_table = _TRUTH_TABLE
+        left = _LEFT_INDEXES
+        right = _RIGHT_INDEXES
+
+        state = np.array(self._state, dtype=np.int8)
+
+        for _ in range(NUMBER_OF_ROUNDS):
+            state = truth_table[state[left] + 3 * state[right] + 4]
+
+        # Keep the internal state as a list of ints, so that trits
+        # copied out by :py:meth:`squeeze` are plain Python values.
+        self._state = state.tolist()
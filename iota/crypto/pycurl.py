@@ -1,4 +1,5 @@
-from typing import List, MutableSequence, Optional, Sequence
+from operator import itemgetter
+from typing import Dict, List, MutableSequence, Optional, Sequence, Tuple
 
 from iota.exceptions import with_context
 
@@ -37,6 +38,28 @@ References:
   - :py:meth:`Curl._transform`.
 """
 
+_get_prev_trits = itemgetter(*(
+    (364 * pos) % STATE_LENGTH for pos in range(STATE_LENGTH)
+))
+"""
+Extracts the "previous" trit used to compute each position in the new
+state.
+
+References:
+  - :py:meth:`Curl._transform_sliced`.
+"""
+
+_get_next_trits = itemgetter(*(
+    (364 * (pos + 1)) % STATE_LENGTH for pos in range(STATE_LENGTH)
+))
+"""
+Extracts the "next" trit used to compute each position in the new
+state.
+
+References:
+  - :py:meth:`Curl._transform_sliced`.
+"""
+
 
 class Curl(object):
     """
@@ -73,7 +96,7 @@ class Curl(object):
             Number of trits to absorb.  Defaults to ``len(trits)``.
         """
         pad = ((len(trits) % HASH_LENGTH) or HASH_LENGTH)
-        trits += [0] * (HASH_LENGTH - pad)
+        trits.extend([0] * (HASH_LENGTH - pad))
 
         if length is None:
             length = len(trits)
@@ -172,6 +195,146 @@ class Curl(object):
             offset += HASH_LENGTH
             length -= HASH_LENGTH
 
+    @classmethod
+    def hash_many(cls, buffers: Sequence[Sequence[int]]) -> List[List[int]]:
+        """
+        Computes the hash of each buffer in a single pass.
+
+        The result is identical to absorbing each buffer into a fresh
+        sponge and squeezing one hash out of it, but the sponges are
+        "bit-sliced": each one occupies a single bit position in a pair
+        of integers (one for the high bit of each trit, and one for the
+        low bit), so that all of them are transformed at the same time.
+
+        This is the same technique that IRI's PearlDiver uses, except
+        that Python integers are not limited to the size of a machine
+        word, so every buffer that has the same (padded) length is
+        hashed in the same pass.
+
+        :param buffers:
+            Sequence of trit buffers to hash.  The buffers are not
+            modified.
+
+        :return:
+            List containing one hash (as a list of trits) per buffer,
+            in the same order as ``buffers``.
+        """
+        results: List[Optional[List[int]]] = [None] * len(buffers)
+
+        # Sponges can only be transformed together if they absorb the
+        # same number of hashes.
+        lanes_by_length: Dict[int, List[int]] = {}
+        for i, trits in enumerate(buffers):
+            if not trits:
+                raise with_context(
+                    exc=ValueError('Invalid length passed to ``hash_many``.'),
+
+                    context={
+                        'buffer': trits,
+                        'index': i,
+                    },
+                )
+
+            length = len(trits) + (-len(trits) % HASH_LENGTH)
+            lanes_by_length.setdefault(length, []).append(i)
+
+        for length, lanes in lanes_by_length.items():
+            hashes = cls._hash_sliced([buffers[i] for i in lanes], length)
+
+            for i, hash_trits in zip(lanes, hashes):
+                results[i] = hash_trits
+
+        return results
+
+    @classmethod
+    def _hash_sliced(
+            cls,
+            buffers: Sequence[Sequence[int]],
+            length: int
+    ) -> List[List[int]]:
+        """
+        Hashes buffers of the same (padded) length in a single pass.
+
+        See :py:meth:`hash_many` for more info.
+        """
+        mask = (1 << len(buffers)) - 1
+
+        # All trits start out as 0, which is encoded by setting both the
+        # low and high bits.
+        low = [mask] * STATE_LENGTH
+        high = [mask] * STATE_LENGTH
+
+        for offset in range(0, length, HASH_LENGTH):
+            for pos in range(HASH_LENGTH):
+                positive = 0
+                negative = 0
+
+                for lane, trits in enumerate(buffers):
+                    try:
+                        trit = trits[offset + pos]
+                    except IndexError:
+                        # Short buffers are padded with 0s.
+                        continue
+
+                    if trit == 1:
+                        positive |= 1 << lane
+                    elif trit == -1:
+                        negative |= 1 << lane
+
+                # 1 => (low=0, high=1), -1 => (low=1, high=0).
+                low[pos] = mask ^ positive
+                high[pos] = mask ^ negative
+
+            low, high = cls._transform_sliced(low, high, mask)
+
+        hashes = []
+        for lane in range(len(buffers)):
+            hashes.append([
+                ((high[pos] >> lane) & 1) - ((low[pos] >> lane) & 1)
+                for pos in range(HASH_LENGTH)
+            ])
+
+        return hashes
+
+    @staticmethod
+    def _transform_sliced(
+            low: List[int],
+            high: List[int],
+            mask: int
+    ) -> Tuple[List[int], List[int]]:
+        """
+        Transforms the state of several bit-sliced sponges at once.
+
+        Equivalent to :py:meth:`_transform`, but operates on the low and
+        high bit planes of the state instead of on individual trits.
+        """
+        get_prev_trits = _get_prev_trits
+        get_next_trits = _get_next_trits
+
+        # Each list is a plain gather, so it's cheaper to build them all
+        # up front than to index into the state inside the inner loop.
+        for _ in range(NUMBER_OF_ROUNDS):
+            alphas = get_prev_trits(low)
+            gammas = get_next_trits(high)
+
+            deltas = [
+                (alpha | (gamma ^ mask)) & (next_low ^ beta)
+                for alpha, beta, gamma, next_low in zip(
+                    alphas,
+                    get_prev_trits(high),
+                    gammas,
+                    get_next_trits(low),
+                )
+            ]
+
+            low = [delta ^ mask for delta in deltas]
+            high = [
+                (alpha ^ gamma) | delta
+                for alpha, gamma, delta in zip(alphas, gammas, deltas)
+            ]
+
+        return low, high
+
     def _transform(self) -> None:
         """
         Transforms internal state.
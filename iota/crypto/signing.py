@@ -1,11 +1,12 @@
-from typing import Iterator, List, Sequence
+from typing import Iterator, List, Optional, Sequence
 
 from iota import Hash, TRITS_PER_TRYTE, TryteString, TrytesCompatible, Address
 from iota.crypto import FRAGMENT_LENGTH, HASH_LENGTH
+from iota.crypto.cache import DigestCache
 from iota.crypto.kerl import Kerl
-from iota.crypto.types import PrivateKey, Seed
+from iota.crypto.types import Digest, PrivateKey, Seed
 from iota.exceptions import with_context
-from iota.trits import add_trits, trits_from_int
+from iota.trits import add_trits, increment_trits, trits_from_int
 
 __all__ = [
     'KeyGenerator',
@@ -36,18 +37,26 @@ def normalize(hash_: Hash) -> List[List[int]]:
         chunk = source[start:stop]
         chunk_sum = sum(chunk)
 
-        while chunk_sum > 0:
-            chunk_sum -= 1
+        # Move each value as far towards -13 (or 13) as it will go, one
+        # value at a time, until the chunk is balanced.  This gives the
+        # same result as adjusting the first eligible value by 1 and
+        # repeating.
+        if chunk_sum > 0:
             for j in range(chunk_size):
-                if chunk[j] > -13:
-                    chunk[j] -= 1
+                delta = min(chunk_sum, chunk[j] + 13)
+                chunk[j] -= delta
+                chunk_sum -= delta
+
+                if not chunk_sum:
                     break
 
-        while chunk_sum < 0:
-            chunk_sum += 1
+        elif chunk_sum < 0:
             for j in range(chunk_size):
-                if chunk[j] < 13:
-                    chunk[j] += 1
+                delta = min(-chunk_sum, 13 - chunk[j])
+                chunk[j] += delta
+                chunk_sum += delta
+
+                if not chunk_sum:
                     break
 
         normalized.append(chunk)
@@ -58,12 +67,24 @@ def normalize(hash_: Hash) -> List[List[int]]:
 class KeyGenerator(object):
     """
     Generates signing keys for messages.
+
+    :param TrytesCompatible seed:
+        The seed to derive keys from.
+
+    :param Optional[DigestCache] digest_cache:
+        If set, :py:meth:`get_digests` checks this cache before deriving
+        any keys, and stores the digests it generates in it.
     """
 
-    def __init__(self, seed: TrytesCompatible) -> None:
+    def __init__(
+            self,
+            seed: TrytesCompatible,
+            digest_cache: Optional[DigestCache] = None,
+    ) -> None:
         super(KeyGenerator, self).__init__()
 
         self.seed = Seed(seed)
+        self.digest_cache = digest_cache
 
     def get_key(self, index: int, iterations: int) -> PrivateKey:
         """
@@ -184,6 +205,71 @@ class KeyGenerator(object):
 
         return keys
 
+    def get_digests(
+            self,
+            start: int,
+            count: int = 1,
+            iterations: int = 1
+    ) -> List[Digest]:
+        """
+        Generates and returns the digests of one or more consecutive
+        keys.
+
+        If :py:attr:`digest_cache` is set, keys are only derived for
+        digests that aren't already in the cache.
+
+        :param start:
+            Starting index.
+            Must be >= 0.
+
+        :param count:
+            Number of digests to generate.
+            Must be > 0.
+
+        :param iterations:
+            Number of transform iterations to apply to each key, also
+            known as security level.
+            Must be >= 1.
+
+        :return:
+            Always returns a list, even if only one digest is generated.
+        """
+        if count < 1:
+            raise with_context(
+                    exc=ValueError('``count`` must be positive.'),
+
+                    context={
+                        'start': start,
+                        'count': count,
+                        'iterations': iterations,
+                    },
+            )
+
+        iterator = self.create_iterator(start, 1, iterations)
+
+        digests = []
+        for _ in range(count):
+            digest = None
+
+            if self.digest_cache is not None:
+                digest = self.digest_cache.get(
+                    self.seed,
+                    iterations,
+                    iterator.current,
+                )
+
+            if digest is None:
+                digest = next(iterator).get_digest()
+
+                if self.digest_cache is not None:
+                    self.digest_cache.set(self.seed, digest)
+            else:
+                iterator.advance()
+
+            digests.append(digest)
+
+        return digests
+
     def create_iterator(
             self,
             start: int = 0,
@@ -269,6 +355,16 @@ class KeyIterator(Iterator[PrivateKey]):
         self.fragment_length = FRAGMENT_LENGTH * TRITS_PER_TRYTE
         self.hashes_per_fragment = FRAGMENT_LENGTH // Hash.LEN
 
+        # Keys are squeezed into the same buffer every time; it is
+        # converted into trytes before being returned.
+        self._key_buffer = [0] * (self.fragment_length * self.security_level)
+
+        # Subseed (seed + index) for the most recently generated key.
+        # When the iterator advances, the subseed is incremented in
+        # place, rather than computed again from scratch.
+        self._subseed: Optional[List[int]] = None
+        self._subseed_index = 0
+
     def __iter__(self) -> 'KeyIterator':
         return self
 
@@ -276,26 +372,32 @@ class KeyIterator(Iterator[PrivateKey]):
         while self.current >= 0:
             sponge = self._create_sponge(self.current)
 
-            key = [0] * (self.fragment_length * self.security_level)
-            buffer = [0] * len(self.seed_as_trits)
+            key = self._key_buffer
+
+            if len(self.seed_as_trits) == HASH_LENGTH:
+                # Each squeeze produces exactly one hash, so we can
+                # squeeze the entire key in one go.
+                sponge.squeeze(key, length=len(key))
+            else:
+                buffer = [0] * len(self.seed_as_trits)
 
-            for fragment_seq in range(self.security_level):
-                # Squeeze trits from the buffer and append them to the
-                # key, one hash at a time.
-                for hash_seq in range(self.hashes_per_fragment):
-                    sponge.squeeze(buffer)
+                for fragment_seq in range(self.security_level):
+                    # Squeeze trits from the buffer and append them to
+                    # the key, one hash at a time.
+                    for hash_seq in range(self.hashes_per_fragment):
+                        sponge.squeeze(buffer)
 
-                    key_start = (
-                            (fragment_seq * self.fragment_length) +
-                            (hash_seq * HASH_LENGTH)
-                    )
+                        key_start = (
+                                (fragment_seq * self.fragment_length) +
+                                (hash_seq * HASH_LENGTH)
+                        )
 
-                    key_stop = key_start + HASH_LENGTH
+                        key_stop = key_start + HASH_LENGTH
 
-                    # Ensure we only capture one hash from the buffer,
-                    # in case it is longer than that (i.e., if the seed
-                    # is longer than 81 trytes).
-                    key[key_start:key_stop] = buffer[0:HASH_LENGTH]
+                        # Ensure we only capture one hash from the
+                        # buffer, in case it is longer than that (i.e.,
+                        # if the seed is longer than 81 trytes).
+                        key[key_start:key_stop] = buffer[0:HASH_LENGTH]
 
             private_key = PrivateKey.from_trits(
                     key_index=self.current,
@@ -317,10 +419,10 @@ class KeyIterator(Iterator[PrivateKey]):
         """
         Prepares the hash sponge for the generator.
         """
-        seed = self.seed_as_trits[:]
+        seed = self._get_subseed(index)[:]
 
         sponge = Kerl()
-        sponge.absorb(add_trits(seed, trits_from_int(index)))
+        sponge.absorb(seed)
 
         # Squeeze all of the trits out of the sponge and re-absorb them.
         # Note that the sponge transforms several times per operation,
@@ -332,6 +434,30 @@ class KeyIterator(Iterator[PrivateKey]):
 
         return sponge
 
+    def _get_subseed(self, index: int) -> List[int]:
+        """
+        Returns the trits of the seed plus ``index``.
+
+        Note: the returned list is reused by subsequent calls; do not
+        modify it!
+        """
+        index_trits = trits_from_int(index)
+
+        # ``add_trits`` makes the result as long as the longer of its
+        # operands, so if the index doesn't fit into the seed (e.g.,
+        # when the seed is empty), the width of the subseed changes, and
+        # we can't simply increment it in place.
+        width = max(len(self.seed_as_trits), len(index_trits))
+
+        if self._subseed is None or len(self._subseed) != width:
+            self._subseed = add_trits(self.seed_as_trits, index_trits)
+        else:
+            increment_trits(self._subseed, index - self._subseed_index)
+
+        self._subseed_index = index
+
+        return self._subseed
+
 
 class SignatureFragmentGenerator(Iterator[TryteString]):
     """
@@ -347,7 +473,6 @@ class SignatureFragmentGenerator(Iterator[TryteString]):
         self._key_chunks = private_key.iter_chunks(FRAGMENT_LENGTH)
         self._iteration = -1
         self._normalized_hash = normalize(hash_)
-        self._sponge = Kerl()
 
     def __iter__(self) -> 'SignatureFragmentGenerator':
         return self
@@ -380,14 +505,10 @@ class SignatureFragmentGenerator(Iterator[TryteString]):
             hash_start = i * HASH_LENGTH
             hash_end = hash_start + HASH_LENGTH
 
-            buffer: List[int] = signature_fragment[hash_start:hash_end]
-
-            for _ in range(13 - normalized_chunk[i]):
-                self._sponge.reset()
-                self._sponge.absorb(buffer)
-                self._sponge.squeeze(buffer)
-
-            signature_fragment[hash_start:hash_end] = buffer
+            signature_fragment[hash_start:hash_end] = Kerl.chain(
+                signature_fragment[hash_start:hash_end],
+                13 - normalized_chunk[i],
+            )
 
         return TryteString.from_trits(signature_fragment)
 
@@ -428,15 +549,13 @@ def validate_signature_fragments(
 
         buffer = []
         for j, hash_trytes in enumerate(fragment.iter_chunks(Hash.LEN)):
-            buffer: List[int] = hash_trytes.as_trits()
-            inner_sponge = sponge_type()
-
             # Note the sign flip compared to
             # :py;class:`SignatureFragmentGenerator`.
-            for _ in range(13 + normalized_chunk[j]):
-                inner_sponge.reset()
-                inner_sponge.absorb(buffer)
-                inner_sponge.squeeze(buffer)
+            buffer: List[int] = _hash_chain(
+                sponge_type,
+                hash_trytes.as_trits(),
+                13 + normalized_chunk[j],
+            )
 
             outer_sponge.absorb(buffer)
 
@@ -449,3 +568,29 @@ def validate_signature_fragments(
     addy_sponge.squeeze(actual_public_key)
 
     return actual_public_key == public_key.as_trits()
+
+
+def _hash_chain(
+        sponge_type: type,
+        trits: List[int],
+        count: int,
+) -> List[int]:
+    """
+    Hashes a single hash worth of trits, ``count`` times in a row, using
+    the specified sponge type.
+
+    Uses the sponge's ``chain`` method if it has one (e.g.,
+    :py:meth:`Kerl.chain`); otherwise creates a new sponge for each
+    iteration.
+    """
+    chain = getattr(sponge_type, 'chain', None)
+    if chain:
+        return chain(trits, count)
+
+    sponge = sponge_type()
+    for _ in range(count):
+        sponge.reset()
+        sponge.absorb(trits)
+        sponge.squeeze(trits)
+
+    return trits
@@ -1,10 +1,10 @@
 import warnings
-from typing import Optional
+from typing import List, Optional
 
 from iota.crypto import FRAGMENT_LENGTH, HASH_LENGTH, SeedWarning
 from iota.crypto.kerl import Kerl
 from iota.exceptions import with_context
-from iota.transaction.base import Bundle
+from iota.transaction.base import Bundle, Transaction
 from iota.types import Hash, TryteString, TrytesCompatible
 
 __all__ = [
@@ -84,7 +84,7 @@ class Digest(TryteString):
 
         """
         return {
-            'trytes': self._trytes.decode('ascii'),
+            'trytes': str(self),
             'key_index': self.key_index,
         }
 
@@ -183,7 +183,7 @@ class PrivateKey(TryteString):
     ) -> None:
         super(PrivateKey, self).__init__(trytes)
 
-        if len(self._trytes) % FRAGMENT_LENGTH:
+        if len(self) % FRAGMENT_LENGTH:
             raise with_context(
                 exc=ValueError(
                     'Length of {cls} values '
@@ -216,7 +216,7 @@ class PrivateKey(TryteString):
 
         """
         return {
-            'trytes': self._trytes.decode('ascii'),
+            'trytes': str(self),
             'key_index': self.key_index,
             'security_level': self.security_level,
         }
@@ -253,14 +253,11 @@ class PrivateKey(TryteString):
             for j in range(hashes_per_fragment):
                 hash_start = j * HASH_LENGTH
                 hash_end = hash_start + HASH_LENGTH
-                hash_trits = fragment_trits[hash_start:hash_end]
 
-                for k in range(26):
-                    sponge = Kerl()
-                    sponge.absorb(hash_trits)
-                    sponge.squeeze(hash_trits)
-
-                key_fragment[hash_start:hash_end] = hash_trits
+                key_fragment[hash_start:hash_end] = Kerl.chain(
+                    fragment_trits[hash_start:hash_end],
+                    26,
+                )
 
             # After processing all of the hashes in the fragment,
             # generate a final hash and append it to the digest.
@@ -303,16 +300,12 @@ class PrivateKey(TryteString):
         :raises IndexError: if wrong ``start_index`` is provided.
         """
 
-        if not bundle.hash:
-            raise with_context(
-                exc=ValueError('Cannot sign inputs without a bundle hash!'),
-
-                context={
-                    'bundle': bundle,
-                    'key_index': self.key_index,
-                    'start_index': start_index,
-                },
-            )
+        transactions = _get_input_transactions(
+            bundle,
+            start_index,
+            self.security_level,
+            self.key_index,
+        )
 
         from iota.crypto.signing import SignatureFragmentGenerator
         signature_fragment_generator = (
@@ -321,60 +314,102 @@ class PrivateKey(TryteString):
 
         # We can only fit one signature fragment into each transaction,
         # so we have to split the entire signature.
-        for j in range(self.security_level):
-            # Do lots of validation before we attempt to sign the
-            # transaction, and attach lots of context info to any
-            # exception.
-            #
-            # This method is likely to be invoked at a very low level in
-            # the application, so if anything goes wrong, we want to
-            # make sure it's as easy to troubleshoot as possible!
-            try:
-                txn = bundle[start_index + j]
-            except IndexError as e:
-                raise with_context(
-                    exc=e,
-
-                    context={
-                        'bundle': bundle,
-                        'key_index': self.key_index,
-                        'current_index': start_index + j,
-                    },
-                )
+        for txn in transactions:
+            txn.signature_message_fragment = next(signature_fragment_generator)
+
+
+def _get_input_transactions(
+        bundle: Bundle,
+        start_index: int,
+        security_level: int,
+        key_index: Optional[int],
+) -> List[Transaction]:
+    """
+    Returns the transactions that will hold the signature for the input
+    starting at the specified index, after checking that they can be
+    signed.
+
+    This is shared by :py:meth:`PrivateKey.sign_input_transactions` and
+    :py:meth:`iota.transaction.creation.ProposedBundle.sign_inputs`,
+    which can generate signatures without a :py:class:`PrivateKey`
+    object.
+
+    :raises ValueError:
+        - if ``bundle`` is not finalized.
+        - if attempting to sign non-input transactions.
+        - if attempting to sign transactions with non-empty
+          ``signature_message_fragment`` field.
+    :raises IndexError: if wrong ``start_index`` is provided.
+    """
+    if not bundle.hash:
+        raise with_context(
+            exc=ValueError('Cannot sign inputs without a bundle hash!'),
+
+            context={
+                'bundle': bundle,
+                'key_index': key_index,
+                'start_index': start_index,
+            },
+        )
+
+    transactions = []
+
+    for j in range(security_level):
+        # Do lots of validation before we attempt to sign the
+        # transaction, and attach lots of context info to any
+        # exception.
+        #
+        # This method is likely to be invoked at a very low level in
+        # the application, so if anything goes wrong, we want to make
+        # sure it's as easy to troubleshoot as possible!
+        try:
+            txn = bundle[start_index + j]
+        except IndexError as e:
+            raise with_context(
+                exc=e,
+
+                context={
+                    'bundle': bundle,
+                    'key_index': key_index,
+                    'current_index': start_index + j,
+                },
+            )
 
-            # Only inputs can be signed.
-            if txn.value > 0:
-                raise with_context(
-                    exc=ValueError(
-                        'Attempting to sign non-input transaction #{i} '
-                        '(value={value}).'.format(
-                            i=txn.current_index,
-                            value=txn.value,
-                        ),
+        # Only inputs can be signed.
+        if txn.value > 0:
+            raise with_context(
+                exc=ValueError(
+                    'Attempting to sign non-input transaction #{i} '
+                    '(value={value}).'.format(
+                        i=txn.current_index,
+                        value=txn.value,
                     ),
+                ),
 
-                    context={
-                        'bundle': bundle,
-                        'key_index': self.key_index,
-                        'start_index': start_index,
-                    },
-                )
+                context={
+                    'bundle': bundle,
+                    'key_index': key_index,
+                    'start_index': start_index,
+                },
+            )
 
-            if txn.signature_message_fragment:
-                raise with_context(
-                    exc=ValueError(
-                        'Attempting to sign input transaction #{i}, '
-                        'but it has a non-empty fragment '
-                        '(is it already signed?).'.format(
-                            i=txn.current_index,
-                        ),
+        if txn.signature_message_fragment:
+            raise with_context(
+                exc=ValueError(
+                    'Attempting to sign input transaction #{i}, '
+                    'but it has a non-empty fragment '
+                    '(is it already signed?).'.format(
+                        i=txn.current_index,
                     ),
+                ),
 
-                    context={
-                        'bundle': bundle,
-                        'key_index': self.key_index,
-                        'start_index': start_index,
-                    },
-                )
+                context={
+                    'bundle': bundle,
+                    'key_index': key_index,
+                    'start_index': start_index,
+                },
+            )
 
-            txn.signature_message_fragment = next(signature_fragment_generator)
+        transactions.append(txn)
+
+    return transactions
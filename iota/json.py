@@ -7,6 +7,8 @@ class JsonSerializable(object, metaclass=ABCMeta):
     """
     Interface for classes that can be safely converted to JSON.
     """
+    # Allow subclasses to use ``__slots__``.
+    __slots__ = ()
 
     @abstract_method
     def as_json_compatible(self):
@@ -1,7 +1,9 @@
 from typing import Iterable, Optional
 
-from iota import Address, Iota, AsyncIota, ProposedTransaction
+from iota import AdapterSpec, Address, Iota, AsyncIota, \
+    ProposedTransaction, TrytesCompatible
 from iota.crypto.addresses import AddressGenerator
+from iota.crypto.cache import DigestCache
 from iota.crypto.types import Digest
 from iota.multisig import commands
 from iota.multisig.types import MultisigAddress
@@ -47,6 +49,26 @@ class AsyncMultisigIota(AsyncIota):
     - https://github.com/iotaledger/wiki/blob/master/multisigs.md
     """
 
+    def __init__(
+            self,
+            adapter: AdapterSpec,
+            seed: Optional[TrytesCompatible] = None,
+            devnet: bool = False,
+            local_pow: bool = False,
+            digest_cache: Optional[DigestCache] = None,
+    ) -> None:
+        """
+        :param digest_cache:
+            If set, :py:meth:`get_digests` remembers the digests it
+            generates (for a limited time), so that keys don't have to
+            be derived again for the same seed/index/security level.
+
+            See :py:class:`iota.crypto.cache.DigestCache` for more info.
+        """
+        AsyncIota.__init__(self, adapter, seed, devnet, local_pow)
+
+        self.digest_cache = digest_cache
+
     async def create_multisig_address(
             self,
             digests: Iterable[Digest]
@@ -109,7 +131,10 @@ class AsyncMultisigIota(AsyncIota):
                         was generated.
                 }
         """
-        return await commands.GetDigestsCommand(self.adapter)(
+        return await commands.GetDigestsCommand(
+            self.adapter,
+            self.digest_cache,
+        )(
             seed=self.seed,
             index=index,
             count=count,
@@ -290,6 +315,26 @@ class MultisigIota(Iota, AsyncMultisigIota):
     - https://github.com/iotaledger/wiki/blob/master/multisigs.md
     """
 
+    def __init__(
+            self,
+            adapter: AdapterSpec,
+            seed: Optional[TrytesCompatible] = None,
+            devnet: bool = False,
+            local_pow: bool = False,
+            digest_cache: Optional[DigestCache] = None,
+    ) -> None:
+        """
+        :param digest_cache:
+            If set, :py:meth:`get_digests` remembers the digests it
+            generates (for a limited time), so that keys don't have to
+            be derived again for the same seed/index/security level.
+
+            See :py:class:`iota.crypto.cache.DigestCache` for more info.
+        """
+        Iota.__init__(self, adapter, seed, devnet, local_pow)
+
+        self.digest_cache = digest_cache
+
     def create_multisig_address(
             self,
             digests: Iterable[Digest]
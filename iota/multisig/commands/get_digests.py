@@ -2,7 +2,10 @@ from typing import Optional
 
 import filters as f
 
+from iota.adapter import BaseAdapter
 from iota.commands import FilterCommand, RequestFilter
+from iota.crypto.cache import DigestCache
+from iota.crypto.signing import KeyGenerator
 from iota.crypto.types import Seed
 from iota.filters import SecurityLevel, Trytes
 from iota.multisig.commands.get_private_keys import GetPrivateKeysCommand
@@ -22,6 +25,23 @@ class GetDigestsCommand(FilterCommand):
     """
     command = 'getDigests'
 
+    def __init__(
+            self,
+            adapter: BaseAdapter,
+            digest_cache: Optional[DigestCache] = None,
+    ) -> None:
+        """
+        :param adapter:
+            Adapter that will send request payloads to the node.
+
+        :param digest_cache:
+            If set, digests are looked up in (and added to) this cache,
+            so that keys don't have to be derived again.
+        """
+        super(GetDigestsCommand, self).__init__(adapter)
+
+        self.digest_cache = digest_cache
+
     def get_request_filter(self) -> 'GetDigestsRequestFilter':
         return GetDigestsRequestFilter()
 
@@ -36,6 +56,17 @@ class GetDigestsCommand(FilterCommand):
         seed: Seed = request['seed']
         security_level: int = request['securityLevel']
 
+        if self.digest_cache is not None:
+            generator = KeyGenerator(seed, self.digest_cache)
+
+            return {
+                'digests': generator.get_digests(
+                    start=index,
+                    count=count,
+                    iterations=security_level,
+                ),
+            }
+
         gpk_result = await GetPrivateKeysCommand(self.adapter)(
             seed=seed,
             count=count,
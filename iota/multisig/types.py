@@ -75,7 +75,7 @@ class MultisigAddress(Address):
 
         """
         return {
-            'trytes': self._trytes.decode('ascii'),
+            'trytes': str(self),
             'balance': self.balance,
             'digests': self.digests,
         }
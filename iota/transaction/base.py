@@ -1,13 +1,20 @@
+from concurrent.futures import Executor
+from itertools import chain
+from math import ceil
 from operator import attrgetter
-from typing import Iterable, Iterator, List, MutableSequence, \
-    Optional, Sequence, TypeVar, Type
+from random import sample
+from typing import Any, Callable, Dict, Iterable, Iterator, List, \
+    MutableSequence, Optional, Sequence, TypeVar, Type
+from weakref import ref
 
 from iota.codecs import TrytesDecodeError
 from iota.crypto import Curl, HASH_LENGTH
+from iota.crypto.pycurl import Curl as PyCurl
+from iota.exceptions import with_context
 from iota.json import JsonSerializable
 from iota.transaction.types import BundleHash, Fragment, Nonce, \
     TransactionHash, TransactionTrytes
-from iota.trits import int_from_trits, trits_from_int
+from iota.trits import int_from_trits, trits_from_int_fixed
 from iota.types import Address, Tag, TryteString, TrytesCompatible
 
 __all__ = [
@@ -18,6 +25,130 @@ __all__ = [
 T = TypeVar('T', bound='Transaction')
 
 
+class _TransactionField(object):
+    """
+    A :py:class:`Transaction` attribute that is decoded from the raw
+    transaction trytes the first time it is accessed.
+
+    The decoded value is cached in a slot named ``_decoded_<name>``.
+
+    :param decode:
+        Converts ``trytes[start:stop]`` into the attribute value.
+
+    :param serialized:
+        Whether the attribute is part of the transaction trytes (i.e.,
+        whether changing it invalidates the cached result of
+        :py:meth:`Transaction.as_tryte_string`).
+
+    :param essence:
+        Whether changing the attribute invalidates the trits cached by
+        :py:meth:`Transaction.get_bundle_essence_trits`.
+    """
+
+    def __init__(
+            self,
+            decode: Callable[[TryteString], Any],
+            start: int,
+            stop: int,
+            serialized: bool = True,
+            essence: bool = False,
+    ) -> None:
+        super(_TransactionField, self).__init__()
+
+        self.decode = decode
+        self.start = start
+        self.stop = stop
+        self.serialized = serialized
+        self.essence = essence
+
+        self.slot: Optional[str] = None
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.slot = '_decoded_' + name.lstrip('_')
+
+    def __get__(self, instance: Optional['Transaction'], owner: type) -> Any:
+        if instance is None:
+            return self
+
+        try:
+            return getattr(instance, self.slot)
+        except AttributeError:
+            value = self.decode(instance._raw_trytes[self.start:self.stop])
+            setattr(instance, self.slot, value)
+            return value
+
+    def __set__(self, instance: 'Transaction', value: Any) -> None:
+        setattr(instance, self.slot, value)
+
+        if self.serialized:
+            instance._cached_trytes = None
+
+        if self.essence:
+            instance._cached_essence_trits = None
+
+
+class _TransactionHashField(_TransactionField):
+    """
+    The :py:attr:`Transaction.hash` attribute.
+
+    If the transaction belongs to a :py:class:`_HashGroup`, the first
+    access computes the hash of every transaction in the group.
+    """
+
+    def __get__(self, instance: Optional['Transaction'], owner: type) -> Any:
+        if instance is not None and not hasattr(instance, self.slot):
+            group = getattr(instance, '_hash_group', None)
+            if group:
+                group.compute_hashes()
+
+        return super(_TransactionHashField, self).__get__(instance, owner)
+
+
+class _HashGroup(object):
+    """
+    Transactions created together by
+    :py:meth:`Transaction.from_tryte_strings`, whose hashes are computed
+    in batches the first time any of them is accessed.
+    """
+
+    def __init__(self, transactions: Sequence['Transaction'] = ()) -> None:
+        super(_HashGroup, self).__init__()
+
+        self.transactions = [ref(t) for t in transactions]
+
+        for transaction in transactions:
+            transaction._hash_group = self
+
+    def __bool__(self) -> bool:
+        return bool(self.transactions)
+
+    def __reduce__(self) -> Any:
+        # Pickled transactions compute their own hashes.
+        return _HashGroup, ()
+
+    def compute_hashes(self) -> None:
+        pending = [
+            t for t in (r() for r in self.transactions)
+            if t is not None and not hasattr(t, '_decoded_hash')
+        ]
+
+        self.transactions = []
+
+        hashes = _hash_in_batches([t._raw_trytes for t in pending], None)
+
+        for transaction, hash_ in zip(pending, hashes):
+            transaction._decoded_hash = hash_
+            transaction._hash_group = None
+
+
+def _int_from_trytes(trytes: TryteString) -> int:
+    return int_from_trits(trytes.as_trits())
+
+
+def _hash_from_trytes(trytes: TransactionTrytes) -> TransactionHash:
+    return _hash_transaction_trits(trytes.as_trits())
+
+
 class Transaction(JsonSerializable):
     """
     A transaction that has been attached to the Tangle.
@@ -76,6 +207,62 @@ class Transaction(JsonSerializable):
     :return:
         :py:class:`Transaction` object.
     """
+    # Transactions parsed from trytes keep the raw trytes, and only
+    # decode each attribute when it is first accessed.
+    # Note that the attribute docstrings are in :py:meth:`__init__`.
+    hash = _TransactionHashField(
+        _hash_from_trytes, 0, TransactionTrytes.LEN, serialized=False,
+    )
+    signature_message_fragment = _TransactionField(Fragment, 0, 2187)
+    address = _TransactionField(Address, 2187, 2268, essence=True)
+    value = _TransactionField(_int_from_trytes, 2268, 2295, essence=True)
+    _legacy_tag = _TransactionField(Tag, 2295, 2322, essence=True)
+    timestamp = _TransactionField(_int_from_trytes, 2322, 2331, essence=True)
+    current_index = _TransactionField(_int_from_trytes, 2331, 2340)
+    last_index = _TransactionField(_int_from_trytes, 2340, 2349)
+    bundle_hash = _TransactionField(BundleHash, 2349, 2430)
+    trunk_transaction_hash = _TransactionField(TransactionHash, 2430, 2511)
+    branch_transaction_hash = _TransactionField(TransactionHash, 2511, 2592)
+    # :py:attr:`legacy_tag` falls back to the tag, so it is part of the
+    # bundle essence, too.
+    tag = _TransactionField(Tag, 2592, 2619, essence=True)
+    attachment_timestamp = _TransactionField(_int_from_trytes, 2619, 2628)
+
+    attachment_timestamp_lower_bound = _TransactionField(
+        _int_from_trytes, 2628, 2637,
+    )
+
+    attachment_timestamp_upper_bound = _TransactionField(
+        _int_from_trytes, 2637, 2646,
+    )
+
+    nonce = _TransactionField(Nonce, 2646, 2673)
+
+    __slots__ = (
+        '__weakref__',
+        '_raw_trytes',
+        '_cached_trytes',
+        '_cached_essence_trits',
+        '_hash_group',
+        'is_confirmed',
+
+        '_decoded_hash',
+        '_decoded_signature_message_fragment',
+        '_decoded_address',
+        '_decoded_value',
+        '_decoded_legacy_tag',
+        '_decoded_timestamp',
+        '_decoded_current_index',
+        '_decoded_last_index',
+        '_decoded_bundle_hash',
+        '_decoded_trunk_transaction_hash',
+        '_decoded_branch_transaction_hash',
+        '_decoded_tag',
+        '_decoded_attachment_timestamp',
+        '_decoded_attachment_timestamp_lower_bound',
+        '_decoded_attachment_timestamp_upper_bound',
+        '_decoded_nonce',
+    )
 
     @classmethod
     def from_tryte_string(
@@ -93,11 +280,15 @@ class Transaction(JsonSerializable):
             The transaction hash, if available.
 
             If not provided, it will be computed from the transaction
-            trytes.
+            trytes (the first time it is accessed).
 
         :return:
             :py:class:`Transaction` object.
 
+        .. note::
+            The transaction's attributes are decoded from ``trytes`` as
+            they are accessed, rather than all at once.
+
         Example usage::
 
             from iota import Transaction
@@ -148,42 +339,165 @@ class Transaction(JsonSerializable):
               )
 
         """
-        tryte_string = TransactionTrytes(trytes)
+        # Skip :py:meth:`__init__`; the attributes will be decoded from
+        # the raw trytes as needed.
+        transaction = cls.__new__(cls)
+        transaction._raw_trytes = TransactionTrytes(trytes)
+        transaction._cached_trytes = transaction._raw_trytes
+        transaction.is_confirmed = None
+
+        if hash_:
+            transaction.hash = hash_
 
-        if not hash_:
-            hash_trits: MutableSequence[int] = [0] * HASH_LENGTH
+        return transaction
 
-            sponge = Curl()
-            sponge.absorb(tryte_string.as_trits())
-            sponge.squeeze(hash_trits)
+    @classmethod
+    def from_tryte_strings(
+            cls: Type[T],
+            trytes: Iterable[TrytesCompatible],
+            hashes: Optional[Iterable[TrytesCompatible]] = None,
+            executor: Optional[Executor] = None,
+            verify_hashes: float = 0,
+    ) -> List[T]:
+        """
+        Creates Transaction objects from several sequences of trytes at
+        once (e.g., the response from ``getTrytes``).
 
-            hash_ = TransactionHash.from_trits(hash_trits)
+        This is faster than calling :py:meth:`from_tryte_string` for
+        each sequence, because the transaction hashes are computed in
+        batches: the first time the hash of any of the transactions is
+        accessed, the hashes of all of them are computed, unless
+        ``hashes`` or ``executor`` is provided.
 
-        return cls(
-                hash_=hash_,
-                signature_message_fragment=Fragment(tryte_string[0:2187]),
-                address=Address(tryte_string[2187:2268]),
-                value=int_from_trits(tryte_string[2268:2295].as_trits()),
-                legacy_tag=Tag(tryte_string[2295:2322]),
-                timestamp=int_from_trits(tryte_string[2322:2331].as_trits()),
-                current_index=int_from_trits(tryte_string[2331:2340].as_trits()),
-                last_index=int_from_trits(tryte_string[2340:2349].as_trits()),
-                bundle_hash=BundleHash(tryte_string[2349:2430]),
-                trunk_transaction_hash=TransactionHash(tryte_string[2430:2511]),
-                branch_transaction_hash=TransactionHash(tryte_string[2511:2592]),
-                tag=Tag(tryte_string[2592:2619]),
+        :param Iterable[TrytesCompatible] trytes:
+            Raw trytes for each transaction.
 
-                attachment_timestamp=int_from_trits(
-                        tryte_string[2619:2628].as_trits()),
+        :param Optional[Iterable[TrytesCompatible]] hashes:
+            The transaction hashes, in the same order as ``trytes``, if
+            they are already known (e.g., the hashes that were passed to
+            ``getTrytes``).
 
-                attachment_timestamp_lower_bound=int_from_trits(
-                        tryte_string[2628:2637].as_trits()),
+            If provided, the hashes are not computed.
 
-                attachment_timestamp_upper_bound=int_from_trits(
-                        tryte_string[2637:2646].as_trits()),
+        :param Optional[Executor] executor:
+            If provided, the transaction hashes are computed up front,
+            in batches, and each batch is a separate job in this
+            executor.
 
-                nonce=Nonce(tryte_string[2646:2673]),
-        )
+            Pass a :py:class:`concurrent.futures.ProcessPoolExecutor` to
+            compute hashes in parallel.
+
+        :param float verify_hashes:
+            Fraction (between 0 and 1) of ``hashes`` to check against
+            the trytes, chosen at random.  ``True`` checks every hash.
+
+            This gives a cheap integrity check when the hashes come from
+            somewhere else (e.g., a node), without hashing every
+            transaction.
+
+            Ignored if ``hashes`` is not provided.
+
+        :return:
+            List of :py:class:`Transaction` objects, in the same order
+            as ``trytes``.
+
+        :raises ValueError:
+            - if ``verify_hashes`` is not between 0 and 1.
+            - if ``hashes`` has a different length than ``trytes``.
+            - if a hash that was checked doesn't match its trytes.
+
+        Example usage::
+
+            from iota import Transaction
+
+            gt_response = api.get_trytes(hashes)
+
+            txns = Transaction.from_tryte_strings(
+                gt_response['trytes'],
+                hashes=hashes,
+            )
+        """
+        if not 0 <= verify_hashes <= 1:
+            raise with_context(
+                exc=ValueError(
+                    '``verify_hashes`` must be between 0 and 1 '
+                    '(got {verify_hashes}).'.format(
+                        verify_hashes=verify_hashes,
+                    ),
+                ),
+
+                context={
+                    'verify_hashes': verify_hashes,
+                },
+            )
+
+        tryte_strings = [TransactionTrytes(t) for t in trytes]
+
+        if hashes is None:
+            if not executor:
+                transactions = [
+                    cls.from_tryte_string(t) for t in tryte_strings
+                ]
+                _HashGroup(transactions)
+                return transactions
+
+            hashes = _hash_in_batches(tryte_strings, executor)
+        else:
+            hashes = [
+                h if isinstance(h, TransactionHash) else TransactionHash(h)
+                for h in hashes
+            ]
+
+            if len(hashes) != len(tryte_strings):
+                raise with_context(
+                    exc=ValueError(
+                        'Expected {expected} hashes (one for each '
+                        'transaction), but got {actual}.'.format(
+                            expected=len(tryte_strings),
+                            actual=len(hashes),
+                        ),
+                    ),
+
+                    context={
+                        'hashes': hashes,
+                        'trytes': tryte_strings,
+                    },
+                )
+
+            if verify_hashes:
+                indexes = sample(
+                    range(len(tryte_strings)),
+                    ceil(len(tryte_strings) * verify_hashes),
+                )
+
+                actual_hashes = _hash_in_batches(
+                    [tryte_strings[i] for i in indexes],
+                    executor,
+                )
+
+                for i, actual in zip(indexes, actual_hashes):
+                    if actual != hashes[i]:
+                        raise with_context(
+                            exc=ValueError(
+                                'Transaction {i} has hash {actual}, '
+                                'expected {expected}.'.format(
+                                    i=i,
+                                    actual=actual,
+                                    expected=hashes[i],
+                                ),
+                            ),
+
+                            context={
+                                'trytes': tryte_strings[i],
+                                'expected_hash': hashes[i],
+                                'actual_hash': actual,
+                            },
+                        )
+
+        return [
+            cls.from_tryte_string(t, hash_)
+            for t, hash_ in zip(tryte_strings, hashes)
+        ]
 
     def __init__(
             self,
@@ -418,7 +732,7 @@ class Transaction(JsonSerializable):
         :py:attr:`value`.
         """
         # Note that we are padding to 81 *trits*.
-        return TryteString.from_trits(trits_from_int(self.value, pad=81))
+        return TryteString.from_trits(trits_from_int_fixed(self.value, 81))
 
     @property
     def timestamp_as_trytes(self) -> TryteString:
@@ -427,7 +741,7 @@ class Transaction(JsonSerializable):
         :py:attr:`timestamp`.
         """
         # Note that we are padding to 27 *trits*.
-        return TryteString.from_trits(trits_from_int(self.timestamp, pad=27))
+        return TryteString.from_trits(trits_from_int_fixed(self.timestamp, 27))
 
     @property
     def current_index_as_trytes(self) -> TryteString:
@@ -437,7 +751,7 @@ class Transaction(JsonSerializable):
         """
         # Note that we are padding to 27 *trits*.
         return TryteString.from_trits(
-                trits_from_int(self.current_index, pad=27),
+                trits_from_int_fixed(self.current_index, 27),
         )
 
     @property
@@ -447,7 +761,7 @@ class Transaction(JsonSerializable):
         :py:attr:`last_index`.
         """
         # Note that we are padding to 27 *trits*.
-        return TryteString.from_trits(trits_from_int(self.last_index, pad=27))
+        return TryteString.from_trits(trits_from_int_fixed(self.last_index, 27))
 
     @property
     def attachment_timestamp_as_trytes(self) -> TryteString:
@@ -457,7 +771,7 @@ class Transaction(JsonSerializable):
         """
         # Note that we are padding to 27 *trits*.
         return TryteString.from_trits(
-                trits_from_int(self.attachment_timestamp, pad=27),
+                trits_from_int_fixed(self.attachment_timestamp, 27),
         )
 
     @property
@@ -468,7 +782,7 @@ class Transaction(JsonSerializable):
         """
         # Note that we are padding to 27 *trits*.
         return TryteString.from_trits(
-                trits_from_int(self.attachment_timestamp_lower_bound, pad=27),
+                trits_from_int_fixed(self.attachment_timestamp_lower_bound, 27),
         )
 
     @property
@@ -479,7 +793,7 @@ class Transaction(JsonSerializable):
         """
         # Note that we are padding to 27 *trits*.
         return TryteString.from_trits(
-                trits_from_int(self.attachment_timestamp_upper_bound, pad=27),
+                trits_from_int_fixed(self.attachment_timestamp_upper_bound, 27),
         )
 
     def as_json_compatible(self) -> dict:
@@ -540,26 +854,69 @@ class Transaction(JsonSerializable):
         """
         Returns a TryteString representation of the transaction.
 
+        The result is cached until one of the transaction's attributes is
+        changed.  For transactions that were created from trytes, this
+        returns the original trytes.
+
         :return:
             :py:class:`TryteString` object.
         """
-        return TransactionTrytes(
-                self.signature_message_fragment
-                + self.address.address
-                + self.value_as_trytes
-                + self.legacy_tag
-                + self.timestamp_as_trytes
-                + self.current_index_as_trytes
-                + self.last_index_as_trytes
-                + self.bundle_hash
-                + self.trunk_transaction_hash
-                + self.branch_transaction_hash
-                + self.tag
-                + self.attachment_timestamp_as_trytes
-                + self.attachment_timestamp_lower_bound_as_trytes
-                + self.attachment_timestamp_upper_bound_as_trytes
-                + self.nonce
-        )
+        trytes = getattr(self, '_cached_trytes', None)
+
+        if (trytes is None) or self._is_modified_in_place(trytes):
+            trytes = TransactionTrytes(
+                    self.signature_message_fragment
+                    + self.address.address
+                    + self.value_as_trytes
+                    + self.legacy_tag
+                    + self.timestamp_as_trytes
+                    + self.current_index_as_trytes
+                    + self.last_index_as_trytes
+                    + self.bundle_hash
+                    + self.trunk_transaction_hash
+                    + self.branch_transaction_hash
+                    + self.tag
+                    + self.attachment_timestamp_as_trytes
+                    + self.attachment_timestamp_lower_bound_as_trytes
+                    + self.attachment_timestamp_upper_bound_as_trytes
+                    + self.nonce
+            )
+
+            self._cached_trytes = trytes
+
+        # Return a copy-on-write view, so that modifying the result
+        # doesn't affect the cache.
+        return TransactionTrytes(trytes)
+
+    def _is_modified_in_place(self, trytes: TransactionTrytes) -> bool:
+        """
+        Checks whether any attribute that is part of ``trytes`` was
+        modified in place (e.g., ``txn.tag[0:3] = b'ABC'``) since
+        ``trytes`` was cached.
+
+        Assigning an attribute already clears the cache; this catches
+        changes that don't go through the attribute.
+        """
+        buffer = trytes._buffer
+
+        for field in _TRYTE_FIELDS:
+            try:
+                value = getattr(self, field.slot)
+            except AttributeError:
+                # Not decoded yet, so it still matches the raw trytes.
+                continue
+
+            # Compare the trytes that :py:meth:`as_tryte_string` would
+            # use for this attribute.
+            if field is Transaction.address:
+                value = value.address
+            elif field is Transaction._legacy_tag:
+                value = self.legacy_tag
+
+            if buffer[field.start:field.stop] != value._buffer:
+                return True
+
+        return False
 
     def get_bundle_essence_trytes(self) -> TryteString:
         """
@@ -590,6 +947,61 @@ class Transaction(JsonSerializable):
                 + self.last_index_as_trytes
         )
 
+    def get_bundle_essence_trits(self) -> List[int]:
+        """
+        Returns the trits of :py:meth:`get_bundle_essence_trytes`.
+
+        The trits that don't depend on the transaction's position in the
+        bundle (i.e., everything except ``current_index`` and
+        ``last_index``) are cached until one of the corresponding
+        attributes is changed.
+
+        :return:
+            ``List[int]``
+        """
+        return (
+                self._get_essence_prefix_trits()
+                + trits_from_int_fixed(self.current_index, 27)
+                + trits_from_int_fixed(self.last_index, 27)
+        )
+
+    def _get_essence_prefix_trits(self) -> List[int]:
+        """
+        Returns the trits of the ``address``, ``value``, ``legacy_tag``
+        and ``timestamp`` fields (the part of the bundle essence that
+        doesn't depend on the transaction's position in the bundle).
+
+        .. important::
+            The result is cached; don't modify it.
+        """
+        address = self.address.address
+        legacy_tag = self.legacy_tag
+
+        # The address and tags can be modified in place, without going
+        # through the attributes, so check that they still match.
+        cached = getattr(self, '_cached_essence_trits', None)
+        if (
+                (cached is not None) and
+                (cached[0] == address._buffer) and
+                (cached[1] == legacy_tag._buffer)
+        ):
+            return cached[2]
+
+        trits = (
+                address.as_trits()
+                + trits_from_int_fixed(self.value, 81)
+                + legacy_tag.as_trits()
+                + trits_from_int_fixed(self.timestamp, 27)
+        )
+
+        self._cached_essence_trits = (
+            bytes(address._buffer),
+            bytes(legacy_tag._buffer),
+            trits,
+        )
+
+        return trits
+
     @property
     def legacy_tag(self) -> Tag:
         """
@@ -599,6 +1011,109 @@ class Transaction(JsonSerializable):
         return self._legacy_tag or self.tag
 
 
+_TRYTE_FIELDS: List[_TransactionField] = [
+    field
+    for field in vars(Transaction).values()
+    if isinstance(field, _TransactionField)
+    and field.serialized
+    and field.decode is not _int_from_trytes
+]
+"""
+:py:class:`Transaction` attributes that are serialized as trytes, and
+so can be modified in place.
+"""
+
+
+HASH_BATCH_SIZE = 512
+"""
+Number of transactions that :py:meth:`Transaction.from_tryte_strings`
+hashes at a time.
+
+Larger batches are hashed faster (per transaction), but the trits of
+every transaction in a batch are held in memory at the same time.
+"""
+
+
+HASH_MANY_MIN_LANES: Dict[str, int] = {
+    'iota.crypto.pycurl': 3,
+    'iota.crypto.npcurl': 40,
+}
+"""
+Minimum number of transactions that :py:func:`_hash_transaction_trytes`
+hashes with :py:meth:`iota.crypto.pycurl.Curl.hash_many`, keyed by the
+module of the active Curl implementation.
+
+A bit-sliced transform costs about the same regardless of how many
+sponges it transforms, so for fewer transactions it is faster to hash
+them one at a time with the active implementation.
+
+Other implementations (e.g., the C extension) are always faster one
+transaction at a time.
+"""
+
+
+def _hash_in_batches(
+        tryte_strings: Sequence[TransactionTrytes],
+        executor: Optional[Executor],
+) -> List[TransactionHash]:
+    """
+    Computes transaction hashes :py:data:`HASH_BATCH_SIZE` at a time,
+    optionally running each batch as a separate job in an executor.
+    """
+    batches = [
+        tryte_strings[i:i + HASH_BATCH_SIZE]
+        for i in range(0, len(tryte_strings), HASH_BATCH_SIZE)
+    ]
+
+    if executor:
+        return list(chain.from_iterable(
+            executor.map(_hash_transaction_trytes, batches),
+        ))
+
+    return list(chain.from_iterable(map(_hash_transaction_trytes, batches)))
+
+
+def _hash_transaction_trytes(
+        tryte_strings: Sequence[TransactionTrytes]
+) -> List[TransactionHash]:
+    """
+    Computes the hashes of several transactions at once.
+
+    Defined at the module level so that it can be invoked in a worker
+    process.
+
+    If there are enough transactions (see :py:data:`HASH_MANY_MIN_LANES`),
+    uses :py:meth:`iota.crypto.pycurl.Curl.hash_many` to transform all of
+    the sponges in a single pass (this applies to the NumPy
+    implementation as well as the pure-Python one).  Otherwise, the
+    transactions are hashed one at a time.
+    """
+    trits = [t.as_trits() for t in tryte_strings]
+
+    min_lanes = HASH_MANY_MIN_LANES.get(Curl.__module__)
+
+    if min_lanes is not None and len(trits) >= min_lanes:
+        return [
+            TransactionHash.from_trits(h)
+            for h in PyCurl.hash_many(trits)
+        ]
+
+    return [_hash_transaction_trits(t) for t in trits]
+
+
+def _hash_transaction_trits(trits: Sequence[int]) -> TransactionHash:
+    """
+    Computes the hash of a single transaction.
+    """
+    hash_trits: MutableSequence[int] = [0] * HASH_LENGTH
+
+    sponge = Curl()
+    sponge.absorb(trits)
+    sponge.squeeze(hash_trits)
+
+    return TransactionHash.from_trits(hash_trits)
+
+
 B = TypeVar('B', bound='Bundle')
 
 
@@ -631,7 +1146,7 @@ class Bundle(JsonSerializable, Sequence[Transaction]):
         Creates a Bundle object from a list of tryte values.
 
         Note, that this is effectively calling
-        :py:meth:`Transaction.from_tryte_string` on the iterbale elements and
+        :py:meth:`Transaction.from_tryte_strings` on the iterable and
         constructing the bundle from the created transactions.
 
         :param Iterable[TryteString] trytes:
@@ -650,7 +1165,7 @@ class Bundle(JsonSerializable, Sequence[Transaction]):
             ])
 
         """
-        return cls(map(Transaction.from_tryte_string, trytes))
+        return cls(Transaction.from_tryte_strings(trytes))
 
     def __init__(
             self,
@@ -1,14 +1,19 @@
-from typing import Iterable, Iterator, List, Optional, Sequence
+from concurrent.futures import Executor
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
 
 from iota.crypto import HASH_LENGTH
 from iota.crypto.kerl import Kerl
-from iota.crypto.signing import KeyGenerator, normalize
-from iota.crypto.types import PrivateKey
+from iota.crypto.signing import (
+    KeyGenerator,
+    SignatureFragmentGenerator,
+    normalize,
+)
+from iota.crypto.types import PrivateKey, Seed, _get_input_transactions
 from iota.exceptions import with_context
 from iota.transaction.base import Bundle, Transaction
 from iota.transaction.types import BundleHash, Fragment, Nonce, TransactionHash
 from iota.transaction.utils import get_current_timestamp
-from iota.trits import add_trits
+from iota.trits import increment_trits
 from iota.types import Address, Tag, TryteString
 
 __all__ = [
@@ -144,9 +149,10 @@ class ProposedTransaction(Transaction):
 
         - https://github.com/iotaledger/iota.py/issues/84
         """
-        self._legacy_tag = (
-            Tag.from_trits(add_trits(self.legacy_tag.as_trits(), [1]))
-        )
+        trits = self.legacy_tag.as_trits()
+        increment_trits(trits)
+
+        self._legacy_tag = Tag.from_trits(trits)
 
 
 Transfer = ProposedTransaction
@@ -295,7 +301,7 @@ class ProposedBundle(Bundle, Sequence[ProposedTransaction]):
         if transaction.value < 0:
             raise ValueError('Use ``add_inputs`` to add inputs to the bundle.')
 
-        self._transactions.append(ProposedTransaction(
+        self._append_transaction(ProposedTransaction(
             address=transaction.address,
             value=transaction.value,
             tag=transaction.tag,
@@ -308,7 +314,7 @@ class ProposedBundle(Bundle, Sequence[ProposedTransaction]):
         # fit.
         fragment = transaction.message[Fragment.LEN:]
         while fragment:
-            self._transactions.append(ProposedTransaction(
+            self._append_transaction(ProposedTransaction(
                 address=transaction.address,
                 value=0,
                 tag=transaction.tag,
@@ -444,16 +450,29 @@ class ProposedBundle(Bundle, Sequence[ProposedTransaction]):
                 ),
             )
 
+        last_index = len(self) - 1
+
+        for i, txn in enumerate(self):
+            txn.current_index = i
+            txn.last_index = last_index
+
+        # Most of each transaction's essence was computed when it was
+        # added to the bundle; only the indexes need to be appended.
+        essence_trits: List[int] = []
+        for txn in self:
+            essence_trits += txn.get_bundle_essence_trits()
+
+        # If the bundle hash is insecure, we will increment the tail
+        # transaction's legacy tag and try again.  The essence of every
+        # other transaction stays the same, so we only need to replace
+        # the tail transaction's part of the buffer.
+        tail_transaction: ProposedTransaction = self.tail_transaction
+        tail_length = len(tail_transaction.get_bundle_essence_trits())
+
         # Generate bundle hash.
         while True:
             sponge = Kerl()
-            last_index = len(self) - 1
-
-            for i, txn in enumerate(self):
-                txn.current_index = i
-                txn.last_index = last_index
-
-                sponge.absorb(txn.get_bundle_essence_trytes().as_trits())
+            sponge.absorb(essence_trits)
 
             bundle_hash_trits = [0] * HASH_LENGTH
             sponge.squeeze(bundle_hash_trits)
@@ -464,10 +483,10 @@ class ProposedBundle(Bundle, Sequence[ProposedTransaction]):
             # https://github.com/iotaledger/iota.py/issues/84
             if any(13 in part for part in normalize(bundle_hash)):
                 # Increment the legacy tag and try again.
-                tail_transaction: ProposedTransaction = (
-                    self.tail_transaction
-                )
                 tail_transaction.increment_legacy_tag()
+
+                essence_trits[:tail_length] = \
+                    tail_transaction.get_bundle_essence_trits()
             else:
                 break
 
@@ -478,7 +497,11 @@ class ProposedBundle(Bundle, Sequence[ProposedTransaction]):
             # Initialize signature/message fragment.
             txn.signature_message_fragment = Fragment(txn.message or b'')
 
-    def sign_inputs(self, key_generator: KeyGenerator) -> None:
+    def sign_inputs(
+            self,
+            key_generator: KeyGenerator,
+            executor: Optional[Executor] = None,
+    ) -> None:
         """
         Sign inputs in a finalized bundle.
 
@@ -492,6 +515,18 @@ class ProposedBundle(Bundle, Sequence[ProposedTransaction]):
         :param KeyGenerator key_generator:
             Generator to create private keys for signing.
 
+        :param Optional[Executor] executor:
+            If provided, the private key and signature fragments for
+            each input are generated as a separate job in this executor.
+            The signatures are still applied to the bundle in order.
+
+            Pass a :py:class:`concurrent.futures.ProcessPoolExecutor` to
+            sign several inputs in parallel.
+
+            .. important::
+                The seed is sent to each job, so only use an executor
+                that runs on the local machine.
+
         :raises RuntimeError: if bundle is not yet finalized.
         :raises ValueError:
             - if the input transaction specifies an address that doesn't have
@@ -502,6 +537,46 @@ class ProposedBundle(Bundle, Sequence[ProposedTransaction]):
         if not self.hash:
             raise RuntimeError('Cannot sign inputs until bundle is finalized.')
 
+        inputs = self._get_inputs_to_sign()
+
+        if executor:
+            # Check all of the inputs before submitting any jobs.
+            for start_index, addy in inputs:
+                _get_input_transactions(
+                    self,
+                    start_index,
+                    addy.security_level,
+                    addy.key_index,
+                )
+
+            signatures = executor.map(
+                _generate_signature_fragments,
+                [key_generator.seed] * len(inputs),
+                [addy for _, addy in inputs],
+                [self.hash] * len(inputs),
+            )
+
+            for (start_index, _), fragments in zip(inputs, signatures):
+                for j, fragment in enumerate(fragments):
+                    self[start_index + j].signature_message_fragment = fragment
+        else:
+            for start_index, addy in inputs:
+                self.sign_input_at(
+                    start_index,
+                    key_generator.get_key_for(addy),
+                )
+
+    def _get_inputs_to_sign(self) -> List[Tuple[int, Address]]:
+        """
+        Returns the index of the first transaction and the address of
+        each input in the bundle.
+
+        :raises ValueError:
+            if an input address doesn't have ``key_index`` or
+            ``security_level`` defined.
+        """
+        inputs = []
+
         # Use a counter for the loop so that we can skip ahead as we go.
         i = 0
         while i < len(self):
@@ -540,7 +615,7 @@ class ProposedBundle(Bundle, Sequence[ProposedTransaction]):
                         },
                     )
 
-                self.sign_input_at(i, key_generator.get_key_for(txn.address))
+                inputs.append((i, txn.address))
 
                 i += txn.address.security_level
             else:
@@ -548,6 +623,8 @@ class ProposedBundle(Bundle, Sequence[ProposedTransaction]):
                 # cases); skip this transaction.
                 i += 1
 
+        return inputs
+
     def sign_input_at(
             self,
             start_index: int,
@@ -579,6 +656,17 @@ class ProposedBundle(Bundle, Sequence[ProposedTransaction]):
 
         private_key.sign_input_transactions(self, start_index)
 
+    def _append_transaction(self, transaction: ProposedTransaction) -> None:
+        """
+        Appends a transaction to the bundle.
+
+        The part of the transaction's bundle essence that doesn't depend
+        on its position in the bundle is computed now, so that
+        :py:meth:`finalize` doesn't have to.
+        """
+        transaction._get_essence_prefix_trits()
+        self._transactions.append(transaction)
+
     def _create_input_transactions(self, addy: Address) -> None:
         """
         Creates transactions for the specified input address.
@@ -586,7 +674,7 @@ class ProposedBundle(Bundle, Sequence[ProposedTransaction]):
         :param Address addy:
             Input address.
         """
-        self._transactions.append(ProposedTransaction(
+        self._append_transaction(ProposedTransaction(
             address=addy,
             tag=self.tag,
 
@@ -599,7 +687,7 @@ class ProposedBundle(Bundle, Sequence[ProposedTransaction]):
         # transaction length limit.
         # Subtract 1 to account for the transaction we just added.
         for _ in range(addy.security_level - 1):
-            self._transactions.append(ProposedTransaction(
+            self._append_transaction(ProposedTransaction(
                 address=addy,
                 tag=self.tag,
 
@@ -680,3 +768,20 @@ class ProposedBundle(Bundle, Sequence[ProposedTransaction]):
             # field. This will be put into signature_message_fragment upon
             # finalization.
             self._transactions[start_index + i].message = fragments[i]
+
+
+def _generate_signature_fragments(
+        seed: Seed,
+        address: Address,
+        bundle_hash: BundleHash,
+) -> List[TryteString]:
+    """
+    Generates the private key for an input address and uses it to sign
+    a bundle hash.
+
+    This is a module-level function so that it can be sent to a
+    :py:class:`concurrent.futures.ProcessPoolExecutor`.
+    """
+    private_key = KeyGenerator(seed).get_key_for(address)
+
+    return list(SignatureFragmentGenerator(private_key, bundle_hash))
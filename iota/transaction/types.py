@@ -40,7 +40,7 @@ class Fragment(TryteString):
     def __init__(self, trytes: TrytesCompatible) -> None:
         super(Fragment, self).__init__(trytes, pad=self.LEN)
 
-        if len(self._trytes) > self.LEN:
+        if len(self) > self.LEN:
             raise with_context(
                 exc=ValueError('{cls} values must be {len} trytes long.'.format(
                     cls=type(self).__name__,
@@ -67,7 +67,7 @@ class TransactionTrytes(TryteString):
     def __init__(self, trytes: TrytesCompatible) -> None:
         super(TransactionTrytes, self).__init__(trytes, pad=self.LEN)
 
-        if len(self._trytes) > self.LEN:
+        if len(self) > self.LEN:
             raise with_context(
                 exc=ValueError('{cls} values must be {len} trytes long.'.format(
                     cls=type(self).__name__,
@@ -94,7 +94,7 @@ class Nonce(TryteString):
     def __init__(self, trytes: TrytesCompatible) -> None:
         super(Nonce, self).__init__(trytes, pad=self.LEN)
 
-        if len(self._trytes) > self.LEN:
+        if len(self) > self.LEN:
             raise with_context(
                 exc=ValueError('{cls} values must be {len} trytes long.'.format(
                     cls=type(self).__name__,
@@ -1,11 +1,18 @@
 from calendar import timegm as unix_timestamp
+from codecs import getincrementaldecoder, getincrementalencoder
 from datetime import datetime
+from io import DEFAULT_BUFFER_SIZE
+from typing import BinaryIO, Generator, Iterable, Iterator
 
-from iota import STANDARD_UNITS
+from iota import STANDARD_UNITS, AsciiTrytesCodec, TryteString
 from iota.exceptions import with_context
+from iota.transaction.types import Fragment
 
 __all__ = [
     'convert_value_to_standard_unit',
+    'decode_fragments',
+    'encode_fragments',
+    'encode_fragments_async',
     'get_current_timestamp',
 ]
 
@@ -68,3 +75,154 @@ def get_current_timestamp() -> int:
     # old-fashioned way.
     # http://stackoverflow.com/q/2775864/
     return unix_timestamp(datetime.utcnow().timetuple())
+
+
+def encode_fragments(
+        stream: BinaryIO,
+        chunk_size: int = DEFAULT_BUFFER_SIZE,
+) -> Generator[Fragment, None, None]:
+    """
+    Encodes bytes read from a file-like object into trytes, and
+    generates them one :py:class:`Fragment` at a time.
+
+    Equivalent to splitting ``TryteString.from_bytes(stream.read())``
+    into fragments, except that only ``chunk_size`` bytes (plus part of
+    a fragment) are held in memory at any time.
+
+    The final fragment is padded with ``9`` trytes.
+
+    :param stream:
+        File-like object opened in binary mode.
+
+    :param chunk_size:
+        Number of bytes to read from ``stream`` at a time.
+
+    :return:
+        Generator of :py:class:`Fragment` objects, e.g. to use as the
+        messages of :py:class:`iota.ProposedTransaction` objects.
+    """
+    encoder = getincrementalencoder(AsciiTrytesCodec.name)()
+    buffer = bytearray()
+
+    while True:
+        data = stream.read(chunk_size)
+
+        if not data:
+            break
+
+        buffer += encoder.encode(data)
+        yield from _pop_fragments(buffer)
+
+    if buffer:
+        yield Fragment(buffer)
+
+
+async def encode_fragments_async(
+        stream,
+        chunk_size: int = DEFAULT_BUFFER_SIZE,
+        # 'typing' only supports AsyncGenerator from python 3.6.1, so put
+        # it as string literal here.
+) -> 'AsyncGenerator[Fragment, None]':
+    """
+    Same as :py:func:`encode_fragments`, except that it reads from an
+    asynchronous stream (any object with a coroutine ``read(n)`` method,
+    e.g. :py:class:`asyncio.StreamReader`).
+
+    .. important::
+        This is an async generator!
+    """
+    encoder = getincrementalencoder(AsciiTrytesCodec.name)()
+    buffer = bytearray()
+
+    while True:
+        data = await stream.read(chunk_size)
+
+        if not data:
+            break
+
+        buffer += encoder.encode(data)
+
+        for fragment in _pop_fragments(buffer):
+            yield fragment
+
+    if buffer:
+        yield Fragment(buffer)
+
+
+def decode_fragments(
+        fragments: Iterable[TryteString],
+        errors: str = 'strict',
+        strip_padding: bool = True,
+) -> Generator[bytes, None, None]:
+    """
+    Decodes a sequence of fragments (e.g., the messages of the
+    transactions in a bundle) into bytes, one piece at a time.
+
+    Produces the same bytes as concatenating the fragments and calling
+    :py:meth:`TryteString.decode` on the result (before the UTF-8 step),
+    except that the fragments are decoded as they are consumed.
+
+    :param fragments:
+        Fragments (or any TryteStrings) to decode.
+
+    :param errors:
+        How to handle trytes that can't be decoded (see
+        :py:meth:`TryteString.decode`).
+
+    :param strip_padding:
+        Whether to strip trailing null trytes from the end of the
+        sequence.
+
+    :return:
+        Generator of ``bytes``.
+    """
+    decoder = getincrementaldecoder(AsciiTrytesCodec.name)(errors)
+
+    # Number of trytes passed to the decoder so far.
+    decoded_length = 0
+
+    # Number of trailing 9s held back, in case they turn out to be
+    # padding at the end of the sequence.
+    padding = 0
+
+    for fragment in fragments:
+        trytes = bytes(fragment)
+
+        if strip_padding:
+            stripped = trytes.rstrip(b'9')
+
+            if not stripped:
+                padding += len(trytes)
+                continue
+
+            trytes = b'9' * padding + stripped
+            padding = len(fragment) - len(stripped)
+
+        decoded_length += len(trytes)
+
+        decoded = decoder.decode(trytes)
+        if decoded:
+            yield decoded
+
+    # If we stripped any padding, put one back to preserve even length
+    # for ASCII codec.
+    decoded = decoder.decode(
+        b'9' * (decoded_length % 2 if padding else 0),
+        final=True,
+    )
+
+    if decoded:
+        yield decoded
+
+
+def _pop_fragments(buffer: bytearray) -> Iterator[Fragment]:
+    """
+    Removes every complete fragment from the start of ``buffer``.
+    """
+    offset = 0
+
+    while len(buffer) - offset >= Fragment.LEN:
+        yield Fragment(buffer[offset:offset + Fragment.LEN])
+        offset += Fragment.LEN
+
+    del buffer[:offset]
@@ -1,4 +1,13 @@
-from typing import Generator, List, Optional, Type
+from asyncio import AbstractEventLoop, FIRST_COMPLETED, Future, gather, \
+    wait
+from concurrent.futures import Executor
+from typing import Generator, Iterable, List, Optional, Type
+
+try:
+    from asyncio import get_running_loop
+except ImportError:
+    # Python 3.6; inside a coroutine, this returns the running loop.
+    from asyncio import get_event_loop as get_running_loop
 
 from iota.crypto.kerl import Kerl
 from iota.crypto.signing import validate_signature_fragments
@@ -6,6 +15,7 @@ from iota.transaction.base import Bundle, Transaction
 
 __all__ = [
     'BundleValidator',
+    'validate_bundles',
 ]
 
 # In very rare cases, the IOTA protocol may switch hash algorithms.
@@ -66,6 +76,40 @@ class BundleValidator(object):
         # over inputs.
         grouped_transactions = self.bundle.group_transactions()
 
+        # Check indices and balance first.
+        for error in self._get_transaction_errors(grouped_transactions):
+            yield error
+
+        # Signature validation is only meaningful if the transactions
+        # are otherwise valid.
+        if not self._errors:
+            signature_validation_queue: List[List[Transaction]] = []
+
+            for error in self._get_input_errors(
+                    grouped_transactions,
+                    signature_validation_queue,
+            ):
+                yield error
+
+            # Once we've finished checking the attributes from each
+            # transaction in the bundle, go back and validate
+            # signatures.
+            if signature_validation_queue:
+                # ``yield from`` is an option here, but for
+                # compatibility with Python 2 clients, we will do it the
+                # old-fashioned way.
+                for error in self._get_bundle_signature_errors(
+                        signature_validation_queue
+                ):
+                    yield error
+
+    def _get_transaction_errors(
+            self,
+            grouped_transactions: List[List[Transaction]],
+    ) -> Generator[str, None, None]:
+        """
+        Checks the bundle hash, indices and balance of the bundle.
+        """
         # Define a few expected values.
         bundle_hash = self.bundle.hash
         last_index = len(self.bundle) - 1
@@ -73,7 +117,6 @@ class BundleValidator(object):
         # Track a few others as we go along.
         balance = 0
 
-        # Check indices and balance first.
         # Note that we use a counter to keep track of the current index,
         # since at this point we can't trust that the transactions have
         # correct ``current_index`` values.
@@ -117,65 +160,58 @@ class BundleValidator(object):
                 )
             )
 
-        # Signature validation is only meaningful if the transactions
-        # are otherwise valid.
-        if not self._errors:
-            signature_validation_queue: List[List[Transaction]] = []
-
-            for group in grouped_transactions:
-                # Signature validation only applies to inputs.
-                if group[0].value >= 0:
-                    continue
-
-                validate_group_signature = True
-                for j, txn in enumerate(group):
-                    if (j > 0) and (txn.value != 0):
-                        # Input is malformed; signature fragments after
-                        # the first should have zero value.
-                        yield (
-                            'Transaction {i} has invalid value '
-                            '(expected 0, actual {actual}).'.format(
-                                actual=txn.value,
-
-                                # If we get to this point, we know that
-                                # the ``current_index`` value for each
-                                # transaction can be trusted.
-                                i=txn.current_index,
-                            )
+    @staticmethod
+    def _get_input_errors(
+            grouped_transactions: List[List[Transaction]],
+            signature_validation_queue: List[List[Transaction]],
+    ) -> Generator[str, None, None]:
+        """
+        Checks the transactions that make up each input, and adds the
+        groups of transactions whose signatures should be validated to
+        ``signature_validation_queue``.
+        """
+        for group in grouped_transactions:
+            # Signature validation only applies to inputs.
+            if group[0].value >= 0:
+                continue
+
+            validate_group_signature = True
+            for j, txn in enumerate(group):
+                if (j > 0) and (txn.value != 0):
+                    # Input is malformed; signature fragments after the
+                    # first should have zero value.
+                    yield (
+                        'Transaction {i} has invalid value '
+                        '(expected 0, actual {actual}).'.format(
+                            actual=txn.value,
+
+                            # If we get to this point, we know that the
+                            # ``current_index`` value for each
+                            # transaction can be trusted.
+                            i=txn.current_index,
                         )
+                    )
 
-                        # We won't be able to validate the signature,
-                        # but continue anyway, so that we can check that
-                        # the other transactions in the group have the
-                        # correct ``value``.
-                        validate_group_signature = False
-                        continue
-
-                # After collecting the signature fragment from each
-                # transaction in the group, queue them up to run through
-                # the validator.
-                #
-                # We have to perform signature validation separately so
-                # that we can try different algorithms (for
-                # backwards-compatibility).
-                #
-                # References:
-                #
-                # - https://github.com/iotaledger/kerl#kerl-integration-in-iota
-                if validate_group_signature:
-                    signature_validation_queue.append(group)
+                    # We won't be able to validate the signature, but
+                    # continue anyway, so that we can check that the
+                    # other transactions in the group have the correct
+                    # ``value``.
+                    validate_group_signature = False
+                    continue
 
-            # Once we've finished checking the attributes from each
-            # transaction in the bundle, go back and validate
-            # signatures.
-            if signature_validation_queue:
-                # ``yield from`` is an option here, but for
-                # compatibility with Python 2 clients, we will do it the
-                # old-fashioned way.
-                for error in self._get_bundle_signature_errors(
-                        signature_validation_queue
-                ):
-                    yield error
+            # After collecting the signature fragment from each
+            # transaction in the group, queue them up to run through the
+            # validator.
+            #
+            # We have to perform signature validation separately so that
+            # we can try different algorithms (for
+            # backwards-compatibility).
+            #
+            # References:
+            #
+            # - https://github.com/iotaledger/kerl#kerl-integration-in-iota
+            if validate_group_signature:
+                signature_validation_queue.append(group)
 
     def _get_bundle_signature_errors(
             self,
@@ -261,3 +297,209 @@ class BundleValidator(object):
                 i=group[0].current_index,
             )
         )
+
+
+async def validate_bundles(
+        bundles: Iterable[Bundle],
+        executor: Optional[Executor] = None,
+        first_error_only: bool = False,
+) -> List[List[str]]:
+    """
+    Validates multiple bundles, checking signatures in an executor so
+    that the event loop is not blocked while the (CPU-intensive) work is
+    being done.
+
+    :param bundles:
+        The bundles to validate.
+
+    :param executor:
+        The executor used to validate the signatures.
+
+        Each input's signature is validated as a separate job, so if you
+        pass a :py:class:`concurrent.futures.ProcessPoolExecutor`, the
+        signatures will be validated in parallel, even within a single
+        bundle.
+
+        If not specified, the event loop's default executor is used.
+
+    :param first_error_only:
+        If ``True``, only the first error is returned for each bundle
+        (same as :py:meth:`BundleValidator.is_valid`).
+
+        As soon as one of a bundle's signatures fails validation, the
+        jobs that validate its remaining signatures are cancelled.
+
+        Use this if you only need to know whether each bundle is valid.
+
+    :return:
+        List of error messages for each bundle, in the same order as
+        ``bundles``.  If a bundle's list is empty, the bundle is valid.
+    """
+    loop = get_running_loop()
+
+    errors: List[List[str]] = []
+    signature_groups: List[List[List[Transaction]]] = []
+
+    # The other checks are cheap, so we can do them right away, and
+    # only send signatures that need to be validated to the executor.
+    for bundle in bundles:
+        validator = BundleValidator(bundle)
+        grouped_transactions = bundle.group_transactions()
+
+        bundle_errors = list(
+            validator._get_transaction_errors(grouped_transactions),
+        )
+
+        groups: List[List[Transaction]] = []
+
+        # Same as :py:meth:`BundleValidator._create_validator`;
+        # signature validation is only meaningful if the transactions
+        # are otherwise valid.
+        if not bundle_errors:
+            bundle_errors.extend(
+                validator._get_input_errors(grouped_transactions, groups),
+            )
+
+        if first_error_only and bundle_errors:
+            del bundle_errors[1:]
+            groups = []
+
+        errors.append(bundle_errors)
+        signature_groups.append(groups)
+
+    signature_errors = await _get_signature_errors(
+        loop,
+        executor,
+        signature_groups,
+        SUPPORTED_SPONGE,
+        first_error_only,
+    )
+
+    # If validation failed, then go back and try with the legacy algo
+    # (only applies if we are currently transitioning to a new algo).
+    if LEGACY_SPONGE:
+        legacy_groups = [
+            groups if group_errors else []
+            for groups, group_errors in zip(signature_groups, signature_errors)
+        ]
+
+        # If the legacy algo fails for any group, there's no point in
+        # continuing.
+        legacy_errors = await _get_signature_errors(
+            loop,
+            executor,
+            legacy_groups,
+            LEGACY_SPONGE,
+            True,
+        )
+
+        for group_errors, groups, legacy_group_errors in zip(
+                signature_errors,
+                legacy_groups,
+                legacy_errors,
+        ):
+            if groups and not legacy_group_errors:
+                group_errors.clear()
+
+    for bundle_errors, group_errors in zip(errors, signature_errors):
+        bundle_errors.extend(group_errors)
+
+        if first_error_only:
+            del bundle_errors[1:]
+
+    return errors
+
+
+async def _get_signature_errors(
+        loop: AbstractEventLoop,
+        executor: Optional[Executor],
+        signature_groups: List[List[List[Transaction]]],
+        sponge_type: Type,
+        first_error_only: bool,
+) -> List[List[str]]:
+    """
+    Validates the signature of each group of transactions (for each
+    bundle) as a separate job in an executor.
+
+    :return:
+        The error messages for each bundle.
+
+        If ``first_error_only`` is ``True``, each list contains at most
+        one error.
+    """
+    return list(await gather(*(
+        _get_bundle_signature_errors(
+            [
+                loop.run_in_executor(
+                    executor,
+                    _get_group_signature_error,
+                    group,
+                    sponge_type,
+                )
+
+                for group in groups
+            ],
+
+            first_error_only,
+        )
+
+        for groups in signature_groups
+    )))
+
+
+async def _get_bundle_signature_errors(
+        futures: List[Future],
+        first_error_only: bool,
+) -> List[str]:
+    """
+    Collects the results of the signature validation jobs for a single
+    bundle.
+
+    If ``first_error_only`` is ``True``, once a job reports an error,
+    the jobs for the groups after it are cancelled; only the jobs for
+    the groups before it (which could still report an earlier error)
+    are waited for.
+    """
+    if not futures:
+        return []
+
+    if not first_error_only:
+        return list(filter(None, await gather(*futures)))
+
+    positions = {future: i for i, future in enumerate(futures)}
+    first_error: Optional[int] = None
+
+    pending = set(futures)
+    while pending:
+        done, pending = await wait(pending, return_when=FIRST_COMPLETED)
+
+        for future in done:
+            if future.result() and (
+                    first_error is None
+                    or positions[future] < first_error
+            ):
+                first_error = positions[future]
+
+        if first_error is not None:
+            for future in futures[first_error + 1:]:
+                future.cancel()
+
+            pending = {f for f in pending if positions[f] < first_error}
+
+    if first_error is None:
+        return []
+
+    return [futures[first_error].result()]
+
+
+def _get_group_signature_error(
+        group: List[Transaction],
+        sponge_type: Type,
+) -> Optional[str]:
+    """
+    Validates the signature of a single group of transactions.
+
+    Defined at the module level so that it can be invoked in a worker
+    process.
+    """
+    return BundleValidator._get_group_signature_error(group, sponge_type)
@@ -5,14 +5,34 @@ Based on
 https://github.com/iotaledger/iota.lib.js/blob/v0.4.2/lib/crypto/helpers/adder.js
 """
 
-from typing import Iterable, List, Optional, Sequence, Tuple
+from operator import mul
+from typing import Iterable, List, MutableSequence, Optional, Sequence
+
+from iota.exceptions import with_context
 
 __all__ = [
     'add_trits',
+    'increment_trits',
     'int_from_trits',
     'trits_from_int',
+    'trits_from_int_fixed',
 ]
 
+_POWERS_OF_3 = [3 ** power for power in range(243)]
+"""
+Place values for up to one hash worth of trits.
+"""
+
+_TRITS_BY_TRYTE_VALUE: List[List[int]] = [
+    # Shift each digit into the range 0..2, then back again.
+    [(v + 1) % 3 - 1, (v + 4) // 3 % 3 - 1, (v + 13) // 9 - 1]
+    for v in (i - 27 if i > 13 else i for i in range(27))
+]
+"""
+Trits for each tryte value (-13 to 13), indexed the same way as a list
+(i.e., ``_TRITS_BY_TRYTE_VALUE[-1]`` is ``[-1, 0, 0]``).
+"""
+
 
 def add_trits(left: Sequence[int], right: Sequence[int]) -> List[int]:
     """
@@ -28,24 +48,61 @@ def add_trits(left: Sequence[int], right: Sequence[int]) -> List[int]:
     """
     target_len = max(len(left), len(right))
 
-    res = [0] * target_len
-    left += [0] * (target_len - len(left))
-    right += [0] * (target_len - len(right))
+    # Add the values as integers, then wrap the result around to fit
+    # in ``target_len`` trits (i.e., discard any carry out of the most
+    # significant trit).
+    modulus = 3 ** target_len
+    offset = modulus // 2
 
-    carry = 0
-    for i in range(len(res)):
-        res[i], carry = _full_add_trits(left[i], right[i], carry)
+    return trits_from_int(
+        (int_from_trits(left) + int_from_trits(right) + offset) % modulus
+        - offset,
 
-    return res
+        pad=target_len,
+    )
+
+
+def increment_trits(trits: MutableSequence[int], n: int = 1) -> None:
+    """
+    Adds an integer value to a sequence of trits, in place.
+
+    This is much faster than :py:func:`add_trits` when ``n`` is small
+    (e.g., when iterating over consecutive key indexes), as it stops as
+    soon as there is nothing left to carry.
+
+    As with :py:func:`add_trits`, any overflow past the end of the
+    sequence is discarded.
+    """
+    carry = n
+
+    for i in range(len(trits)):
+        if not carry:
+            break
+
+        carry, trit = divmod(trits[i] + carry + 1, 3)
+        trits[i] = trit - 1
 
 
 def int_from_trits(trits: Iterable[int]) -> int:
     """
     Converts a sequence of trits into an integer value.
     """
-    # Normally we'd have to wrap ``enumerate`` inside ``reversed``, but
-    # balanced ternary puts least significant digits first.
-    return sum(base * (3 ** power) for power, base in enumerate(trits))
+    # Allow passing a generator or other non-Sized value to this
+    # function.
+    if not isinstance(trits, (list, tuple)):
+        trits = list(trits)
+
+    # Balanced ternary puts least significant digits first, so the
+    # place values line up with the powers of 3 in order.
+    if len(trits) <= len(_POWERS_OF_3):
+        return sum(map(mul, trits, _POWERS_OF_3))
+
+    # Horner's method, starting from the most significant trit.
+    n = 0
+    for trit in reversed(trits):
+        n = n * 3 + trit
+
+    return n
 
 
 def trits_from_int(n: int, pad: Optional[int] = 1) -> List[int]:
@@ -64,58 +121,80 @@ def trits_from_int(n: int, pad: Optional[int] = 1) -> List[int]:
     - https://en.wikipedia.org/wiki/Balanced_ternary
     - https://rosettacode.org/wiki/Balanced_ternary#Python
     """
-    if n == 0:
-        trits = []
-    else:
-        quotient, remainder = divmod(n, 3)
-
-        if remainder == 2:
-            # Lend 1 to the next place so we can make this trit
-            # negative.
-            quotient += 1
-            remainder = -1
+    trits = []
 
-        trits = [remainder] + trits_from_int(quotient, pad=0)
+    # Convert one tryte (3 trits) at a time.
+    while n:
+        n, remainder = divmod(n, 27)
 
-    if pad:
-        trits += [0] * max(0, pad - len(trits))
+        if remainder > 13:
+            # Lend 1 to the next place so we can make this tryte
+            # negative.
+            n += 1
+            remainder -= 27
 
-    return trits
+        trits.extend(_TRITS_BY_TRYTE_VALUE[remainder])
 
+    # The most significant tryte may have leading zero trits.
+    while trits and not trits[-1]:
+        trits.pop()
 
-def _cons_trits(left: int, right: int) -> int:
-    """
-    Compares two trits.  If they have the same value, returns that
-    value.  Otherwise, returns 0.
-    """
-    return left if left == right else 0
+    if pad and len(trits) < pad:
+        trits.extend([0] * (pad - len(trits)))
 
+    return trits
 
-def _add_trits(left: int, right: int) -> int:
-    """
-    Adds two individual trits together.
 
-    The result is always a single trit.
+def trits_from_int_fixed(n: int, width: int) -> List[int]:
     """
-    res = left + right
-    return res if -2 < res < 2 else (res < 0) - (res > 0)
+    Returns a trit representation of an integer value that is exactly
+    ``width`` trits long.
 
+    This is used for fixed-width fields, e.g., the 27-trit timestamp or
+    the 81-trit value of a transaction.
 
-def _any_trits(left: int, right: int) -> int:
-    """
-    Adds two individual trits together and returns a single trit
-    indicating whether the result is positive or negative.
-    """
-    res = left + right
-    return (res > 0) - (res < 0)
+    :param n:
+        Integer value to convert.
 
+    :param width:
+        Number of trits in the result.
 
-def _full_add_trits(left: int, right: int, carry: int) -> Tuple[int, int]:
+    :raises ValueError:
+        if ``n`` can't be represented in ``width`` trits.
     """
-    Adds two trits together, with support for a carry trit.
-    """
-    sum_both = _add_trits(left, right)
-    cons_left = _cons_trits(left, right)
-    cons_right = _cons_trits(sum_both, carry)
+    # Largest magnitude that fits; e.g., 13 for 3 trits.
+    limit = (3 ** width - 1) // 2
+
+    if not -limit <= n <= limit:
+        raise with_context(
+            exc=ValueError(
+                '{n} cannot be represented in {width} trits.'.format(
+                    n=n,
+                    width=width,
+                ),
+            ),
+
+            context={
+                'n': n,
+                'width': width,
+            },
+        )
+
+    # Shift the value so that every digit is in the range 0..2; then
+    # there is no borrowing, and we always emit exactly ``width``
+    # trits.
+    n += limit
+
+    trits = []
+
+    # Convert one tryte (3 trits) at a time.
+    for _ in range(width // 3):
+        n, remainder = divmod(n, 27)
+        trits.extend(_TRITS_BY_TRYTE_VALUE[remainder - 13])
+
+    # Any trits left over that don't make up a whole tryte.
+    for _ in range(width % 3):
+        n, remainder = divmod(n, 3)
+        trits.append(remainder - 1)
 
-    return _add_trits(sum_both, carry), _any_trits(cons_left, cons_right)
+    return trits
@@ -1,11 +1,13 @@
 
+from array import array
 from codecs import decode, encode
-from itertools import chain
+from itertools import zip_longest
 from math import ceil
 from random import SystemRandom
 from typing import Any, AnyStr, Generator, Iterable, Iterator, List, \
-    MutableSequence, Optional, Type, TypeVar, Union, Dict
+    MutableSequence, Optional, Tuple, Type, TypeVar, Union, Dict
 from warnings import warn
+from weakref import WeakKeyDictionary, ref
 
 from iota import AsciiTrytesCodec, TRITS_PER_TRYTE
 from iota.crypto import HASH_LENGTH
@@ -29,6 +31,55 @@ TrytesCompatible = Union[AnyStr, bytearray, 'TryteString']
 T = TypeVar('T', bound='TryteString')
 
 
+def _build_trits_table() -> List[Optional[bytes]]:
+    """
+    Builds the lookup table used by :py:meth:`TryteString.as_trits`.
+
+    The table is indexed by ASCII code; each tryte character maps to its
+    3 trits, packed as signed bytes (so that the result can be loaded
+    directly into an ``array('b')``).
+    """
+    table: List[Optional[bytes]] = [None] * 256
+
+    for n, c in AsciiTrytesCodec.alphabet.items():
+        table[c] = array(
+            'b',
+            trits_from_int((n - 27) if n > 13 else n, pad=TRITS_PER_TRYTE),
+        ).tobytes()
+
+    return table
+
+
+_TRITS_BY_TRYTE = _build_trits_table()
+
+_TRYTES_BY_TRITS: Dict[Tuple[int, int, int], int] = {
+    tuple(array('b', trits)): c
+    for c, trits in enumerate(_TRITS_BY_TRYTE)
+    if trits is not None
+}
+"""
+Inverse of ``_TRITS_BY_TRYTE``; used by :py:meth:`TryteString.from_trits`.
+"""
+
+_VALID_TRYTES = bytes(AsciiTrytesCodec.index)
+"""
+Used with ``bytes.translate`` to strip valid trytes from a sequence, so
+that validation happens in C.
+"""
+
+_interned: Dict[type, WeakKeyDictionary] = {}
+"""
+Registries used by :py:meth:`Hash.intern`, one per type.
+
+Only hashes can be interned; an :py:class:`Address` carries per-object
+attributes (e.g., ``balance``) and its trytes can change in place (e.g.,
+:py:meth:`Address.add_checksum`), which would corrupt the registry.
+
+Each registry maps an instance to a weak reference to itself, so that
+entries are removed automatically once nothing else refers to them.
+"""
+
+
 class TryteString(JsonSerializable):
     """
     A string representation of a sequence of trytes.
@@ -245,6 +296,13 @@ class TryteString(JsonSerializable):
         :param Iterable[int] trits:
             Iterable of trit values (-1, 0, 1).
 
+            This may also be the ``array('b')`` returned by
+            :py:meth:`as_trit_array`, or a ``memoryview`` of one.
+
+            Other values are accepted too: each group of 3 values is
+            converted with :py:func:`int_from_trits`, as in
+            :py:meth:`from_trytes` (e.g., ``[2, 0, 0]`` becomes ``B``).
+
         :param args:
             Additional positional arguments to pass to the initializer.
 
@@ -263,24 +321,36 @@ class TryteString(JsonSerializable):
 
         References:
 
-        - :py:func:`int_from_trits`
         - :py:meth:`as_trits`
-        """
-        # Allow passing a generator or other non-Sized value to this
-        # method.
-        trits = list(trits)
-
-        if len(trits) % 3:
-            # Pad the trits so that it is cleanly divisible into trytes.
-            trits += [0] * (3 - (len(trits) % 3))
+        - :py:meth:`as_trit_array`
+        """
+        if not isinstance(trits, (array, list)):
+            # Allow passing a generator or other non-Sized value to this
+            # method.
+            # NumPy arrays and memoryviews are converted too, so that we
+            # look up native ints below.
+            # Note that ``bytes`` and ``bytearray`` values are unsigned,
+            # so they can't contain -1.
+            trits = trits.tolist() if hasattr(trits, 'tolist') else list(trits)
+
+        # Split the trits into trytes, padding the last one if the trits
+        # aren't cleanly divisible into trytes.
+        def split_trytes():
+            return zip_longest(
+                trits[0::TRITS_PER_TRYTE],
+                trits[1::TRITS_PER_TRYTE],
+                trits[2::TRITS_PER_TRYTE],
+                fillvalue=0,
+            )
 
-        return cls.from_trytes(
-            # http://stackoverflow.com/a/1751478/
-            (trits[i:i + 3] for i in range(0, len(trits), 3)),
+        try:
+            chars = bytearray(map(_TRYTES_BY_TRITS.__getitem__, split_trytes()))
+        except KeyError:
+            # Some of the values are not balanced trits; convert each
+            # tryte arithmetically instead, like :py:meth:`from_trytes`.
+            return cls.from_trytes(split_trytes(), *args, **kwargs)
 
-            *args,
-            **kwargs
-        )
+        return cls(chars, *args, **kwargs)
 
     def __init__(self, trytes: TrytesCompatible, pad: Optional[int] = None) -> None:
         """
@@ -321,9 +391,14 @@ class TryteString(JsonSerializable):
                     (incoming_type is TryteString) or
                     issubclass(incoming_type, type(self))
             ):
-                # Create a copy of the incoming TryteString's trytes, to
-                # ensure we don't modify it when we apply padding.
-                trytes = bytearray(trytes._trytes)
+                if pad and len(trytes) < pad:
+                    # Create a copy of the incoming TryteString's trytes,
+                    # to ensure we don't modify it when we apply padding.
+                    trytes = bytearray(trytes._buffer)
+                else:
+                    # Otherwise, share the incoming TryteString's buffer
+                    # (see :py:meth:`_share`).
+                    trytes = trytes._share()
 
             else:
                 raise with_context(
@@ -343,11 +418,19 @@ class TryteString(JsonSerializable):
             if isinstance(trytes, str):
                 trytes = encode(trytes, 'ascii')
 
-            if not isinstance(trytes, bytearray):
-                trytes = bytearray(trytes)
+            # Always make a copy, even of a bytearray; otherwise, once
+            # the buffer is shared (see :py:meth:`_share`), the caller
+            # would no longer be able to resize their bytearray.
+            trytes = bytearray(trytes)
+
+            # Deleting all of the valid characters leaves only the
+            # invalid ones; if there are any, find the first one so that
+            # we can report its position.
+            if trytes.translate(None, _VALID_TRYTES):
+                for i, ordinal in enumerate(trytes):
+                    if ordinal in AsciiTrytesCodec.index:
+                        continue
 
-            for i, ordinal in enumerate(trytes):
-                if ordinal not in AsciiTrytesCodec.index:
                     raise with_context(
                         exc=ValueError(
                             'Invalid character {char!r} at position {i} '
@@ -362,18 +445,101 @@ class TryteString(JsonSerializable):
                         },
                     )
 
-        if pad:
-            trytes += b'9' * max(0, pad - len(trytes))
+        if pad and len(trytes) < pad:
+            trytes += b'9' * (pad - len(trytes))
 
-        self._trytes: bytearray = trytes
+        self._buffer: Union[bytearray, memoryview] = trytes
+        """
+        Either a bytearray that belongs to this object, or a (read-only)
+        view over a buffer that is shared with other TryteStrings.
+
+        Use :py:attr:`_trytes` to make changes.
+        """
+
+    @property
+    def _trytes(self) -> bytearray:
+        """
+        The trytes, as a bytearray that belongs to this object (and so may
+        be modified).
+
+        If this TryteString is a view over a shared buffer, the trytes are
+        copied first (copy-on-write).
+        """
+        if not isinstance(self._buffer, bytearray):
+            self._buffer = bytearray(self._buffer)
+
+        # The trytes might be about to change.
+        self._hash_value = None
+
+        return self._buffer
+
+    @_trytes.setter
+    def _trytes(self, trytes: bytearray) -> None:
+        self._buffer = trytes
+        self._hash_value = None
+
+    _hash_value: Optional[int] = None
+    """
+    Cached result of :py:meth:`__hash__`.
+
+    Cleared whenever the trytes are accessed via :py:attr:`_trytes`.
+    """
+
+    def _share(self) -> memoryview:
+        """
+        Returns a view over this TryteString's buffer, so that another
+        TryteString can use it without copying.
+
+        Once a buffer is shared, it is never modified again;
+        :py:attr:`_trytes` makes a copy for whichever TryteString changes
+        first.
+
+        .. note::
+            A view keeps the whole buffer alive, so a short slice of a long
+            TryteString holds on to all of its memory.
+        """
+        if isinstance(self._buffer, bytearray):
+            self._buffer = memoryview(self._buffer)
+
+        return self._buffer
+
+    @staticmethod
+    def _from_validated(
+            trytes: Union[bytearray, memoryview],
+    ) -> 'TryteString':
+        """
+        Creates a :py:class:`TryteString` from trytes that are already
+        known to be valid (e.g., a slice of another TryteString), without
+        checking them again.
+
+        .. important::
+            ``trytes`` is used as-is (it is not copied), and the result is
+            always a plain :py:class:`TryteString`, never a subclass.
+        """
+        tryte_string = TryteString.__new__(TryteString)
+        tryte_string._buffer = trytes
+        return tryte_string
+
+    def __getstate__(self) -> dict:
+        # Views can't be pickled.
+        state = self.__dict__.copy()
+        state['_buffer'] = bytearray(self._buffer)
+
+        # Hashes of byte strings are randomized per process.
+        state.pop('_hash_value', None)
+
+        return state
 
     def __hash__(self) -> int:
-        return hash(bytes(self._trytes))
+        if self._hash_value is None:
+            self._hash_value = hash(bytes(self._buffer))
+
+        return self._hash_value
 
     def __repr__(self) -> str:
         return '{cls}({trytes!r})'.format(
             cls=type(self).__name__,
-            trytes=bytes(self._trytes),
+            trytes=bytes(self._buffer),
         )
 
     def __bytes__(self) -> bytes:
@@ -390,7 +556,7 @@ class TryteString(JsonSerializable):
         - ... encode trytes into bytes: use :py:meth:`encode`.
         - ... decode trytes into Unicode: use :py:meth:`decode`.
         """
-        return bytes(self._trytes)
+        return bytes(self._buffer)
 
     def __str__(self) -> str:
         """
@@ -400,25 +566,31 @@ class TryteString(JsonSerializable):
         # This causes infinite recursion in Python 2.
         # return binary_type(self).decode('ascii')
 
-        return bytes(self._trytes).decode('ascii')
+        return bytes(self._buffer).decode('ascii')
 
     def __bool__(self) -> bool:
-        return bool(self._trytes) and any(t != b'9' for t in self)
+        return bool(self._buffer) and any(t != b'9' for t in self)
 
     def __len__(self) -> int:
-        return len(self._trytes)
+        return len(self._buffer)
 
     def __iter__(self) -> Generator[bytes, None, None]:
         # :see: http://stackoverflow.com/a/14267935/
-        return (bytes(self._trytes[i:i + 1]) for i in range(len(self)))
+        return (bytes(self._buffer[i:i + 1]) for i in range(len(self)))
 
     def __contains__(self, other: TrytesCompatible) -> bool:
+        # Memoryviews don't support substring checks, but we don't want
+        # to make a copy via :py:attr:`_trytes` just to do a read.
+        trytes = self._buffer
+        if isinstance(trytes, memoryview):
+            trytes = trytes.tobytes()
+
         if isinstance(other, TryteString):
-            return other._trytes in self._trytes
+            return other._buffer in trytes
         elif isinstance(other, str):
-            return other.encode('ascii') in self._trytes
+            return other.encode('ascii') in trytes
         elif isinstance(other, (bytes, bytearray)):
-            return other in self._trytes
+            return other in trytes
         else:
             raise with_context(
                 exc=TypeError(
@@ -436,16 +608,10 @@ class TryteString(JsonSerializable):
             )
 
     def __getitem__(self, item: Union[int, slice]) -> T:
-        new_trytes = bytearray()
-
-        sliced = self._trytes[item]
-
-        if isinstance(sliced, int):
-            new_trytes.append(sliced)
-        else:
-            new_trytes.extend(sliced)
+        if isinstance(item, slice):
+            return TryteString._from_validated(self._share()[item])
 
-        return TryteString(new_trytes)
+        return TryteString._from_validated(bytearray((self._buffer[item],)))
 
     def __setitem__(self,
                     item: Union[int, slice],
@@ -453,7 +619,7 @@ class TryteString(JsonSerializable):
         new_trytes = TryteString(trytes)
 
         if isinstance(item, slice):
-            self._trytes[item] = new_trytes._trytes
+            self._trytes[item] = new_trytes._buffer
         elif len(new_trytes) > 1:
             raise with_context(
                 exc=ValueError(
@@ -468,15 +634,17 @@ class TryteString(JsonSerializable):
                 },
             )
         else:
-            self._trytes[item] = new_trytes._trytes[0]
+            self._trytes[item] = new_trytes._buffer[0]
 
     def __add__(self, other: TrytesCompatible) -> T:
         if isinstance(other, TryteString):
-            return TryteString(self._trytes + other._trytes)
+            return TryteString._from_validated(
+                bytearray(self._buffer) + other._buffer,
+            )
         elif isinstance(other, str):
-            return TryteString(self._trytes + other.encode('ascii'))
+            return TryteString(bytearray(self._buffer) + other.encode('ascii'))
         elif isinstance(other, (bytes, bytearray)):
-            return TryteString(self._trytes + other)
+            return TryteString(bytearray(self._buffer) + other)
         else:
             raise with_context(
                 exc=TypeError(
@@ -494,12 +662,24 @@ class TryteString(JsonSerializable):
             )
 
     def __eq__(self, other: TrytesCompatible) -> bool:
+        if other is self:
+            return True
+
         if isinstance(other, TryteString):
-            return self._trytes == other._trytes
+            # If both hashes are already cached, they can rule out a
+            # match without comparing the trytes.
+            if (
+                    (self._hash_value is not None) and
+                    (other._hash_value is not None) and
+                    (self._hash_value != other._hash_value)
+            ):
+                return False
+
+            return self._buffer == other._buffer
         elif isinstance(other, str):
-            return self._trytes == other.encode('ascii')
+            return self._buffer == other.encode('ascii')
         elif isinstance(other, (bytes, bytearray)):
-            return self._trytes == other
+            return self._buffer == other
         else:
             raise with_context(
                 exc=TypeError(
@@ -600,7 +780,7 @@ class TryteString(JsonSerializable):
         # Once we add more codecs, we may need to revisit this.
         # See https://github.com/iotaledger/iota.py/issues/62 for
         # more information.
-        return decode(self._trytes, codec, errors)
+        return decode(self._buffer, codec, errors)
 
     def as_bytes(self, *args, **kwargs):
         """
@@ -654,9 +834,9 @@ class TryteString(JsonSerializable):
             message = trytes.decode()
 
         """
-        trytes = self._trytes
+        trytes = self._buffer
         if strip_padding and (trytes[-1] == ord(b'9')):
-            trytes = trytes.rstrip(b'9')
+            trytes = bytes(trytes).rstrip(b'9')
 
             # Put one back to preserve even length for ASCII codec.
             trytes += b'9' * (len(trytes) % 2)
@@ -697,7 +877,7 @@ class TryteString(JsonSerializable):
             json_payload = trytes.as_json_compatible()
 
         """
-        return self._trytes.decode('ascii')
+        return str(self)
 
     def as_integers(self) -> List[int]:
         """
@@ -723,7 +903,7 @@ class TryteString(JsonSerializable):
         """
         return [
             self._normalize(AsciiTrytesCodec.index[c])
-            for c in self._trytes
+            for c in self._buffer
         ]
 
     def as_trytes(self) -> List[List[int]]:
@@ -750,9 +930,11 @@ class TryteString(JsonSerializable):
             tryte_list = trytes.as_trytes()
 
         """
+        trits = self.as_trits()
+
         return [
-            trits_from_int(n, pad=3)
-            for n in self.as_integers()
+            trits[i:i + TRITS_PER_TRYTE]
+            for i in range(0, len(trits), TRITS_PER_TRYTE)
         ]
 
     def as_trits(self) -> List[int]:
@@ -781,8 +963,38 @@ class TryteString(JsonSerializable):
             trits = trytes.as_trits()
 
         """
-        # http://stackoverflow.com/a/952952/5568265#comment4204394_952952
-        return list(chain.from_iterable(self.as_trytes()))
+        return self.as_trit_array().tolist()
+
+    def as_trit_array(self) -> array:
+        """
+        Converts the TryteString into a compact sequence of trit values.
+
+        This is equivalent to :py:meth:`as_trits`, except that the trits
+        are stored in an ``array('b')`` (one byte per trit), which is
+        faster to build and uses a fraction of the memory.
+
+        The result can be passed directly to
+        :py:meth:`iota.crypto.kerl.Kerl.absorb` and
+        :py:meth:`iota.crypto.pycurl.Curl.absorb`.
+
+        :return:
+            ``array('b')``
+
+        Example usage::
+
+            from iota import TryteString
+            from iota.crypto.kerl import Kerl
+
+            trytes = TryteString(b'RBTC9D9DCDQAEASBYBCCKBFA')
+
+            sponge = Kerl()
+            sponge.absorb(trytes.as_trit_array())
+
+        """
+        return array(
+            'b',
+            b''.join(map(_TRITS_BY_TRYTE.__getitem__, self._buffer)),
+        )
 
     def _repr_pretty_(self, p, cycle):
         """
@@ -862,13 +1074,33 @@ class ChunkIterator(Iterator[TryteString]):
             raise StopIteration
 
         chunk = self.trytes[self._offset:self._offset + self.chunk_size]
-        chunk += b'9' * max(0, self.chunk_size - len(chunk))
+
+        if len(chunk) < self.chunk_size:
+            chunk += b'9' * (self.chunk_size - len(chunk))
 
         self._offset += self.chunk_size
 
         return chunk
 
 
+def _intern(value: T) -> T:
+    """
+    Returns the canonical instance of ``value``'s type that is equal to
+    ``value``, registering ``value`` if there isn't one.
+    """
+    registry = _interned.setdefault(type(value), WeakKeyDictionary())
+
+    canonical_ref = registry.get(value)
+    canonical = canonical_ref() if canonical_ref is not None else None
+
+    if canonical is None:
+        # A race here only means that both threads get an equal value.
+        registry[value] = ref(value)
+        canonical = value
+
+    return canonical
+
+
 class Hash(TryteString):
     """
     A :py:class:`TryteString` that is exactly one hash long.
@@ -888,7 +1120,7 @@ class Hash(TryteString):
     def __init__(self, trytes: TrytesCompatible) -> None:
         super(Hash, self).__init__(trytes, pad=self.LEN)
 
-        if len(self._trytes) > self.LEN:
+        if len(self) > self.LEN:
             raise with_context(
                 exc=ValueError('{cls} values must be {len} trytes long.'.format(
                     cls=type(self).__name__,
@@ -900,6 +1132,30 @@ class Hash(TryteString):
                 },
             )
 
+    def intern(self: T) -> T:
+        """
+        Returns the canonical instance of this hash, so that equal
+        hashes can share a single object (e.g., when collecting millions
+        of transaction hashes into a set).
+
+        If no other live instance of the same type has the same trytes,
+        this hash becomes the canonical instance.
+
+        .. important::
+            The returned object may be shared with other code, so don't
+            modify it.
+
+        Example usage::
+
+            from iota import TransactionHash
+
+            txn_hashes = {
+                TransactionHash(t).intern()
+                for t in response['hashes']
+            }
+        """
+        return _intern(self)
+
 
 class Address(TryteString):
     """
@@ -938,12 +1194,12 @@ class Address(TryteString):
         super(Address, self).__init__(trytes, pad=self.LEN)
 
         self.checksum = None
-        if len(self._trytes) == (self.LEN + AddressChecksum.LEN):
+        if len(self) == (self.LEN + AddressChecksum.LEN):
             self.checksum: Optional[AddressChecksum] = AddressChecksum(
                 self[self.LEN:]
             )
 
-        elif len(self._trytes) > self.LEN:
+        elif len(self) > self.LEN:
             raise with_context(
                 exc=ValueError(
                     'Address values must be '
@@ -1020,7 +1276,7 @@ class Address(TryteString):
 
         """
         return {
-            'trytes': self._trytes.decode('ascii'),
+            'trytes': str(self),
             'balance': self.balance,
             'key_index': self.key_index,
             'security_level': self.security_level,
@@ -1142,7 +1398,7 @@ class Address(TryteString):
         self.checksum = self._generate_checksum()
 
         # Add generated checksum to internal buffer.
-        self._trytes = self._trytes + self.checksum._trytes
+        self._trytes = bytearray(self._buffer) + self.checksum._buffer
 
     def remove_checksum(self) -> None:
         """
@@ -1175,7 +1431,7 @@ class Address(TryteString):
 
         """
         self.checksum = None
-        self._trytes = self._trytes[:self.LEN]
+        self._trytes = bytearray(self._buffer[:self.LEN])
 
 
 class AddressChecksum(TryteString):
@@ -1195,7 +1451,7 @@ class AddressChecksum(TryteString):
     def __init__(self, trytes: TrytesCompatible) -> None:
         super(AddressChecksum, self).__init__(trytes, pad=None)
 
-        if len(self._trytes) != self.LEN:
+        if len(self) != self.LEN:
             raise with_context(
                 exc=ValueError(
                     '{cls} values must be exactly {len} trytes long.'.format(
@@ -1227,7 +1483,7 @@ class Tag(TryteString):
     def __init__(self, trytes: TrytesCompatible) -> None:
         super(Tag, self).__init__(trytes, pad=self.LEN)
 
-        if len(self._trytes) > self.LEN:
+        if len(self) > self.LEN:
             raise with_context(
                 exc=ValueError('{cls} values must be {len} trytes long.'.format(
                     cls=type(self).__name__,
@@ -1,4 +1,5 @@
-from codecs import decode, encode
+from codecs import decode, encode, getincrementaldecoder, \
+  getincrementalencoder
 from unittest import TestCase
 from warnings import catch_warnings, simplefilter as simple_filter
 
@@ -112,6 +113,65 @@ class AsciiTrytesCodecTestCase(TestCase):
       b'??\xd2\x80??\xc3??',
     )
 
+  def test_round_trip_all_bytes(self):
+    """
+    Encoding every possible byte value, and decoding the result.
+    """
+    bytes_ = bytes(range(256)) * 4
+
+    trytes = encode(bytes_, AsciiTrytesCodec.name)
+
+    self.assertEqual(len(trytes), len(bytes_) * 2)
+    self.assertEqual(decode(trytes, AsciiTrytesCodec.name), bytes_)
+
+  def test_decode_invalid_pair_at_end_errors_replace(self):
+    """
+    Decoding a long tryte sequence, where only the final pair is
+    un-decodable, with errors='replace'.
+    """
+    self.assertEqual(
+      decode(
+        b'RBTC9D9DCDQAEASBYBCCKBFA' * 10 + b'ZZ',
+        AsciiTrytesCodec.name,
+        'replace',
+      ),
+
+      b'Hello, IOTA!' * 10 + b'?',
+    )
+
+  def test_incremental_encoder(self):
+    """
+    Encoding a byte string one piece at a time.
+    """
+    encoder = getincrementalencoder(AsciiTrytesCodec.name)()
+
+    self.assertEqual(
+      encoder.encode(b'Hello, ') + encoder.encode(b'IOTA!', final=True),
+      b'RBTC9D9DCDQAEASBYBCCKBFA',
+    )
+
+  def test_incremental_decoder(self):
+    """
+    Decoding a tryte sequence one piece at a time, where pieces may
+    split a tryte pair.
+    """
+    decoder = getincrementaldecoder(AsciiTrytesCodec.name)()
+
+    self.assertEqual(decoder.decode(b'RBTC9'), b'He')
+    self.assertEqual(decoder.decode(b'D9DCDQAEASBYB'), b'llo, IO')
+    self.assertEqual(decoder.decode(b'CCKBFA', final=True), b'TA!')
+
+  def test_incremental_decoder_wrong_length_errors_strict(self):
+    """
+    The incremental decoder holds back an odd tryte until ``final``.
+    """
+    decoder = getincrementaldecoder(AsciiTrytesCodec.name)()
+
+    self.assertEqual(decoder.decode(b'RBTC9'), b'He')
+
+    with self.assertRaises(TrytesDecodeError):
+      decoder.decode(b'', final=True)
+
   def test_compat_name(self):
     """
     A warning is raised when using the codec's old name.
@@ -153,6 +153,22 @@ class FindTransactionObjectsCommandTestCase(TestCase):
         self.assertIsInstance(transaction, Transaction)
         self.assertEqual(transaction.address, self.address)
 
+    @async_test
+    async def test_verify_hashes_not_a_search_term(self):
+        """
+        ``verifyHashes`` does not count as a search term.
+        """
+        with self.assertRaises(ValueError):
+            await self.command(verifyHashes=1)
+
+    @async_test
+    async def test_verify_hashes_out_of_range(self):
+        """
+        ``verifyHashes`` must be between 0 and 1.
+        """
+        with self.assertRaises(ValueError):
+            await self.command(addresses=[self.address], verifyHashes=2)
+
     @async_test
     async def test_no_transactions_fround(self):
         """
@@ -6,6 +6,7 @@ from iota import Address, Bundle, Iota, AsyncIota, TransactionHash
 from iota.adapter import MockAdapter, async_return
 from iota.commands.extended.get_account_data import GetAccountDataCommand, \
   GetAccountDataRequestFilter
+from iota.crypto.cache import MemoryAddressCache
 from iota.crypto.types import Seed
 from iota.filters import Trytes
 from test import mock
@@ -21,6 +22,7 @@ class GetAccountDataRequestFilterTestCase(BaseFilterTestCase):
 
     # Define a few tryte sequences that we can re-use between tests.
     self.seed = b'HELLOIOTA'
+    self.cache = MemoryAddressCache()
 
   def test_pass_happy_path(self):
     """
@@ -31,7 +33,10 @@ class GetAccountDataRequestFilterTestCase(BaseFilterTestCase):
       'start':            0,
       'stop':             10,
       'inclusionStates':  True,
-      'security_level':   2
+      'security_level':   2,
+      'verifyHashes':     0.5,
+      'workers':          2,
+      'cache':            self.cache,
     }
 
     filter_ = self._filter(request)
@@ -53,7 +58,10 @@ class GetAccountDataRequestFilterTestCase(BaseFilterTestCase):
       'start':            42,
       'stop':             86,
       'inclusionStates':  True,
-      'security_level':   2
+      'security_level':   2,
+      'verifyHashes':     0.5,
+      'workers':          2,
+      'cache':            self.cache,
     })
 
     self.assertFilterPasses(filter_)
@@ -65,7 +73,10 @@ class GetAccountDataRequestFilterTestCase(BaseFilterTestCase):
         'start':            42,
         'stop':             86,
         'inclusionStates':  True,
-        'security_level':   2
+        'security_level':   2,
+        'verifyHashes':     0.5,
+        'workers':          2,
+        'cache':            self.cache,
       },
     )
 
@@ -86,7 +97,10 @@ class GetAccountDataRequestFilterTestCase(BaseFilterTestCase):
         'start':            0,
         'stop':             None,
         'inclusionStates':  False,
-        'security_level':   2
+        'security_level':   2,
+        'verifyHashes':     0,
+        'workers':          None,
+        'cache':            None,
       }
     )
 
@@ -315,6 +329,37 @@ class GetAccountDataRequestFilterTestCase(BaseFilterTestCase):
       },
     )
 
+  def test_fail_workers_too_small(self):
+    """
+    ``workers`` is less than 1.
+    """
+    self.assertFilterErrors(
+      {
+        'workers':  0,
+        'seed':     Seed(self.seed),
+      },
+
+      {
+        'workers': [f.Min.CODE_TOO_SMALL],
+      },
+    )
+
+  def test_fail_cache_wrong_type(self):
+    """
+    ``cache`` is not an address cache.
+    """
+    self.assertFilterErrors(
+      {
+        'cache':  {},
+        'seed':   Seed(self.seed),
+      },
+
+      {
+        'cache': [f.Type.CODE_WRONG_TYPE],
+      },
+    )
+
+
 class AsyncIter:
   """
   Class for mocking async generators.
@@ -328,6 +373,7 @@ class AsyncIter:
     for item in self.items:
       yield item
 
+
 class GetAccountDataCommandTestCase(TestCase):
   def setUp(self):
     super(GetAccountDataCommandTestCase, self).setUp()
@@ -414,7 +460,14 @@ class GetAccountDataCommandTestCase(TestCase):
     """
     Loading account data for an account.
     """
-    async def mock_iter_used_addresses(adapter, seed, start, security_level):
+    async def mock_iter_used_addresses(
+        adapter,
+        seed,
+        start,
+        security_level,
+        workers=None,
+        cache=None,
+    ):
       """
       Mocks the ``iter_used_addresses`` function, so that we can
       simulate its functionality without actually connecting to the
@@ -36,6 +36,7 @@ class GetBundlesRequestFilterTestCase(BaseFilterTestCase):
         # Raw trytes are extracted to match the IRI's JSON protocol.
         request = {
             'transactions': self.transactions,
+            'verifyHashes': 0.5,
         }
 
         filter_ = self._filter(request)
@@ -64,6 +65,7 @@ class GetBundlesRequestFilterTestCase(BaseFilterTestCase):
 
             {
                 'transactions': self.transactions,
+                'verifyHashes': 0,
             },
         )
 
@@ -181,8 +183,8 @@ class GetBundlesCommandTestCase(TestCase):
 
         # Tail transaction hash
         self.tx_hash = TransactionHash(
-            'TOYJPHKMLQNDVLDHDILARUJCCIUMQBLUSWPCTIVA'
-            'DRXICGYDGSVPXFTILFFGAPICYHGGJ9OHXINFX9999'
+            'DIZ9HJZOHYPNVVAU9CM9SXFZELHXWKXYOWGNDQDP'
+            'BQEMGBFYFHVWUVCZMNJQWBPB9ITNHTIZEDSRRRFHU'
         )
 
         self.bundle_trytes = [
@@ -225,9 +227,9 @@ class GetBundlesCommandTestCase(TestCase):
                 '999999999999999999999999999999999999999999999999999999999999999999'
                 '999999999999999999999999999999999999999999999999999SYRABNN9JD9PNDL'
                 'IKUNCECUELTOHNLFMVD99999999999A99999999PDQWLVVDPUU9VIBODGMRIAZPGQX'
-                'DOGSEXIHKIBWSLDAWUKZCZMK9Z9YZSPCKBDJSVDPRQLJSTKUMTNVSXFSEWUNJOEGNU'
-                'I9QOCRFMYSIFAZLJHKZBPQZZYFG9ORYCRDX9TOMJPFCRB9R9KPUUGFPVOWYXFIWEW9'
-                '999BGUEHHGAIWWQBCJZHZAQOWZMAIDAFUZBVMUVPWQJLUGGQKNKLMGTWXXNZKUCBJL'
+                'DOGSEXIHKIBWSLDAWUKZCZMK9Z9YZSPCKBDJSVDPRQLJSTKUMTNVSXWSHWFHSLGMZM'
+                'QOTS9USFOAUUKUKIOHOXBLFCOGOUWULQIEE9BYALTAYJCKEHATH9QNQZHGQCM9PDYC'
+                'QUEBGUEHHGAIWWQBCJZHZAQOWZMAIDAFUZBVMUVPWQJLUGGQKNKLMGTWXXNZKUCBJL'
                 'EDAMYVRGABAWBY9999SYRABNN9JD9PNDLIKUNCECUELTOQZPSBDILVHJQVCEOICFAD'
                 'YKZVGMOAXJRQNTCKMHGTAUMPGJJMX9LNF'
             ),
@@ -7,6 +7,7 @@ from iota import Address, BadApiResponse, Iota, AsyncIota, TransactionHash
 from iota.adapter import MockAdapter, async_return
 from iota.commands.extended.get_inputs import GetInputsCommand, GetInputsRequestFilter
 from iota.crypto.addresses import AddressGenerator
+from iota.crypto.cache import MemoryAddressCache
 from iota.crypto.types import Seed
 from iota.filters import Trytes
 from test import mock
@@ -22,6 +23,7 @@ class GetInputsRequestFilterTestCase(BaseFilterTestCase):
 
     # Define a few tryte sequences that we can re-use between tests.
     self.seed = 'HELLOIOTA'
+    self.cache = MemoryAddressCache()
 
   def test_pass_happy_path(self):
     """
@@ -35,6 +37,8 @@ class GetInputsRequestFilterTestCase(BaseFilterTestCase):
       'stop':       10,
       'threshold':  100,
       "securityLevel": 3,
+      'workers':       2,
+      'cache':         self.cache,
     }
 
     filter_ = self._filter(request)
@@ -57,6 +61,8 @@ class GetInputsRequestFilterTestCase(BaseFilterTestCase):
       'stop':       86,
       'threshold':  99,
       "securityLevel": 3,
+      'workers':       2,
+      'cache':         self.cache,
     })
 
     self.assertFilterPasses(filter_)
@@ -69,6 +75,8 @@ class GetInputsRequestFilterTestCase(BaseFilterTestCase):
         'stop':       86,
         'threshold':  99,
         "securityLevel": 3,
+        'workers':       2,
+        'cache':         self.cache,
       },
     )
 
@@ -90,6 +98,8 @@ class GetInputsRequestFilterTestCase(BaseFilterTestCase):
         'stop':       None,
         'threshold':  None,
         "securityLevel": AddressGenerator.DEFAULT_SECURITY_LEVEL,
+        'workers':       None,
+        'cache':         None,
       }
     )
 
@@ -396,6 +406,36 @@ class GetInputsRequestFilterTestCase(BaseFilterTestCase):
       },
     )
 
+  def test_fail_workers_too_small(self):
+    """
+    ``workers`` is less than 1.
+    """
+    self.assertFilterErrors(
+      {
+        'workers':  0,
+        'seed':     Seed(self.seed),
+      },
+
+      {
+        'workers': [f.Min.CODE_TOO_SMALL],
+      },
+    )
+
+  def test_fail_cache_wrong_type(self):
+    """
+    ``cache`` is not an address cache.
+    """
+    self.assertFilterErrors(
+      {
+        'cache':  {},
+        'seed':   Seed(self.seed),
+      },
+
+      {
+        'cache': [f.Type.CODE_WRONG_TYPE],
+      },
+    )
+
 
 class GetInputsCommandTestCase(TestCase):
   def setUp(self):
@@ -1,3 +1,4 @@
+from concurrent.futures import ThreadPoolExecutor
 from unittest import TestCase
 
 import filters as f
@@ -7,6 +8,7 @@ from iota import Address, Iota, AsyncIota
 from iota.adapter import MockAdapter, async_return
 from iota.commands.extended.get_new_addresses import GetNewAddressesCommand
 from iota.crypto.addresses import AddressGenerator
+from iota.crypto.cache import MemoryAddressCache
 from iota.crypto.types import Seed
 from iota.filters import Trytes
 from test import patch, MagicMock, async_test
@@ -21,6 +23,7 @@ class GetNewAddressesRequestFilterTestCase(BaseFilterTestCase):
 
     # Define a few tryte sequences that we can re-use between tests.
     self.seed = 'HELLOIOTA'
+    self.cache = MemoryAddressCache()
 
   def test_pass_happy_path(self):
     """
@@ -32,6 +35,8 @@ class GetNewAddressesRequestFilterTestCase(BaseFilterTestCase):
       'count':          1,
       'securityLevel':  2,
       'checksum':       False,
+      'workers':        2,
+      'cache':          self.cache,
     }
 
     filter_ = self._filter(request)
@@ -57,6 +62,8 @@ class GetNewAddressesRequestFilterTestCase(BaseFilterTestCase):
         'count':          None,
         'securityLevel':  AddressGenerator.DEFAULT_SECURITY_LEVEL,
         'checksum':       False,
+        'workers':        None,
+        'cache':          None,
       },
     )
 
@@ -76,6 +83,8 @@ class GetNewAddressesRequestFilterTestCase(BaseFilterTestCase):
 
       # ``checksum`` must be boolean.
       'checksum':       False,
+      'workers':        2,
+      'cache':          self.cache,
     })
 
     self.assertFilterPasses(filter_)
@@ -88,6 +97,8 @@ class GetNewAddressesRequestFilterTestCase(BaseFilterTestCase):
         'count':          8,
         'securityLevel':  2,
         'checksum':       False,
+        'workers':        2,
+        'cache':          self.cache,
       },
     )
 
@@ -324,6 +335,36 @@ class GetNewAddressesRequestFilterTestCase(BaseFilterTestCase):
       },
     )
 
+  def test_fail_workers_too_small(self):
+    """
+    ``workers`` is less than 1.
+    """
+    self.assertFilterErrors(
+      {
+        'workers':  0,
+        'seed':     Seed(self.seed),
+      },
+
+      {
+        'workers': [f.Min.CODE_TOO_SMALL],
+      },
+    )
+
+  def test_fail_cache_wrong_type(self):
+    """
+    ``cache`` is not an address cache.
+    """
+    self.assertFilterErrors(
+      {
+        'cache':  {},
+        'seed':   Seed(self.seed),
+      },
+
+      {
+        'cache': [f.Type.CODE_WRONG_TYPE],
+      },
+    )
+
 
 class GetNewAddressesCommandTestCase(TestCase):
   def setUp(self):
@@ -423,6 +464,45 @@ class GetNewAddressesCommandTestCase(TestCase):
     # No API requests were made.
     self.assertListEqual(self.adapter.requests, [])
 
+  @async_test
+  async def test_get_addresses_offline_cache(self):
+    """
+    Generate addresses in offline mode, storing them in a cache.
+    """
+    cache = MemoryAddressCache()
+
+    response = await self.command(
+      count = 2,
+      index = 0,
+      seed  = self.seed,
+      cache = cache,
+    )
+
+    self.assertDictEqual(
+      response,
+      {'addresses': [self.addy_1, self.addy_2]},
+    )
+
+    self.assertEqual(len(cache), 2)
+
+    # The next time, the addresses are loaded from the cache.
+    with patch(
+        'iota.crypto.addresses.AddressGenerator._get_digest',
+    ) as mock_get_digest:
+      response = await GetNewAddressesCommand(self.adapter)(
+        count = 2,
+        index = 0,
+        seed  = self.seed,
+        cache = cache,
+      )
+
+    mock_get_digest.assert_not_called()
+
+    self.assertDictEqual(
+      response,
+      {'addresses': [self.addy_1, self.addy_2]},
+    )
+
   @async_test
   async def test_security_level(self):
     """
@@ -577,6 +657,45 @@ class GetNewAddressesCommandTestCase(TestCase):
       ],
     )
 
+  @async_test
+  async def test_get_addresses_online_workers(self):
+    """
+    Generate address in online mode, using worker processes.
+    """
+    self.adapter.seed_response('wereAddressesSpentFrom', {
+      'states': [True],
+    })
+    self.adapter.seed_response('findTransactions', {
+      'hashes': [],
+    })
+
+    self.adapter.seed_response('wereAddressesSpentFrom', {
+      'states': [False],
+    })
+    self.adapter.seed_response('findTransactions', {
+      'hashes': [],
+    })
+
+    executor = ThreadPoolExecutor(2)
+
+    with patch(
+        'iota.commands.extended.get_new_addresses.ProcessPoolExecutor',
+        return_value=executor,
+    ) as mock_pool:
+      with patch.object(
+          executor,
+          'shutdown',
+          wraps=executor.shutdown,
+      ) as mock_shutdown:
+        response = await self.command(index=0, seed=self.seed, workers=2)
+
+    self.assertDictEqual(response, {'addresses': [self.addy_2]})
+
+    mock_pool.assert_called_once_with(2)
+
+    # The event loop is not blocked while the executor shuts down.
+    mock_shutdown.assert_called_once_with(wait=False)
+
   @async_test
   async def test_new_address_checksum(self):
     """
@@ -1,6 +1,6 @@
 from unittest import TestCase
 
-from iota import Iota, AsyncIota, MockAdapter, Transaction
+from iota import Iota, AsyncIota, MockAdapter, Transaction, TransactionHash
 from iota.commands.extended import GetTransactionObjectsCommand
 from iota.adapter import async_return
 from test import patch, MagicMock, mock, async_test
@@ -125,6 +125,44 @@ class GetTransactionObjectsCommandTestCase(TestCase):
         self.assertIsInstance(transaction, Transaction)
         self.assertEqual(transaction.hash, self.transaction_hash)
 
+    @async_test
+    async def test_hashes_trusted(self):
+        """
+        The transactions get the hashes that were requested; by default,
+        they are not checked against the trytes.
+        """
+        txn_hash = TransactionHash(
+            b'TESTVALUE9DONTUSEINPRODUCTION99999VALCXC'
+        )
+
+        with mock.patch(
+            'iota.commands.core.get_trytes.GetTrytesCommand._execute',
+            mock.Mock(return_value=async_return({'trytes': [self.trytes, ]})),
+        ):
+            response = await self.command(hashes=[txn_hash])
+
+        self.assertEqual(response['transactions'][0].hash, txn_hash)
+
+    @async_test
+    async def test_verify_hashes(self):
+        """
+        The requested hashes are checked against the trytes.
+        """
+        with mock.patch(
+            'iota.commands.core.get_trytes.GetTrytesCommand._execute',
+            mock.Mock(return_value=async_return({'trytes': [self.trytes, ]})),
+        ):
+            with self.assertRaises(ValueError):
+                await self.command(
+                    hashes=[
+                        TransactionHash(
+                            b'TESTVALUE9DONTUSEINPRODUCTION99999VALCXC'
+                        ),
+                    ],
+
+                    verifyHashes=1,
+                )
+
     @async_test
     async def test_no_transactions_fround(self):
         """
@@ -6,6 +6,7 @@ from iota import Address, Bundle, Iota, AsyncIota, Tag, Transaction, TryteString
 from iota.adapter import MockAdapter, async_return
 from iota.commands.extended.get_transfers import GetTransfersCommand, \
   GetTransfersRequestFilter
+from iota.crypto.cache import MemoryAddressCache
 from iota.crypto.types import Seed
 from iota.filters import Trytes
 from test import mock
@@ -21,6 +22,7 @@ class GetTransfersRequestFilterTestCase(BaseFilterTestCase):
 
     # Define a few tryte sequences that we can re-use between tests.
     self.seed = 'HELLOIOTA'
+    self.cache = MemoryAddressCache()
 
   def test_pass_happy_path(self):
     """
@@ -31,6 +33,9 @@ class GetTransfersRequestFilterTestCase(BaseFilterTestCase):
       'start':            0,
       'stop':             10,
       'inclusionStates':  True,
+      'verifyHashes':     0.5,
+      'workers':          2,
+      'cache':            self.cache,
     }
 
     filter_ = self._filter(request)
@@ -51,6 +56,9 @@ class GetTransfersRequestFilterTestCase(BaseFilterTestCase):
       'start':            42,
       'stop':             86,
       'inclusionStates':  True,
+      'verifyHashes':     0.5,
+      'workers':          2,
+      'cache':            self.cache,
     })
 
     self.assertFilterPasses(filter_)
@@ -62,6 +70,9 @@ class GetTransfersRequestFilterTestCase(BaseFilterTestCase):
         'start':            42,
         'stop':             86,
         'inclusionStates':  True,
+        'verifyHashes':     0.5,
+        'workers':          2,
+        'cache':            self.cache,
       },
     )
 
@@ -82,6 +93,9 @@ class GetTransfersRequestFilterTestCase(BaseFilterTestCase):
         'start':            0,
         'stop':             None,
         'inclusionStates':  False,
+        'verifyHashes':     0,
+        'workers':          None,
+        'cache':            None,
       }
     )
 
@@ -308,6 +322,52 @@ class GetTransfersRequestFilterTestCase(BaseFilterTestCase):
       },
     )
 
+  def test_fail_verify_hashes_too_small(self):
+    """
+    ``verifyHashes`` is less than 0.
+    """
+    self.assertFilterErrors(
+      {
+        'verifyHashes': -0.5,
+
+        'seed': Seed(self.seed),
+      },
+
+      {
+        'verifyHashes': [f.Min.CODE_TOO_SMALL],
+      },
+    )
+
+  def test_fail_workers_too_small(self):
+    """
+    ``workers`` is less than 1.
+    """
+    self.assertFilterErrors(
+      {
+        'workers':  0,
+        'seed':     Seed(self.seed),
+      },
+
+      {
+        'workers': [f.Min.CODE_TOO_SMALL],
+      },
+    )
+
+  def test_fail_cache_wrong_type(self):
+    """
+    ``cache`` is not an address cache.
+    """
+    self.assertFilterErrors(
+      {
+        'cache':  {},
+        'seed':   Seed(self.seed),
+      },
+
+      {
+        'cache': [f.Type.CODE_WRONG_TYPE],
+      },
+    )
+
 
 class GetTransfersCommandTestCase(TestCase):
   def setUp(self):
@@ -384,9 +384,11 @@ class IsPromotableCommandTestCase(TestCase):
         Test invalid timestamp in one of the transactions.
         """
         # Note that self.trytes2 will have the original and
-        # therefore invalid (too old) timestamp
+        # therefore invalid (too old) timestamp.
+        # Tx 1's timestamp is set slightly in the past, because it must
+        # be strictly earlier than the current time to be valid.
         tx = Transaction.from_tryte_string(self.trytes1)
-        tx.attachment_timestamp = get_current_ms()
+        tx.attachment_timestamp = get_current_ms() - 1000
         self.trytes1 = tx.as_tryte_string()
 
         self.adapter.seed_response('checkConsistency', {
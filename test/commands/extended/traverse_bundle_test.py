@@ -30,6 +30,7 @@ class TraverseBundleRequestFilterTestCase(BaseFilterTestCase):
         # Raw trytes are extracted to match the IRI's JSON protocol.
         request = {
             'transaction': self.transaction,
+            'verifyHashes': 0.5,
         }
 
         filter_ = self._filter(request)
@@ -53,6 +54,7 @@ class TraverseBundleRequestFilterTestCase(BaseFilterTestCase):
 
             {
                 'transaction': self.transaction,
+                'verifyHashes': 0,
             },
         )
 
@@ -113,6 +115,36 @@ class TraverseBundleRequestFilterTestCase(BaseFilterTestCase):
             },
         )
 
+    def test_fail_verify_hashes_wrong_type(self):
+        """
+        ``verifyHashes`` is not a number.
+        """
+        self.assertFilterErrors(
+            {
+                'transaction': TransactionHash(self.transaction),
+                'verifyHashes': '0.5',
+            },
+
+            {
+                'verifyHashes': [f.Type.CODE_WRONG_TYPE],
+            },
+        )
+
+    def test_fail_verify_hashes_too_big(self):
+        """
+        ``verifyHashes`` is greater than 1.
+        """
+        self.assertFilterErrors(
+            {
+                'transaction': TransactionHash(self.transaction),
+                'verifyHashes': 2,
+            },
+
+            {
+                'verifyHashes': [f.Max.CODE_TOO_BIG],
+            },
+        )
+
 
 class TraverseBundleCommandTestCase(TestCase):
     def setUp(self):
@@ -323,9 +355,9 @@ class TraverseBundleCommandTestCase(TestCase):
                 b'999999999999999999999999999999999999999999999999999999999999999999'
                 b'999999999999999999999999999999999999999999999999999SYRABNN9JD9PNDL'
                 b'IKUNCECUELTOHNLFMVD99999999999A99999999PDQWLVVDPUU9VIBODGMRIAZPGQX'
-                b'DOGSEXIHKIBWSLDAWUKZCZMK9Z9YZSPCKBDJSVDPRQLJSTKUMTNVSXFSEWUNJOEGNU'
-                b'I9QOCRFMYSIFAZLJHKZBPQZZYFG9ORYCRDX9TOMJPFCRB9R9KPUUGFPVOWYXFIWEW9'
-                b'999BGUEHHGAIWWQBCJZHZAQOWZMAIDAFUZBVMUVPWQJLUGGQKNKLMGTWXXNZKUCBJL'
+                b'DOGSEXIHKIBWSLDAWUKZCZMK9Z9YZSPCKBDJSVDPRQLJSTKUMTNVSXWSHWFHSLGMZM'
+                b'QOTS9USFOAUUKUKIOHOXBLFCOGOUWULQIEE9BYALTAYJCKEHATH9QNQZHGQCM9PDYC'
+                b'QUEBGUEHHGAIWWQBCJZHZAQOWZMAIDAFUZBVMUVPWQJLUGGQKNKLMGTWXXNZKUCBJL'
                 b'EDAMYVRGABAWBY9999SYRABNN9JD9PNDLIKUNCECUELTOQZPSBDILVHJQVCEOICFAD'
                 b'YKZVGMOAXJRQNTCKMHGTAUMPGJJMX9LNF'
             ),
@@ -385,8 +417,8 @@ class TraverseBundleCommandTestCase(TestCase):
         response = await self.command(
             transaction =
                 TransactionHash(
-                    b'TOYJPHKMLQNDVLDHDILARUJCCIUMQBLUSWPCTIVA'
-                    b'DRXICGYDGSVPXFTILFFGAPICYHGGJ9OHXINFX9999'
+                    b'DIZ9HJZOHYPNVVAU9CM9SXFZELHXWKXYOWGNDQDP'
+                    b'BQEMGBFYFHVWUVCZMNJQWBPB9ITNHTIZEDSRRRFHU'
                 ),
         )
         self.maxDiff = None
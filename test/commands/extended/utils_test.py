@@ -1,9 +1,11 @@
+from concurrent.futures import ThreadPoolExecutor
 from unittest import TestCase
 from iota.commands.extended.utils import iter_used_addresses, \
     get_bundles_from_transaction_hashes
 from iota.adapter import MockAdapter, async_return
+from iota.crypto.addresses import AddressGenerator
 from iota.crypto.types import Seed
-from test import mock, async_test, MagicMock
+from test import mock, async_test, MagicMock, patch
 from iota import TransactionTrytes, TransactionHash, Bundle, BadApiResponse
 
 
@@ -245,6 +247,45 @@ class IterUsedAddressesTestCase(TestCase):
         )
 
 
+    @async_test
+    async def test_workers(self):
+        """
+        Addresses are generated in worker processes.
+        """
+        # Address 0
+        self.adapter.seed_response('findTransactions', {
+            'hashes': ['T' * 81],
+        })
+
+        # Address 1
+        self.seed_unused_address()
+
+        executor = ThreadPoolExecutor(2)
+
+        with patch(
+                'iota.commands.extended.utils.ProcessPoolExecutor',
+                return_value=executor,
+        ) as mock_pool:
+            with patch.object(
+                    executor,
+                    'shutdown',
+                    wraps=executor.shutdown,
+            ) as mock_shutdown:
+                used_addresses = [
+                    address async for address, _ in
+                    iter_used_addresses(self.adapter, self.seed, 0, workers=2)
+                ]
+
+        self.assertEqual(
+            used_addresses,
+            AddressGenerator(self.seed).get_addresses(0),
+        )
+
+        mock_pool.assert_called_once_with(2)
+
+        # The event loop is not blocked while the executor shuts down.
+        mock_shutdown.assert_called_once_with(wait=False)
+
 class GetBundlesFromTransactionHashesTestCase(TestCase):
     def setUp(self) -> None:
         # Need two valid bundles
@@ -474,7 +515,8 @@ class GetBundlesFromTransactionHashesTestCase(TestCase):
                 )
 
                 mocked_get_bundles.assert_called_once_with(
-                        transactions=[self.single_bundle.tail_transaction.hash]
+                        transactions=[self.single_bundle.tail_transaction.hash],
+                        verifyHashes=0,
                 )
 
                 self.assertTrue(
@@ -519,7 +561,8 @@ class GetBundlesFromTransactionHashesTestCase(TestCase):
                 )
 
                 mocked_get_bundles.assert_called_once_with(
-                        transactions=[self.single_bundle.tail_transaction.hash]
+                        transactions=[self.single_bundle.tail_transaction.hash],
+                        verifyHashes=0,
                 )
 
                 self.assertFalse(
@@ -635,7 +678,8 @@ class GetBundlesFromTransactionHashesTestCase(TestCase):
                         transactions=[
                             self.single_bundle.tail_transaction.hash,
                             self.three_tx_bundle.tail_transaction.hash,
-                        ]
+                        ],
+                        verifyHashes=0,
                 )
 
                 self.assertTrue(
@@ -712,7 +756,8 @@ class GetBundlesFromTransactionHashesTestCase(TestCase):
                 mocked_get_bundles.assert_called_once_with(
                         transactions=[
                             self.three_tx_bundle.tail_transaction.hash
-                        ]
+                        ],
+                        verifyHashes=0,
                 )
 
     @async_test
@@ -788,7 +833,8 @@ class GetBundlesFromTransactionHashesTestCase(TestCase):
                         transactions=[
                             self.three_tx_bundle.tail_transaction.hash,
                             self.single_bundle.tail_transaction.hash,
-                        ]
+                        ],
+                        verifyHashes=0,
                 )
 
                 self.assertTrue(
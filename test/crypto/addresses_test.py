@@ -1,8 +1,11 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from unittest import TestCase
 
 from iota import Address
 from iota.crypto.addresses import AddressGenerator
+from iota.crypto.cache import MemoryAddressCache
 from iota.crypto.types import Seed
+from test import async_test, mock
 
 
 class AddressGeneratorTestCase(TestCase):
@@ -295,3 +298,285 @@ class AddressGeneratorTestCase(TestCase):
         b'WIKQRCIOD',
       ),
     )
+
+  def test_get_addresses_parallel(self):
+    """
+    Generating addresses using a pool of worker processes.
+    """
+    ag = AddressGenerator(self.seed_2, workers=2)
+
+    self.assertListEqual(
+      ag.get_addresses(start=10, count=3),
+
+      [
+        Address(
+          b'BPXMVV9UPKBTVPJXPBHHOJYAFLALOYCGTSEDLZBH'
+          b'NFMGEHREBQTRIPZAPREANPMZJNZZNCDIUFOYYGGFY',
+        ),
+
+        Address(
+          b'RUCZQJWKXVDIXTLHHOKGMHOV9AKVDBG9HUQHPWNZ'
+          b'UNKJNFVMULUSLKFJGSTBSNJMRYSJOBVBQSKVXISZB',
+        ),
+
+        Address(
+          b'FQAKF9XVCLTBESJKWCHFOCTVABYEEJP9RXUVAEUW'
+          b'ENFUUQK9VCHFEORHCYDUJQHNUDWNRDUDZTUGKHSPD',
+        ),
+      ],
+    )
+
+    # Ancillary attributes are preserved.
+    addy = ag.get_addresses(start=1, count=1)[0]
+    self.assertEqual(addy.key_index, 1)
+    self.assertEqual(addy.security_level, 2)
+
+  def test_get_addresses_parallel_step_negative(self):
+    """
+    Generating addresses in parallel with a negative ``step``.
+    """
+    ag = AddressGenerator(self.seed_2, workers=2)
+
+    self.assertListEqual(
+      ag.get_addresses(start=1, count=3, step=-1),
+
+      [
+        Address(
+          b'MSYILYYZLSJ99TDMGQHDOBWGHTBARCBGJZE9PIMQ'
+          b'LTEXJXKTDREGVTPA9NDGGLQHTMGISGRAKSLYPGWMB',
+        ),
+
+        Address(
+          b'FNKCVJPUANHNWNBAHFBTCONMCUBC9KCZ9EKREBCJ'
+          b'AFMABCTEPLGGXDJXVGPXDCFOUCRBWFJFLEAVOEUPY',
+        ),
+      ],
+    )
+
+  def test_get_addresses_parallel_error_start_too_small(self):
+    """
+    Providing a negative ``start`` value when generating addresses in
+    parallel.
+    """
+    ag = AddressGenerator(seed=b'', workers=2)
+
+    with self.assertRaises(ValueError):
+      ag.get_addresses(start=-1)
+
+  def test_generator_parallel(self):
+    """
+    Creating a generator that uses a pool of worker processes.
+    """
+    with ProcessPoolExecutor(2) as executor:
+      generator = (
+        AddressGenerator(self.seed_2, workers=2)
+          .create_iterator(1, executor=executor)
+      )
+
+      addresses = [next(generator) for _ in range(3)]
+      generator.close()
+
+    self.assertListEqual(
+      addresses,
+
+      [
+        Address(
+          b'MSYILYYZLSJ99TDMGQHDOBWGHTBARCBGJZE9PIMQ'
+          b'LTEXJXKTDREGVTPA9NDGGLQHTMGISGRAKSLYPGWMB',
+        ),
+
+        Address(
+          b'IIREHGHXUHARKVZDMHGUUCHZLUEQQULLEUSJHIIB'
+          b'WFYZIZDUFTOVHAWCKRJXUZ9CSUVLTRYSUGBVRMTOW',
+        ),
+
+        AddressGenerator(self.seed_2).get_addresses(start=3)[0],
+      ],
+    )
+
+  def test_generator_parallel_close(self):
+    """
+    Closing a parallel generator cancels the addresses that were
+    scheduled ahead of time.
+    """
+    futures = []
+
+    class RecordingExecutor(ThreadPoolExecutor):
+      def submit(self, *args, **kwargs):
+        future = super(RecordingExecutor, self).submit(*args, **kwargs)
+        futures.append(future)
+        return future
+
+    with RecordingExecutor(1) as executor:
+      generator = (
+        AddressGenerator(self.seed_2, workers=2)
+          .create_iterator(0, executor=executor)
+      )
+
+      next(generator)
+      generator.close()
+
+    # Only a bounded number of addresses are scheduled ahead of time
+    # (twice the number of workers).
+    self.assertEqual(len(futures), 4)
+
+    # The executor only has 1 thread, so the last address can't have
+    # been started yet.
+    self.assertTrue(futures[-1].cancelled())
+
+  def test_generator_parallel_step_negative(self):
+    """
+    A parallel generator stops when it runs out of indexes.
+    """
+    with ThreadPoolExecutor(1) as executor:
+      self.assertListEqual(
+        list(
+          AddressGenerator(self.seed_2)
+            .create_iterator(1, step=-1, executor=executor),
+        ),
+
+        AddressGenerator(self.seed_2).get_addresses(start=1, count=2, step=-1),
+      )
+
+  def test_generator_parallel_error_start_too_small(self):
+    """
+    Providing a negative ``start`` value when creating a parallel
+    generator.
+    """
+    with ThreadPoolExecutor(1) as executor:
+      generator = (
+        AddressGenerator(self.seed_2).create_iterator(-1, executor=executor)
+      )
+
+      with self.assertRaises(ValueError):
+        next(generator)
+
+  @async_test
+  async def test_async_generator(self):
+    """
+    Creating an async generator.
+    """
+    generator = AddressGenerator(self.seed_2).create_async_iterator(10)
+
+    self.assertEqual(
+      await generator.__anext__(),
+
+      Address(
+        b'BPXMVV9UPKBTVPJXPBHHOJYAFLALOYCGTSEDLZBH'
+        b'NFMGEHREBQTRIPZAPREANPMZJNZZNCDIUFOYYGGFY',
+      ),
+    )
+
+    self.assertEqual(
+      await generator.__anext__(),
+
+      Address(
+        b'RUCZQJWKXVDIXTLHHOKGMHOV9AKVDBG9HUQHPWNZ'
+        b'UNKJNFVMULUSLKFJGSTBSNJMRYSJOBVBQSKVXISZB',
+      ),
+    )
+
+    await generator.aclose()
+
+  @async_test
+  async def test_async_generator_parallel(self):
+    """
+    Creating an async generator that uses an executor.
+    """
+    with ThreadPoolExecutor(2) as executor:
+      generator = (
+        AddressGenerator(self.seed_2)
+          .create_async_iterator(10, executor=executor)
+      )
+
+      addresses = [await generator.__anext__() for _ in range(2)]
+      await generator.aclose()
+
+    self.assertListEqual(
+      addresses,
+      AddressGenerator(self.seed_2).get_addresses(start=10, count=2),
+    )
+
+  def test_cache_miss(self):
+    """
+    Addresses that aren't in the cache are generated, then stored in the
+    cache along with their digests.
+    """
+    cache = MemoryAddressCache()
+    ag = AddressGenerator(self.seed_1, cache=cache)
+
+    addy = ag.get_addresses(start=10)[0]
+
+    self.assertEqual(
+      addy,
+
+      Address(
+        b'XLXFTFBXUOOHRJDVBDBFEBDQDUKSLSOCLUYWGLAP'
+        b'R9FUROUHPFINIUFKYSRTFMNWKNEPDZATWXIVWJMDD',
+      ),
+    )
+
+    self.assertEqual(cache.get_address(self.seed_1, 2, 10), addy)
+    self.assertEqual(cache.get_digest(self.seed_1, 2, 10).key_index, 10)
+
+    # Different seeds and security levels are cached separately.
+    self.assertIsNone(cache.get_address(self.seed_2, 2, 10))
+    self.assertIsNone(cache.get_address(self.seed_1, 1, 10))
+
+  def test_cache_hit(self):
+    """
+    Addresses that are in the cache are not generated again.
+    """
+    cache = MemoryAddressCache()
+    AddressGenerator(self.seed_2, cache=cache).get_addresses(0, count=3)
+
+    ag = AddressGenerator(self.seed_2, checksum=True, cache=cache)
+
+    with mock.patch.object(AddressGenerator, '_get_digest') as mock_get_digest:
+      addresses = ag.get_addresses(start=1, count=2)
+
+    mock_get_digest.assert_not_called()
+
+    self.assertListEqual(
+      addresses,
+
+      [
+        Address(
+          b'MSYILYYZLSJ99TDMGQHDOBWGHTBARCBGJZE9PIMQ'
+          b'LTEXJXKTDREGVTPA9NDGGLQHTMGISGRAKSLYPGWMB'
+          b'WIKQRCIOD',
+        ),
+
+        Address(
+          b'IIREHGHXUHARKVZDMHGUUCHZLUEQQULLEUSJHIIB'
+          b'WFYZIZDUFTOVHAWCKRJXUZ9CSUVLTRYSUGBVRMTOW'
+          b'QMJEFKFED',
+        ),
+      ],
+    )
+
+    self.assertEqual(addresses[0].key_index, 1)
+    self.assertEqual(addresses[0].security_level, 2)
+
+  def test_cache_default(self):
+    """
+    Addresses are not cached unless a cache is specified.
+    """
+    self.assertIsNone(AddressGenerator(self.seed_1).cache)
+
+  def test_cache_parallel(self):
+    """
+    Generating addresses in parallel only sends cache misses to the
+    worker processes.
+    """
+    cache = MemoryAddressCache()
+    AddressGenerator(self.seed_2, cache=cache).get_addresses(start=1)
+
+    ag = AddressGenerator(self.seed_2, workers=2, cache=cache)
+
+    self.assertListEqual(
+      ag.get_addresses(start=0, count=3),
+      AddressGenerator(self.seed_2).get_addresses(start=0, count=3),
+    )
+
+    self.assertEqual(len(cache), 3)
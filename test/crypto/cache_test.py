@@ -0,0 +1,264 @@
+from os import path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from iota import Address
+from iota.crypto.cache import DigestCache, MemoryAddressCache, \
+  SqliteAddressCache
+from iota.crypto.types import Digest, PrivateKey, Seed
+from test import mock
+
+
+class MemoryAddressCacheTestCase(TestCase):
+  def setUp(self):
+    super(MemoryAddressCacheTestCase, self).setUp()
+
+    self.seed = Seed(b'TESTVALUE9DONTUSEINPRODUCTION99999')
+
+    self.digest = Digest(b'A' * 162, key_index=5)
+
+    self.address = Address(
+      b'DLEIS9XU9V9T9OURAKDUSQWBQEYFGJLRPRVEWKN9'
+      b'SSUGIHBEIPBPEWISSAURGTQKWKWNHXGCBQTWNOGIY',
+    )
+
+  def test_get_set(self):
+    """
+    Storing a digest and address, then retrieving them.
+    """
+    cache = MemoryAddressCache()
+    cache.set(self.seed, self.digest, self.address.with_valid_checksum())
+
+    addy = cache.get_address(self.seed, 2, 5)
+    self.assertEqual(addy, self.address)
+    self.assertEqual(addy.key_index, 5)
+    self.assertEqual(addy.security_level, 2)
+
+    # The address is stored without checksum.
+    self.assertIsNone(addy.checksum)
+
+    digest = cache.get_digest(self.seed, 2, 5)
+    self.assertEqual(digest, self.digest)
+    self.assertEqual(digest.key_index, 5)
+
+    self.assertIsNone(cache.get_address(self.seed, 2, 6))
+    self.assertIsNone(cache.get_digest(self.seed, 1, 5))
+
+  def test_seed_not_stored(self):
+    """
+    The cache does not contain the seed itself.
+    """
+    cache = MemoryAddressCache()
+    cache.set(self.seed, self.digest, self.address)
+
+    fingerprint, _, _ = next(iter(cache._entries))
+    self.assertNotIn(str(self.seed), fingerprint)
+    self.assertEqual(fingerprint, cache.get_seed_fingerprint(self.seed))
+
+  def test_lru_eviction(self):
+    """
+    The least recently used entry is discarded when the cache is full.
+    """
+    cache = MemoryAddressCache(max_size=2)
+
+    for index in range(2):
+      cache.set(self.seed, Digest(self.digest, index), self.address)
+
+    # Accessing index 0 makes index 1 the least recently used entry.
+    cache.get_address(self.seed, 2, 0)
+    cache.set(self.seed, Digest(self.digest, 2), self.address)
+
+    self.assertEqual(len(cache), 2)
+    self.assertIsNotNone(cache.get_address(self.seed, 2, 0))
+    self.assertIsNone(cache.get_address(self.seed, 2, 1))
+    self.assertIsNotNone(cache.get_address(self.seed, 2, 2))
+
+  def test_fail_private_key(self):
+    """
+    Attempting to store a private key in the cache.
+    """
+    cache = MemoryAddressCache()
+
+    with self.assertRaises(TypeError):
+      cache.set(self.seed, PrivateKey(b'A' * 2187, key_index=5), self.address)
+
+    self.assertEqual(len(cache), 0)
+
+  def test_fail_max_size_too_small(self):
+    """
+    ``max_size`` must be positive.
+    """
+    with self.assertRaises(ValueError):
+      MemoryAddressCache(max_size=0)
+
+
+class SqliteAddressCacheTestCase(TestCase):
+  def setUp(self):
+    super(SqliteAddressCacheTestCase, self).setUp()
+
+    self.seed = Seed(b'TESTVALUE9DONTUSEINPRODUCTION99999')
+
+    self.digest = Digest(b'A' * 162, key_index=5)
+
+    self.address = Address(
+      b'DLEIS9XU9V9T9OURAKDUSQWBQEYFGJLRPRVEWKN9'
+      b'SSUGIHBEIPBPEWISSAURGTQKWKWNHXGCBQTWNOGIY',
+    )
+
+  def test_persistence(self):
+    """
+    Cached values persist after the cache is closed and reopened.
+    """
+    with TemporaryDirectory() as tmp_dir:
+      db_path = path.join(tmp_dir, 'addresses.db')
+
+      cache = SqliteAddressCache(db_path)
+      cache.set(self.seed, self.digest, self.address)
+      cache.close()
+
+      cache = SqliteAddressCache(db_path)
+      try:
+        addy = cache.get_address(self.seed, 2, 5)
+        self.assertEqual(addy, self.address)
+        self.assertEqual(addy.key_index, 5)
+
+        self.assertEqual(cache.get_digest(self.seed, 2, 5), self.digest)
+        self.assertIsNone(cache.get_address(self.seed, 2, 6))
+      finally:
+        cache.close()
+
+
+class DigestCacheTestCase(TestCase):
+  def setUp(self):
+    super(DigestCacheTestCase, self).setUp()
+
+    self.seed = Seed(b'TESTVALUE9DONTUSEINPRODUCTION99999')
+
+    self.digest = Digest(b'A' * 162, key_index=5)
+
+  def test_get_set(self):
+    """
+    Storing a digest, then retrieving it.
+    """
+    cache = DigestCache()
+    cache.set(self.seed, self.digest)
+
+    digest = cache.get(self.seed, 2, 5)
+    self.assertEqual(digest, self.digest)
+    self.assertEqual(digest.key_index, 5)
+
+    self.assertIsNone(cache.get(self.seed, 2, 6))
+    self.assertIsNone(cache.get(self.seed, 1, 5))
+    self.assertIsNone(cache.get(Seed(b'SOMEOTHERSEED'), 2, 5))
+
+  def test_ttl(self):
+    """
+    Digests expire after ``ttl`` seconds, and are wiped when they are
+    removed.
+    """
+    cache = DigestCache(ttl=10)
+
+    with mock.patch('iota.crypto.cache.monotonic', return_value=100.0):
+      cache.set(self.seed, self.digest)
+
+    buffer = next(iter(cache._entries.values()))[1]
+
+    with mock.patch('iota.crypto.cache.monotonic', return_value=109.0):
+      self.assertEqual(cache.get(self.seed, 2, 5), self.digest)
+
+    with mock.patch('iota.crypto.cache.monotonic', return_value=110.0):
+      self.assertIsNone(cache.get(self.seed, 2, 5))
+
+    self.assertEqual(len(cache), 0)
+    self.assertEqual(buffer, bytearray(162))
+
+  def test_ttl_not_refreshed(self):
+    """
+    Retrieving a digest does not extend its lifetime, but replacing it
+    does.
+    """
+    cache = DigestCache(ttl=10)
+
+    with mock.patch('iota.crypto.cache.monotonic', return_value=100.0):
+      cache.set(self.seed, Digest(self.digest, 0))
+      cache.set(self.seed, Digest(self.digest, 1))
+
+    with mock.patch('iota.crypto.cache.monotonic', return_value=105.0):
+      # Index 0 becomes the most recently used digest...
+      self.assertIsNotNone(cache.get(self.seed, 2, 0))
+
+      # ... and index 1 is replaced.
+      cache.set(self.seed, Digest(self.digest, 1))
+
+    with mock.patch('iota.crypto.cache.monotonic', return_value=110.0):
+      self.assertIsNone(cache.get(self.seed, 2, 0))
+      self.assertIsNotNone(cache.get(self.seed, 2, 1))
+
+    with mock.patch('iota.crypto.cache.monotonic', return_value=115.0):
+      self.assertIsNone(cache.get(self.seed, 2, 1))
+
+    self.assertEqual(len(cache), 0)
+
+  def test_expiry_queue_bounded(self):
+    """
+    Replacing the same digest over and over does not grow the expiry
+    queue without bound.
+    """
+    cache = DigestCache(max_size=2)
+
+    for _ in range(10):
+      cache.set(self.seed, self.digest)
+
+    self.assertEqual(len(cache), 1)
+    self.assertLessEqual(len(cache._expiry), 4)
+
+  def test_lru_eviction(self):
+    """
+    The least recently used digest is discarded (and wiped) when the
+    cache is full.
+    """
+    cache = DigestCache(max_size=2)
+
+    for index in range(2):
+      cache.set(self.seed, Digest(self.digest, index))
+
+    buffer = list(cache._entries.values())[1][1]
+
+    # Accessing index 0 makes index 1 the least recently used entry.
+    cache.get(self.seed, 2, 0)
+    cache.set(self.seed, Digest(self.digest, 2))
+
+    self.assertEqual(len(cache), 2)
+    self.assertIsNotNone(cache.get(self.seed, 2, 0))
+    self.assertIsNone(cache.get(self.seed, 2, 1))
+    self.assertIsNotNone(cache.get(self.seed, 2, 2))
+
+    self.assertEqual(buffer, bytearray(162))
+
+  def test_clear(self):
+    """
+    Clearing the cache wipes every digest, but not copies that have
+    already been returned.
+    """
+    cache = DigestCache()
+    cache.set(self.seed, self.digest)
+
+    digest = cache.get(self.seed, 2, 5)
+    buffer = next(iter(cache._entries.values()))[1]
+
+    cache.clear()
+
+    self.assertEqual(len(cache), 0)
+    self.assertEqual(buffer, bytearray(162))
+    self.assertEqual(digest, self.digest)
+
+  def test_fail_private_key(self):
+    """
+    Attempting to store a private key in the cache.
+    """
+    cache = DigestCache()
+
+    with self.assertRaises(TypeError):
+      cache.set(self.seed, PrivateKey(b'A' * 2187, key_index=5))
+
+    self.assertEqual(len(cache), 0)
@@ -1,3 +1,4 @@
+from array import array
 from csv import DictReader
 from os.path import dirname, join
 from random import randrange
@@ -6,8 +7,9 @@ from unittest import TestCase
 from sha3 import keccak_384
 
 from iota.crypto.kerl import Kerl
-from iota.crypto.kerl.conv import convertToBytes, convertToTrits, \
-  trits_to_trytes, trytes_to_trits
+from iota.crypto.kerl.conv import bytes_to_trits, convert_sign, \
+  convertBaseToBigint, convertToBytes, convertToTrits, trits_to_bytes, trits_to_trytes, \
+  trytes_to_trits
 
 
 class TestKerl(TestCase):
@@ -91,6 +93,30 @@ class TestKerl(TestCase):
           'GPZQITIBJQ9LNTDIBTCQ9EUWKHFLGFUVGGUWJONK9GBCDUIMAYMMQX',
         )
 
+    def test_absorb_trit_array(self):
+        inp = (
+          'G9JYBOMPUXHYHKSNRNMMSSZCSHOFYOYNZRSZMAAYWDYEIMVVOGKPJB'
+          'VBM9TDPULSFUNMTVXRKFIDOHUXXVYDLFSZYZTWQYTE9SPYYWYTXJYQ'
+          '9IFGYOLZXWZBKWZN9QOOTBQMWMUBLEWUEEASRHRTNIQWJQNDWRYLCA'
+        )
+
+        trits = array('b', trytes_to_trits(inp))
+
+        kerl = Kerl()
+        kerl.absorb(trits)
+        trits_out = []
+        kerl.squeeze(trits_out, length=486)
+
+        trytes_out = trits_to_trytes(trits_out)
+
+        self.assertEqual(
+          trytes_out,
+
+          'LUCKQVACOGBFYSPPVSSOXJEKNSQQRQKPZC9NXFSMQNRQCGGUL9OHVV'
+          'KBDSKEQEBKXRNUJSRXYVHJTXBPDWQGNSCDCBAIRHAQCOWZEBSNHIJI'
+          'GPZQITIBJQ9LNTDIBTCQ9EUWKHFLGFUVGGUWJONK9GBCDUIMAYMMQX',
+        )
+
 
     def test_all_bytes(self):
         for i in range(-128, 128):
@@ -108,6 +134,61 @@ class TestKerl(TestCase):
 
         self.assertEqual(in_trits, out_trits)
 
+    def test_trits_to_bytes(self):
+        in_trits = [randrange(-1,2) for _ in range(243)]
+        in_trits[242] = 0
+
+        self.assertEqual(
+          trits_to_bytes(in_trits),
+          bytes(convert_sign(b) for b in convertToBytes(in_trits)),
+        )
+
+    def test_bytes_to_trits(self):
+        for i in range(256):
+            in_bytes = bytes([i] * 48)
+
+            self.assertEqual(
+              bytes_to_trits(in_bytes),
+              convertToTrits([convert_sign(b) for b in in_bytes]),
+            )
+
+            self.assertEqual(trits_to_bytes(bytes_to_trits(in_bytes)), in_bytes)
+
+    def test_convert_base_to_bigint_non_trits(self):
+        # Values outside the range of a trit are still accepted.
+        self.assertEqual(convertBaseToBigint([5, -4, 1], 3), 5 - 12 + 9)
+        self.assertEqual(convertBaseToBigint([1, -1, 0], 3), -2)
+
+        # Values that would be shifted into ASCII characters that
+        # ``int`` accepts as digits.
+        self.assertEqual(convertBaseToBigint([47], 3), 47)
+        self.assertEqual(convertBaseToBigint([48], 3), 48)
+        self.assertEqual(convertBaseToBigint([31, 0], 3), 31)
+        self.assertEqual(convertBaseToBigint([0, 94, 0], 3), 282)
+
+    def test_convert_base_to_bigint_empty(self):
+        self.assertEqual(convertBaseToBigint([], 3), 0)
+
+    def test_chain(self):
+        in_trits = [randrange(-1,2) for _ in range(243)]
+
+        for count in (0, 1, 26):
+            expected = in_trits[:]
+            for _ in range(count):
+                kerl = Kerl()
+                kerl.absorb(expected)
+                kerl.squeeze(expected)
+
+            trits = in_trits[:]
+            self.assertEqual(Kerl.chain(trits, count), expected)
+
+            # The input buffer is not modified.
+            self.assertEqual(trits, in_trits)
+
+    def test_chain_fail_wrong_length(self):
+        with self.assertRaises(ValueError):
+            Kerl.chain([0] * 486, 1)
+
     def test_generate_trytes_hash(self):
         filepath =\
           join(
@@ -0,0 +1,63 @@
+from random import Random
+from unittest import TestCase, skipIf
+
+from iota import TryteString
+from iota.crypto.pycurl import Curl as PyCurl
+
+try:
+  from iota.crypto.npcurl import Curl as NpCurl
+except ImportError:
+  NpCurl = None
+
+
+@skipIf(NpCurl is None, 'NumPy is not installed.')
+class NpCurlTestCase(TestCase):
+  """
+  Unit tests for :py:class:`iota.crypto.npcurl.Curl`.
+
+  The NumPy implementation must produce exactly the same output as the
+  pure-Python implementation.
+  """
+
+  def _hash(self, curl_type, trits, length=243):
+    curl = curl_type()
+    curl.absorb(trits[:])
+    trits_out = []
+    curl.squeeze(trits_out, length=length)
+    return trits_out
+
+  def test_happy_path(self):
+    """
+    Typical use case.
+    """
+    trits = TryteString(
+      'EMIDYNHBWMBCXVDEFOFWINXTERALUKYYPPHKP9JJ'
+      'FGJEIUY9MUDVNFZHMMWZUYUSWAIOWEVTHNWMHANBH'
+    ).as_trits()
+
+    trits_out = self._hash(NpCurl, trits)
+
+    self.assertEqual(
+      TryteString.from_trits(trits_out),
+
+      'AQBOPUMJMGVHFOXSMUAGZNACKUTISDPBSILMRAGI'
+      'GRXXS9JJTLIKZUW9BCJWKSTFBDSBLNVEEGVGAMSSM',
+    )
+
+    # Squeezed trits should be plain ints, not NumPy scalars.
+    self.assertIs(type(trits_out[0]), int)
+
+  def test_matches_pycurl(self):
+    """
+    The NumPy implementation is bit-identical to the pure-Python
+    implementation for random inputs of various lengths.
+    """
+    rng = Random(42)
+
+    for length in (1, 243, 486, 2673 * 3):
+      trits = [rng.choice((-1, 0, 1)) for _ in range(length)]
+
+      self.assertEqual(
+        self._hash(NpCurl, trits, length=486),
+        self._hash(PyCurl, trits, length=486),
+      )
@@ -2,6 +2,7 @@ from unittest import TestCase
 
 from iota import TryteString
 from iota.crypto import Curl
+from iota.crypto.pycurl import Curl as PyCurl
 
 
 class CurlTestCase(TestCase):
@@ -189,3 +190,107 @@ class CurlTestCase(TestCase):
       'GSJWCCFQRHWKTSMVPWWCEGOMCNWFYWDZBEDBLXIFB'
       'HOTCKUMCANLSXXTNKSYNBMOSDDEYFTDOYIKDRJM',
     )
+
+  def test_absorb_trit_array(self):
+    """
+    Absorbing trits from an ``array('b')`` buffer.
+
+    Note that this test targets :py:class:`iota.crypto.pycurl.Curl`
+    directly, as the C extension only accepts lists.
+    """
+    input_ = (
+      'EMIDYNHBWMBCXVDEFOFWINXTERALUKYYPPHKP9JJ'
+      'FGJEIUY9MUDVNFZHMMWZUYUSWAIOWEVTHNWMHANBH'
+    )
+
+    trits = TryteString(input_).as_trit_array()
+
+    curl = PyCurl()
+    curl.absorb(trits)
+    trits_out = []
+    curl.squeeze(trits_out)
+
+    trits_out = TryteString.from_trits(trits_out)
+
+    self.assertEqual(
+      trits_out,
+
+      'AQBOPUMJMGVHFOXSMUAGZNACKUTISDPBSILMRAGI'
+      'GRXXS9JJTLIKZUW9BCJWKSTFBDSBLNVEEGVGAMSSM',
+    )
+
+
+class CurlHashManyTestCase(TestCase):
+  """
+  Unit tests for :py:meth:`iota.crypto.pycurl.Curl.hash_many`.
+
+  Note that the C extension does not provide this method, so these tests
+  target :py:class:`iota.crypto.pycurl.Curl` directly.
+  """
+
+  def test_happy_path(self):
+    """
+    Hashing several buffers of different lengths at once.
+    """
+    inputs = [
+      'EMIDYNHBWMBCXVDEFOFWINXTERALUKYYPPHKP9JJ'
+      'FGJEIUY9MUDVNFZHMMWZUYUSWAIOWEVTHNWMHANBH',
+
+      'G9JYBOMPUXHYHKSNRNMMSSZCSHOFYOYNZRSZMAAYWDYEIMVVOGKPJB'
+      'VBM9TDPULSFUNMTVXRKFIDOHUXXVYDLFSZYZTWQYTE9SPYYWYTXJYQ'
+      '9IFGYOLZXWZBKWZN9QOOTBQMWMUBLEWUEEASRHRTNIQWJQNDWRYLCA',
+
+      # Shorter than 1 hash; will be padded.
+      'EMIDYNHBWMBCXVDEFOFWINXTERALUKYYPPHKP9JJ',
+    ]
+
+    buffers = [TryteString(i).as_trits() for i in inputs]
+
+    expected = []
+    for trits in buffers:
+      curl = PyCurl()
+      curl.absorb(trits[:])
+      trits_out = []
+      curl.squeeze(trits_out)
+      expected.append(trits_out)
+
+    hashes = PyCurl.hash_many(buffers)
+
+    self.assertListEqual(hashes, expected)
+
+    self.assertEqual(
+      TryteString.from_trits(hashes[0]),
+
+      'AQBOPUMJMGVHFOXSMUAGZNACKUTISDPBSILMRAGI'
+      'GRXXS9JJTLIKZUW9BCJWKSTFBDSBLNVEEGVGAMSSM',
+    )
+
+    self.assertEqual(
+      TryteString.from_trits(hashes[1]),
+
+      'RWCBOLRFANOAYQWXXTFQJYQFAUTEEBSZWTIRSSDR'
+      'EYGCNFRLHQVDZXYXSJKCQFQLJMMRHYAZKRRLQZDKR',
+    )
+
+  def test_buffers_not_modified(self):
+    """
+    The input buffers are not padded or otherwise modified.
+    """
+    trits = [1, 0, -1]
+
+    PyCurl.hash_many([trits])
+
+    self.assertListEqual(trits, [1, 0, -1])
+
+  def test_empty_sequence(self):
+    """
+    Hashing an empty sequence of buffers.
+    """
+    self.assertListEqual(PyCurl.hash_many([]), [])
+
+  def test_fail_empty_buffer(self):
+    """
+    One of the buffers is empty.
+    """
+    with self.assertRaises(ValueError):
+      PyCurl.hash_many([[1, 0, -1], []])
@@ -3,8 +3,44 @@ from unittest import TestCase
 
 from iota import Hash, TryteString
 from iota.crypto import SeedWarning
-from iota.crypto.signing import KeyGenerator, SignatureFragmentGenerator
+from iota.crypto.cache import DigestCache
+from iota.crypto.signing import KeyGenerator, SignatureFragmentGenerator, \
+  normalize
 from iota.crypto.types import PrivateKey
+from test import mock
+
+
+class NormalizeTestCase(TestCase):
+  def test_balanced(self):
+    """
+    Each chunk of the normalized hash sums to zero.
+    """
+    normalized = normalize(Hash(
+      b'TESTVALUE9DONTUSEINPRODUCTION99999GFDDC'
+      b'PFIIEHBCWFN9KHRBEIHHREFCKBVGUGEDXCFHDFPAL',
+    ))
+
+    self.assertEqual(len(normalized), 3)
+
+    for chunk in normalized:
+      self.assertEqual(len(chunk), 27)
+      self.assertEqual(sum(chunk), 0)
+      self.assertTrue(all(-13 <= n <= 13 for n in chunk))
+
+  def test_large_imbalance(self):
+    """
+    Values are adjusted as far as possible, starting at the beginning of
+    each chunk.
+    """
+    self.assertListEqual(
+      normalize(Hash(b'M' * 81)),
+      [[-13] * 13 + [0] + [13] * 13] * 3,
+    )
+
+    self.assertListEqual(
+      normalize(Hash(b'N' * 81)),
+      [[13] * 13 + [0] + [-13] * 13] * 3,
+    )
 
 
 class KeyGeneratorTestCase(TestCase):
@@ -833,6 +869,123 @@ class KeyGeneratorTestCase(TestCase):
     )
 
 
+  def test_generator_matches_get_key(self):
+    """
+    Keys created by a generator match keys created one at a time, even
+    when incrementing the index carries/overflows across the entire
+    seed.
+    """
+    # Every trit in this seed is 1, so adding 1 to it overflows.
+    kg = KeyGenerator(seed=b'M' * 81)
+
+    iterator = kg.create_iterator(start=0, step=1)
+    self.assertEqual(next(iterator), kg.get_key(index=0, iterations=1))
+    self.assertEqual(next(iterator), kg.get_key(index=1, iterations=1))
+
+    # Skipping over indexes without generating keys.
+    iterator.advance()
+    self.assertEqual(next(iterator), kg.get_key(index=3, iterations=1))
+
+    iterator = kg.create_iterator(start=10, step=-7)
+    self.assertEqual(next(iterator), kg.get_key(index=10, iterations=1))
+    self.assertEqual(next(iterator), kg.get_key(index=3, iterations=1))
+
+  def test_generator_empty_seed(self):
+    """
+    Keys created by a generator for an empty seed, where the index
+    doesn't fit into the seed.
+    """
+    kg = KeyGenerator(seed=b'')
+
+    iterator = kg.create_iterator(start=0, step=1)
+
+    self.assertListEqual(
+      [next(iterator).get_digest() for _ in range(4)],
+
+      [
+        TryteString(
+          b'QE9RSCRHDHJFRBXNEICVJGVQEQXYKRMNLTTVSSOANWBPZXDHFIMRARTHFN9XBDZHCZ'
+          b'NNK9SDXR9HUBTSX'
+        ),
+
+        TryteString(
+          b'OOU9LFJVCCBYWGWFXNT9KIHQJSPJFTOYDLEHFTIMABW9XTHDXZRNCONBYMCEKOINYC'
+          b'ZVEHJRGAUBPOBHW'
+        ),
+
+        TryteString(
+          b'CQPYMEBDOLYXMBMNBCRLJVJKHB9HLOHEKKRMTE9BGTZEHSJSUYXMDAKLRVATEMUX9Y'
+          b'9QGPVEPUBCDMTVX'
+        ),
+
+        TryteString(
+          b'QDU9UVMBZQGFSJQJGBLCF9GYVEVNGNGQUNKBVYU9PR9KJFSRVZRAUFLSAXYZOLJBMD'
+          b'AFIWXGEYIIUFYA9'
+        ),
+      ],
+    )
+
+    iterator = kg.create_iterator(start=3, step=-1)
+    self.assertEqual(next(iterator), kg.get_key(index=3, iterations=1))
+    self.assertEqual(next(iterator), kg.get_key(index=2, iterations=1))
+
+
+  def test_get_digests(self):
+    """
+    Generating digests.
+    """
+    kg = KeyGenerator(seed=b'TESTSEED9DONTUSEINPRODUCTION99999')
+
+    digests = kg.get_digests(start=2, count=2, iterations=1)
+
+    self.assertListEqual(
+      digests,
+
+      [
+        kg.get_key(index=2, iterations=1).get_digest(),
+        kg.get_key(index=3, iterations=1).get_digest(),
+      ],
+    )
+
+    self.assertEqual(digests[1].key_index, 3)
+    self.assertEqual(digests[1].security_level, 1)
+
+  def test_get_digests_cached(self):
+    """
+    Generating digests using a digest cache.
+    """
+    cache = DigestCache()
+    seed = b'TESTSEED9DONTUSEINPRODUCTION99999'
+
+    expected = KeyGenerator(seed, cache).get_digests(start=2, count=2)
+
+    self.assertEqual(len(cache), 2)
+
+    # Keys are only derived for digests that aren't in the cache.
+    with mock.patch.object(
+        PrivateKey,
+        'get_digest',
+        autospec=True,
+        side_effect=PrivateKey.get_digest,
+    ) as mock_get_digest:
+      digests = KeyGenerator(seed, cache).get_digests(start=1, count=3)
+
+    self.assertEqual(mock_get_digest.call_count, 1)
+    self.assertEqual(mock_get_digest.call_args[0][0].key_index, 1)
+
+    self.assertListEqual(digests[1:], expected)
+    self.assertEqual(digests[0].key_index, 1)
+
+  def test_get_digests_error_count_too_small(self):
+    """
+    Providing a ``count`` value less than 1 to ``get_digests``.
+    """
+    kg = KeyGenerator(seed=b'')
+
+    with self.assertRaises(ValueError):
+      kg.get_digests(start=0, count=0)
+
+
 class SignatureFragmentGeneratorTestCase(TestCase):
   """
   Generating values for this test case using the JS lib:
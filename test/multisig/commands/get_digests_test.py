@@ -6,6 +6,7 @@ from iota import Hash, TryteString
 from iota.adapter import MockAdapter, async_return
 from iota.crypto import FRAGMENT_LENGTH
 from iota.crypto.addresses import AddressGenerator
+from iota.crypto.cache import DigestCache
 from iota.crypto.types import Digest, PrivateKey, Seed
 from iota.filters import Trytes
 from iota.multisig import MultisigIota, AsyncMultisigIota
@@ -131,6 +132,49 @@ class GetDigestsCommandTestCase(TestCase):
     })
 
 
+  @async_test
+  async def test_digest_cache(self):
+    """
+    Generating digests using a digest cache.
+    """
+    seed = Seed.random()
+
+    cache = DigestCache()
+    cache.set(seed, self.digest1)
+    cache.set(seed, self.digest2)
+
+    mock_get_private_keys = mock.Mock()
+
+    with mock.patch(
+        'iota.multisig.commands.get_private_keys.GetPrivateKeysCommand._execute',
+        mock_get_private_keys
+    ):
+      result = await GetDigestsCommand(self.adapter, cache)(
+        seed=seed,
+        index=0,
+        count=2,
+        securityLevel=1,
+      )
+
+    self.assertDictEqual(result, {'digests': [self.digest1, self.digest2]})
+
+    mock_get_private_keys.assert_not_called()
+
+  def test_api_digest_cache(self):
+    """
+    The API passes its digest cache to the command.
+    """
+    cache = DigestCache()
+
+    with patch('iota.multisig.commands.get_digests.GetDigestsCommand.__init__',
+               MagicMock(return_value=None)) as mocked_init:
+      with patch('iota.multisig.commands.get_digests.GetDigestsCommand.__call__',
+                 MagicMock(return_value=async_return('You found me!'))):
+        MultisigIota(self.adapter, digest_cache=cache).get_digests()
+
+    mocked_init.assert_called_once_with(self.adapter, cache)
+
+
 class GetDigestsRequestFilterTestCase(BaseFilterTestCase):
   filter_type = GetDigestsCommand(MockAdapter()).get_request_filter
   skip_value_check = True
@@ -1,7 +1,18 @@
-from unittest import TestCase
+from concurrent.futures import ThreadPoolExecutor
+from pickle import dumps, loads
+from unittest import TestCase, skipIf
 
 from iota import Address, Bundle, BundleHash, Fragment, Hash, Nonce, Tag, \
   Transaction, TransactionHash, TransactionTrytes
+from iota.crypto.pycurl import Curl as PyCurl
+from iota.transaction.base import HASH_MANY_MIN_LANES, _hash_in_batches, \
+  _hash_transaction_trytes
+from test import patch
+
+try:
+  from iota.crypto.npcurl import Curl as NpCurl
+except ImportError:
+  NpCurl = None
 
 
 class BundleTestCase(TestCase):
@@ -556,6 +567,275 @@ class TransactionTestCase(TestCase):
 
     self.assertEqual(txn.hash, txn_hash)
 
+  def test_from_tryte_string_lazy(self):
+    """
+    Attributes are decoded from the raw trytes when they are first
+    accessed, and can be overwritten.
+    """
+    txn = Transaction.from_tryte_string(b'')
+
+    self.assertFalse(hasattr(txn, '__dict__'))
+    self.assertEqual(txn.value, 0)
+
+    txn.value = 42
+    txn.tag = Tag(b'PYOTA')
+
+    self.assertEqual(txn.value, 42)
+    self.assertEqual(txn.tag, Tag(b'PYOTA'))
+    self.assertEqual(txn.legacy_tag, Tag(b'PYOTA'))
+    self.assertEqual(txn.current_index, 0)
+
+  def test_from_tryte_string_pickle(self):
+    """
+    Transactions created from trytes can be pickled, whether or not
+    their attributes have been decoded yet.
+    """
+    txn = Transaction.from_tryte_string(
+      TransactionTrytes(b'A' * 2187),
+      hash_=TransactionHash(b'TESTVALUE9DONTUSEINPRODUCTION99999VALCXC'),
+    )
+
+    txn.address
+
+    unpickled = loads(dumps(txn))
+
+    self.assertEqual(unpickled.as_json_compatible(), txn.as_json_compatible())
+
+  def test_from_tryte_strings(self):
+    """
+    Initializing several Transaction objects at once.
+    """
+    with patch('iota.transaction.base._hash_in_batches') as mock_hash:
+      txns = Transaction.from_tryte_strings([
+        TransactionTrytes(b'A' * 2187),
+        b'',
+      ])
+
+    # Hashes are computed lazily, unless an executor is provided.
+    mock_hash.assert_not_called()
+
+    self.assertEqual(len(txns), 2)
+    self.assertIsInstance(txns[0], Transaction)
+
+    self.assertEqual(
+      txns[0].hash,
+
+      TransactionHash(
+        b'BSTACLRCOQCFLDFCUTNQKFEBVBLTXVLHVZA9N99LG'
+        b'TYD9SQBKF9YPWAVDGGIREEQQLVFBQIKIPKGGOGLP'
+      ),
+    )
+
+    self.assertEqual(txns[1].hash, TransactionHash(b''))
+
+  def test_from_tryte_strings_hashes_batched(self):
+    """
+    Accessing the hash of one transaction computes the hashes of every
+    transaction created at the same time, in a single batch.
+    """
+    txns = Transaction.from_tryte_strings([
+      TransactionTrytes(b'A' * 2187),
+      TransactionTrytes(b'B' * 2187),
+      TransactionTrytes(b'C' * 2187),
+    ])
+
+    # One of the hashes is already known.
+    txns[2].hash = TransactionHash(b'TESTVALUE9DONTUSEINPRODUCTION99999VALCXC')
+
+    with patch(
+        'iota.transaction.base._hash_in_batches',
+        wraps=_hash_in_batches,
+    ) as mock_hash:
+      self.assertEqual(
+        txns[0].hash,
+
+        TransactionHash(
+          b'BSTACLRCOQCFLDFCUTNQKFEBVBLTXVLHVZA9N99LG'
+          b'TYD9SQBKF9YPWAVDGGIREEQQLVFBQIKIPKGGOGLP'
+        ),
+      )
+
+      self.assertEqual(
+        txns[1].hash,
+        Transaction.from_tryte_string(TransactionTrytes(b'B' * 2187)).hash,
+      )
+
+      self.assertEqual(
+        txns[2].hash,
+        TransactionHash(b'TESTVALUE9DONTUSEINPRODUCTION99999VALCXC'),
+      )
+
+    mock_hash.assert_called_once_with(
+      [TransactionTrytes(b'A' * 2187), TransactionTrytes(b'B' * 2187)],
+      None,
+    )
+
+  def test_from_tryte_strings_pickle(self):
+    """
+    Transactions created together can be pickled before their hashes
+    have been computed.
+    """
+    txns = Transaction.from_tryte_strings([TransactionTrytes(b'A' * 2187)])
+
+    unpickled = loads(dumps(txns[0]))
+
+    self.assertEqual(
+      unpickled.hash,
+
+      TransactionHash(
+        b'BSTACLRCOQCFLDFCUTNQKFEBVBLTXVLHVZA9N99LG'
+        b'TYD9SQBKF9YPWAVDGGIREEQQLVFBQIKIPKGGOGLP'
+      ),
+    )
+
+  def test_from_tryte_strings_executor(self):
+    """
+    Computing transaction hashes in an executor.
+    """
+    with ThreadPoolExecutor(1) as executor:
+      txns = Transaction.from_tryte_strings(
+        [TransactionTrytes(b'A' * 2187)],
+        executor=executor,
+      )
+
+    self.assertEqual(
+      txns[0].hash,
+
+      TransactionHash(
+        b'BSTACLRCOQCFLDFCUTNQKFEBVBLTXVLHVZA9N99LG'
+        b'TYD9SQBKF9YPWAVDGGIREEQQLVFBQIKIPKGGOGLP'
+      ),
+    )
+
+  def test_from_tryte_strings_with_hashes(self):
+    """
+    Initializing several Transaction objects at once, with
+    pre-computed hashes.
+    """
+    hashes = [
+      TransactionHash(b'TESTVALUE9DONTUSEINPRODUCTION99999VALCXC'),
+      TransactionHash(b'TESTVALUE9DONTUSEINPRODUCTION99999ZNIUXU'),
+    ]
+
+    txns = Transaction.from_tryte_strings(
+      [b'', TransactionTrytes(b'A' * 2187)],
+      hashes=hashes,
+    )
+
+    self.assertEqual([txn.hash for txn in txns], hashes)
+    self.assertEqual(txns[1].signature_message_fragment, Fragment(b'A' * 2187))
+
+  def test_from_tryte_strings_error_wrong_number_of_hashes(self):
+    """
+    The number of hashes doesn't match the number of transactions.
+    """
+    with self.assertRaises(ValueError):
+      Transaction.from_tryte_strings(
+        [b'', b''],
+        hashes=[TransactionHash(b'TESTVALUE9DONTUSEINPRODUCTION99999VALCXC')],
+      )
+
+  def test_from_tryte_strings_verify_hashes(self):
+    """
+    Checking pre-computed hashes against the trytes.
+    """
+    txn_hash = TransactionHash(
+      b'BSTACLRCOQCFLDFCUTNQKFEBVBLTXVLHVZA9N99LG'
+      b'TYD9SQBKF9YPWAVDGGIREEQQLVFBQIKIPKGGOGLP'
+    )
+
+    txns = Transaction.from_tryte_strings(
+      [TransactionTrytes(b'A' * 2187)],
+      hashes=[txn_hash],
+      verify_hashes=True,
+    )
+
+    self.assertEqual(txns[0].hash, txn_hash)
+
+  def test_from_tryte_strings_error_verify_hashes(self):
+    """
+    A pre-computed hash doesn't match the trytes.
+    """
+    with self.assertRaises(ValueError):
+      Transaction.from_tryte_strings(
+        [b''],
+        hashes=[TransactionHash(b'TESTVALUE9DONTUSEINPRODUCTION99999VALCXC')],
+        verify_hashes=0.5,
+      )
+
+  def test_from_tryte_strings_error_verify_hashes_out_of_range(self):
+    """
+    ``verify_hashes`` is not between 0 and 1.
+    """
+    for verify_hashes in (-0.5, 1.5):
+      with self.assertRaises(ValueError):
+        Transaction.from_tryte_strings(
+          [b''],
+          hashes=[TransactionHash(b'TESTVALUE9DONTUSEINPRODUCTION99999VALCXC')],
+          verify_hashes=verify_hashes,
+        )
+
+  def test_as_tryte_string_from_tryte_string(self):
+    """
+    Converting a Transaction that was created from trytes back into a
+    TryteString.
+    """
+    trytes = TransactionTrytes(b'A' * 2187 + b'B' * 81)
+    txn = Transaction.from_tryte_string(trytes)
+
+    result = txn.as_tryte_string()
+    self.assertEqual(result, trytes)
+
+    # Modifying the result does not affect the transaction.
+    result[0] = 'Z'
+    self.assertEqual(txn.as_tryte_string(), trytes)
+
+  def test_as_tryte_string_modified(self):
+    """
+    Converting a Transaction into a TryteString after modifying it.
+    """
+    txn = Transaction.from_tryte_string(b'A' * 2187)
+    txn.as_tryte_string()
+
+    txn.tag = Tag(b'PYOTA')
+
+    self.assertEqual(
+      txn.as_tryte_string(),
+      # Legacy tag defaults to the tag.
+      TransactionTrytes(
+        b'A' * 2187 + b'9' * 108 + b'PYOTA' + b'9' * 292 + b'PYOTA',
+      ),
+    )
+
+    # Setting the hash doesn't change the trytes.
+    txn.hash = TransactionHash(b'TESTVALUE9DONTUSEINPRODUCTION99999VALCXC')
+
+    self.assertEqual(
+      txn.as_tryte_string(),
+      TransactionTrytes(
+        b'A' * 2187 + b'9' * 108 + b'PYOTA' + b'9' * 292 + b'PYOTA',
+      ),
+    )
+
+  def test_as_tryte_string_modified_in_place(self):
+    """
+    Converting a Transaction into a TryteString after modifying one of
+    its attributes in place.
+    """
+    txn = Transaction.from_tryte_string(b'A' * 2187)
+    txn.as_tryte_string()
+
+    txn.signature_message_fragment[0:3] = b'XYZ'
+    txn.tag[0:5] = b'PYOTA'
+
+    self.assertEqual(
+      txn.as_tryte_string(),
+      # Legacy tag defaults to the tag.
+      TransactionTrytes(
+        b'XYZ' + b'A' * 2184 + b'9' * 108 + b'PYOTA' + b'9' * 292 + b'PYOTA',
+      ),
+    )
+
   def test_as_tryte_string(self):
     """
     Converting a Transaction into a TryteString.
@@ -693,3 +973,58 @@ class TransactionTestCase(TestCase):
         b'EEVD99999999999999999999999999999'
       ),
     )
+
+
+class HashTransactionTrytesTestCase(TestCase):
+  """
+  Unit tests for :py:func:`iota.transaction.base._hash_transaction_trytes`.
+  """
+  def _hash(self, curl_type, count):
+    """
+    Hashes ``count`` transactions using ``curl_type``, and returns the
+    mocked :py:meth:`PyCurl.hash_many`.
+    """
+    trytes = [TransactionTrytes(b'A' * 2187)] * count
+
+    with patch('iota.transaction.base.Curl', curl_type):
+      with patch.object(
+          PyCurl,
+          'hash_many',
+          return_value=[[0] * 243] * count,
+      ) as mock_hash_many:
+        hashes = _hash_transaction_trytes(trytes)
+
+    self.assertEqual(len(hashes), count)
+    return mock_hash_many
+
+  def test_pycurl(self):
+    """
+    With the pure-Python Curl, a few transactions are enough to use the
+    batch path.
+    """
+    min_lanes = HASH_MANY_MIN_LANES['iota.crypto.pycurl']
+
+    self.assertTrue(self._hash(PyCurl, min_lanes).called)
+    self.assertFalse(self._hash(PyCurl, min_lanes - 1).called)
+
+  @skipIf(NpCurl is None, 'NumPy is not installed.')
+  def test_npcurl(self):
+    """
+    With the NumPy Curl, larger batches still use the batch path.
+    """
+    min_lanes = HASH_MANY_MIN_LANES['iota.crypto.npcurl']
+
+    self.assertTrue(self._hash(NpCurl, min_lanes).called)
+    self.assertFalse(self._hash(NpCurl, 1).called)
+
+  def test_other_curl(self):
+    """
+    Other Curl implementations (e.g., the C extension) always hash one
+    transaction at a time.
+    """
+    class OtherCurl(PyCurl):
+      pass
+
+    OtherCurl.__module__ = 'ccurl'
+
+    self.assertFalse(self._hash(OtherCurl, 8).called)
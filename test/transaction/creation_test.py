@@ -1,3 +1,4 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from unittest import TestCase
 
 from iota import Address, Fragment, ProposedBundle, ProposedTransaction, Tag, \
@@ -5,6 +6,7 @@ from iota import Address, Fragment, ProposedBundle, ProposedTransaction, Tag, \
 from iota.crypto.signing import KeyGenerator
 from iota.crypto.types import Seed
 from iota.transaction.types import BundleHash
+from test import patch
 
 
 class ProposedBundleTestCase(TestCase):
@@ -604,6 +606,108 @@ They both licked their dry lips.
           ),
         )
 
+  def test_sign_inputs_executor(self):
+    """
+    Signing inputs in parallel, using an executor.
+    """
+    def create_bundle():
+      bundle = ProposedBundle()
+
+      bundle.add_transaction(
+        ProposedTransaction(
+          address =
+            Address(
+              b'TESTVALUE9DONTUSEINPRODUCTION99999XE9IVG'
+              b'EFNDOCQCMERGUATCIEGGOHPHGFIAQEZGNHQ9W99CH',
+            ),
+
+          value = 84,
+          timestamp = 1234567890,
+        ),
+      )
+
+      bundle.add_inputs([
+        self.input_4_bal_eq_42_sl_2,
+        self.input_5_bal_eq_42_sl_3,
+      ])
+
+      bundle.finalize()
+      return bundle
+
+    # Make sure both bundles get the same hash.
+    with patch(
+        'iota.transaction.creation.get_current_timestamp',
+        return_value = 1234567890,
+    ):
+      expected = create_bundle()
+      self.bundle = create_bundle()
+
+    expected.sign_inputs(KeyGenerator(self.seed))
+
+    with ProcessPoolExecutor(2) as executor:
+      self.bundle.sign_inputs(KeyGenerator(self.seed), executor=executor)
+
+    self.assertEqual(len(self.bundle), 6)
+
+    # The signatures are applied to the same transactions, in the same
+    # order, as when signing inputs one at a time.
+    self.assertListEqual(
+      self.bundle.as_tryte_strings(),
+      expected.as_tryte_strings(),
+    )
+
+  def test_sign_inputs_executor_error_already_signed(self):
+    """
+    Attempting to sign inputs in parallel, when they are already
+    signed.
+    """
+    self.bundle.add_transaction(ProposedTransaction(
+      address =
+        Address(
+          b'TESTVALUE9DONTUSEINPRODUCTION99999QARFLF'
+          b'TDVATBVFTFCGEHLFJBMHPBOBOHFBSGAGWCM9PG9GX'
+        ),
+
+      value = 42,
+    ))
+
+    self.bundle.add_inputs([self.input_0_bal_eq_42])
+    self.bundle.finalize()
+
+    self.bundle.sign_inputs(KeyGenerator(self.seed))
+
+    with ThreadPoolExecutor(1) as executor:
+      with self.assertRaises(ValueError):
+        self.bundle.sign_inputs(KeyGenerator(self.seed), executor=executor)
+
+  def test_sign_inputs_executor_error_index(self):
+    """
+    Signing inputs in parallel raises the same error as signing them
+    one at a time, when an input's signature won't fit in the bundle.
+    """
+    self.bundle.add_transaction(ProposedTransaction(
+      address =
+        Address(
+          b'TESTVALUE9DONTUSEINPRODUCTION99999QARFLF'
+          b'TDVATBVFTFCGEHLFJBMHPBOBOHFBSGAGWCM9PG9GX'
+        ),
+
+      value = 42,
+    ))
+
+    self.bundle.add_inputs([self.input_0_bal_eq_42])
+    self.bundle.finalize()
+
+    # The input claims one more transaction than the bundle has.
+    self.bundle[-1].address.security_level += 1
+
+    with self.assertRaises(IndexError):
+      self.bundle.sign_inputs(KeyGenerator(self.seed))
+
+    with ThreadPoolExecutor(1) as executor:
+      with self.assertRaises(IndexError):
+        self.bundle.sign_inputs(KeyGenerator(self.seed), executor=executor)
+
   def test_sign_inputs_error_not_finalized(self):
     """
     Attempting to sign inputs in a bundle that hasn't been finalized
@@ -1081,4 +1185,86 @@ They both licked their dry lips.
     self.bundle.finalize()
 
     with self.assertRaises(RuntimeError):
-      self.bundle.add_signature_or_message([custom_fragment])
\ No newline at end of file
+      self.bundle.add_signature_or_message([custom_fragment])
+
+
+class ProposedTransactionTestCase(TestCase):
+  def test_as_tryte_string_modified(self):
+    """
+    The TryteString representation of a proposed transaction is updated
+    when the transaction is modified.
+    """
+    txn = ProposedTransaction(
+      address = Address(b'TESTVALUE9DONTUSEINPRODUCTION99999XE9IVG'),
+      tag = Tag(b'PYOTA'),
+      value = 42,
+      timestamp = 1234567890,
+    )
+
+    txn.bundle_hash = BundleHash(b'TESTVALUE9DONTUSEINPRODUCTION99999VALCXC')
+    txn.current_index = 0
+    txn.last_index = 0
+    txn.signature_message_fragment = Fragment(b'')
+
+    before = txn.as_tryte_string()
+    self.assertEqual(txn.as_tryte_string(), before)
+
+    txn.increment_legacy_tag()
+
+    after = txn.as_tryte_string()
+    self.assertNotEqual(after, before)
+    self.assertEqual(after[2295:2322], txn.legacy_tag)
+
+  def test_get_bundle_essence_trits_modified(self):
+    """
+    The bundle essence trits of a proposed transaction are updated when
+    the transaction is modified.
+    """
+    txn = ProposedTransaction(
+      address = Address(b'TESTVALUE9DONTUSEINPRODUCTION99999XE9IVG'),
+      tag = Tag(b'PYOTA'),
+      value = 42,
+      timestamp = 1234567890,
+    )
+
+    txn.current_index = 0
+    txn.last_index = 1
+
+    self.assertListEqual(
+      txn.get_bundle_essence_trits(),
+      txn.get_bundle_essence_trytes().as_trits(),
+    )
+
+    txn.increment_legacy_tag()
+    txn.current_index = 1
+
+    self.assertListEqual(
+      txn.get_bundle_essence_trits(),
+      txn.get_bundle_essence_trytes().as_trits(),
+    )
+
+  def test_get_bundle_essence_trits_modified_in_place(self):
+    """
+    The bundle essence trits of a proposed transaction are updated when
+    one of its attributes is modified in place.
+    """
+    txn = ProposedTransaction(
+      address = Address(b'TESTVALUE9DONTUSEINPRODUCTION99999XE9IVG'),
+      tag = Tag(b'PYOTA'),
+      value = 42,
+      timestamp = 1234567890,
+    )
+
+    txn.current_index = 0
+    txn.last_index = 1
+
+    before = txn.get_bundle_essence_trits()
+
+    txn.tag[0:5] = b'IOTAP'
+
+    self.assertNotEqual(txn.get_bundle_essence_trits(), before)
+
+    self.assertListEqual(
+      txn.get_bundle_essence_trits(),
+      txn.get_bundle_essence_trytes().as_trits(),
+    )
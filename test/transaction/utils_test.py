@@ -1,6 +1,9 @@
+from io import BytesIO
 from unittest import TestCase
 
-from iota import convert_value_to_standard_unit
+from iota import Fragment, TryteString, convert_value_to_standard_unit, \
+  decode_fragments, encode_fragments, encode_fragments_async
+from test import async_test
 
 
 class ConvertValueToStandardUnitTestCase(TestCase):
@@ -78,3 +81,120 @@ class ConvertValueToStandardUnitTestCase(TestCase):
     """
     with self.assertRaises(ValueError):
       convert_value_to_standard_unit('3.141592 pI', 'Gi')
+
+
+class EncodeFragmentsTestCase(TestCase):
+  def test_multiple_fragments(self):
+    """
+    Encoding a payload that spans several fragments.
+    """
+    payload = bytes(range(256)) * 10
+
+    fragments = list(encode_fragments(BytesIO(payload), chunk_size=100))
+
+    self.assertEqual(
+      fragments,
+      list(TryteString.from_bytes(payload).iter_chunks(Fragment.LEN)),
+    )
+
+    for fragment in fragments:
+      self.assertIsInstance(fragment, Fragment)
+      self.assertEqual(len(fragment), Fragment.LEN)
+
+  def test_exact_fragment(self):
+    """
+    Encoding a payload that fills exactly one fragment.
+    """
+    payload = b'x' * (Fragment.LEN // 2)
+
+    fragments = list(encode_fragments(BytesIO(payload)))
+
+    self.assertEqual(fragments, [Fragment(TryteString.from_bytes(payload))])
+
+  def test_empty_stream(self):
+    """
+    Encoding an empty stream.
+    """
+    self.assertEqual(list(encode_fragments(BytesIO(b''))), [])
+
+  @async_test
+  async def test_async_stream(self):
+    """
+    Encoding bytes read from an asynchronous stream.
+    """
+    class AsyncBytesIO(BytesIO):
+      async def read(self, size=-1):
+        return super(AsyncBytesIO, self).read(size)
+
+    payload = bytes(range(256)) * 10
+
+    fragments = [
+      fragment
+      async for fragment in encode_fragments_async(
+        AsyncBytesIO(payload),
+        chunk_size=100,
+      )
+    ]
+
+    self.assertEqual(
+      fragments,
+      list(TryteString.from_bytes(payload).iter_chunks(Fragment.LEN)),
+    )
+
+
+class DecodeFragmentsTestCase(TestCase):
+  def test_round_trip(self):
+    """
+    Decoding fragments generated by :py:func:`encode_fragments`.
+    """
+    payload = bytes(range(256)) * 10
+
+    self.assertEqual(
+      b''.join(decode_fragments(encode_fragments(BytesIO(payload)))),
+      payload,
+    )
+
+  def test_padding_spans_fragments(self):
+    """
+    Trailing 9s are only stripped from the end of the sequence, even if
+    a fragment in the middle ends with 9s.
+    """
+    fragments = [
+      TryteString(b'RBTC9D9D99'),
+      TryteString(b'9999'),
+      TryteString(b'QAEA999'),
+      TryteString(b'9999'),
+    ]
+
+    self.assertEqual(
+      b''.join(decode_fragments(fragments)),
+      b'Hell\x00\x00\x00, ',
+    )
+
+    # Same result as decoding the concatenated fragments.
+    self.assertEqual(
+      b''.join(decode_fragments(fragments)).decode('utf-8', 'replace'),
+      TryteString(b''.join(map(bytes, fragments))).decode('replace'),
+    )
+
+  def test_no_strip_padding(self):
+    """
+    Decoding fragments without stripping padding.
+    """
+    fragments = [TryteString(b'RBTC9D'), TryteString(b'99')]
+
+    self.assertEqual(
+      b''.join(decode_fragments(fragments, strip_padding=False)),
+      b'Hel\x00',
+    )
+
+  def test_errors_replace(self):
+    """
+    Decoding fragments that contain an un-decodable pair.
+    """
+    fragments = [TryteString(b'RBTCZ'), TryteString(b'Z9D')]
+
+    self.assertEqual(
+      b''.join(decode_fragments(fragments, errors='replace')),
+      b'He?l',
+    )
@@ -1,6 +1,10 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from threading import Event
 from unittest import TestCase
 
 from iota import Address, Bundle, BundleHash, BundleValidator, TransactionTrytes
+from iota.transaction.validator import validate_bundles
+from test import async_test, patch
 
 
 class BundleValidatorTestCase(TestCase):
@@ -406,6 +410,171 @@ class BundleValidatorTestCase(TestCase):
     )
 
 
+  @async_test
+  async def test_validate_bundles(self):
+    """
+    Validating multiple bundles at once.
+    """
+    invalid_bundle = Bundle(
+      self.bundle.transactions[:4] + self.bundle.transactions[5:],
+    )
+
+    errors = await validate_bundles([self.bundle, invalid_bundle])
+
+    self.assertEqual(len(errors), 2)
+    self.assertListEqual(errors[0], [])
+    self.assertListEqual(errors[1], BundleValidator(invalid_bundle).errors)
+
+  @async_test
+  async def test_validate_bundles_first_error_only(self):
+    """
+    Validating multiple bundles, stopping at the first error in each.
+    """
+    invalid_bundle = Bundle(
+      self.bundle.transactions[:4] + self.bundle.transactions[5:],
+    )
+
+    errors = await validate_bundles(
+      [invalid_bundle, self.bundle],
+      first_error_only=True,
+    )
+
+    self.assertListEqual(
+      errors,
+
+      [
+        [
+          'Transaction 0 has invalid last index value '
+          '(expected 6, actual 7).',
+        ],
+
+        [],
+      ],
+    )
+
+  @async_test
+  async def test_validate_bundles_process_pool(self):
+    """
+    Validating multiple bundles using a pool of worker processes.
+    """
+    valid_bundle = Bundle.from_tryte_strings(
+      self.bundle.as_tryte_strings(head_to_tail=True),
+    )
+
+    # The values are left alone, so that the signatures are sent to the
+    # worker processes.
+    self.bundle[5].signature_message_fragment[:-1] = b'9'
+
+    with ProcessPoolExecutor(2) as executor:
+      with patch.object(
+          executor,
+          'submit',
+          wraps=executor.submit,
+      ) as mock_submit:
+        errors = await validate_bundles(
+          [valid_bundle, self.bundle],
+          executor=executor,
+        )
+
+    self.assertTrue(mock_submit.called)
+
+    self.assertListEqual(
+      errors,
+
+      [
+        [],
+        ['Transaction 4 has invalid signature (using 3 fragments).'],
+      ],
+    )
+
+
+  @async_test
+  async def test_validate_bundles_signature_per_job(self):
+    """
+    Each input's signature is validated as a separate job, so that the
+    inputs of a single bundle can be validated in parallel.
+    """
+    submitted = []
+
+    class RecordingExecutor(ThreadPoolExecutor):
+      def submit(self, fn, *args, **kwargs):
+        submitted.append(args)
+        return super(RecordingExecutor, self).submit(fn, *args, **kwargs)
+
+    # Remove the last input's second signature fragment, and the change
+    # transaction (moving the change into the spend, to keep the bundle
+    # balanced).
+    invalid_bundle = Bundle.from_tryte_strings(
+      [txn.as_tryte_string() for txn in self.bundle[:-2]],
+    )
+    invalid_bundle[0].value += self.bundle[-1].value
+    for txn in invalid_bundle:
+      txn.last_index -= 2
+
+    with RecordingExecutor(2) as executor:
+      errors = await validate_bundles(
+        [self.bundle, invalid_bundle],
+        executor=executor,
+      )
+
+    self.assertListEqual(
+      errors,
+
+      [
+        [],
+        ['Transaction 4 has invalid signature (using 2 fragments).'],
+      ],
+    )
+
+    # 2 inputs in each bundle.
+    self.assertEqual(len(submitted), 4)
+
+
+  @async_test
+  async def test_validate_bundles_first_error_only_stops_early(self):
+    """
+    With ``first_error_only``, once one of a bundle's signatures fails
+    validation, its remaining signatures are not validated.
+    """
+    inputs = [
+      group for group in self.bundle.group_transactions()
+      if group[0].value < 0
+    ]
+
+    release = Event()
+    validated = []
+
+    def mock_get_group_signature_error(group, sponge_type):
+      if group[0].current_index == inputs[0][0].current_index:
+        return 'Transaction 1 has invalid signature (using 2 fragments).'
+
+      # If ``validate_bundles`` waited for this job, it would hang.
+      release.wait(5)
+      validated.append(group)
+
+    with ThreadPoolExecutor(1) as executor:
+      try:
+        with patch(
+            'iota.transaction.validator._get_group_signature_error',
+            mock_get_group_signature_error,
+        ):
+          errors = await validate_bundles(
+            [self.bundle],
+            executor=executor,
+            first_error_only=True,
+          )
+
+        # The second input's job was either cancelled, or it is still
+        # running.
+        self.assertListEqual(validated, [])
+      finally:
+        release.set()
+
+    self.assertListEqual(
+      errors,
+      [['Transaction 1 has invalid signature (using 2 fragments).']],
+    )
+
 class BundleValidatorMultisigTestCase(TestCase):
   """
   Tests how :py:class:`BundleValidator` handles a bundle with a
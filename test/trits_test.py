@@ -1,6 +1,7 @@
 from unittest import TestCase
 
-from iota import trits_from_int
+from iota import add_trits, increment_trits, int_from_trits, \
+  trits_from_int, trits_from_int_fixed
 
 
 class TritsFromIntTestCase(TestCase):
@@ -25,4 +26,129 @@ class TritsFromIntTestCase(TestCase):
     """
     self.assertEqual(trits_from_int(0, pad=None), [])
 
+  def test_no_leading_zeroes(self):
+    """
+    The result does not have any more trits than necessary (unless
+    padded).
+    """
+    self.assertEqual(trits_from_int(1), [1])
+    self.assertEqual(trits_from_int(-4), [-1, -1])
+    self.assertEqual(trits_from_int(14, pad=None), [-1, -1, -1, 1])
+
+  def test_round_trip(self):
+    """
+    Converting integers to trits and back again.
+    """
+    for n in (-1000000007, -14, -13, -1, 1, 13, 14, 27, 1480690413):
+      self.assertEqual(int_from_trits(trits_from_int(n)), n)
+
+    # Longer than one hash.
+    self.assertEqual(int_from_trits(trits_from_int(3 ** 300)), 3 ** 300)
+
+
+class TritsFromIntFixedTestCase(TestCase):
+  """
+  Unit tests for :py:func:`trits_from_int_fixed`.
+  """
+  def test_padded(self):
+    """
+    The result is padded to the requested width.
+    """
+    self.assertEqual(trits_from_int_fixed(5, 6), [-1, -1, 1, 0, 0, 0])
+
+  def test_matches_trits_from_int(self):
+    """
+    The result matches :py:func:`trits_from_int`, padded to the
+    requested width.
+    """
+    for width in (1, 2, 3, 4, 5, 27, 81):
+      limit = (3 ** width - 1) // 2
+
+      for n in {-limit, -limit + 1, -1, 0, 1, 2, 12345, limit - 1, limit}:
+        if -limit <= n <= limit:
+          self.assertEqual(
+            trits_from_int_fixed(n, width),
+            trits_from_int(n, pad=width),
+            'n={n}, width={width}'.format(n=n, width=width),
+          )
+
+  def test_negative(self):
+    """
+    Converting a negative value.
+    """
+    self.assertEqual(trits_from_int_fixed(-5, 4), [1, 1, -1, 0])
+
+  def test_error_too_large(self):
+    """
+    The value does not fit in the requested width.
+    """
+    with self.assertRaises(ValueError):
+      trits_from_int_fixed(14, 3)
+
+  def test_error_too_small(self):
+    """
+    The (negative) value does not fit in the requested width.
+    """
+    with self.assertRaises(ValueError):
+      trits_from_int_fixed(-14, 3)
+
+
+class AddTritsTestCase(TestCase):
+  """
+  Unit tests for :py:func:`add_trits`.
+  """
+  def test_different_lengths(self):
+    """
+    The result is as long as the longer sequence.
+    """
+    left = [1, 1]
+    right = [1, 1, 0, 1]
+
+    self.assertEqual(add_trits(left, right), [-1, 0, 1, 1])
+
+    # The inputs are not modified.
+    self.assertEqual(left, [1, 1])
+    self.assertEqual(right, [1, 1, 0, 1])
+
+  def test_overflow(self):
+    """
+    Any carry out of the most significant trit is discarded.
+    """
+    self.assertEqual(add_trits([1], [1]), [-1])
+    self.assertEqual(add_trits([1, 1], [1, 1]), [-1, 0])
+    self.assertEqual(add_trits([-1, -1], [-1, 0]), [1, 1])
+
+
+class IncrementTritsTestCase(TestCase):
+  """
+  Unit tests for :py:func:`increment_trits`.
+  """
+  def test_increment(self):
+    """
+    Incrementing a sequence of trits in place.
+    """
+    trits = [1, 1, 0, 0]
+
+    increment_trits(trits)
+    self.assertEqual(trits, [-1, -1, 1, 0])
+
+    increment_trits(trits, 40)
+    self.assertEqual(trits, add_trits([-1, -1, 1, 0], trits_from_int(40)))
+
+  def test_negative(self):
+    """
+    Decrementing a sequence of trits in place.
+    """
+    trits = [0, 0, 0]
+
+    increment_trits(trits, -4)
+    self.assertEqual(trits, [-1, -1, 0])
+
+  def test_overflow(self):
+    """
+    Any carry out of the most significant trit is discarded.
+    """
+    trits = [1, 1]
 
+    increment_trits(trits)
+    self.assertEqual(trits, [-1, -1])
@@ -1,8 +1,12 @@
+from array import array
+from gc import collect
+from pickle import dumps, loads
 from unittest import TestCase
 from warnings import catch_warnings, simplefilter as simple_filter
+from weakref import ref
 
 from iota import Address, AddressChecksum, AsciiTrytesCodec, Hash, Tag, \
-  TryteString, TrytesDecodeError
+  TransactionHash, TryteString, TrytesDecodeError
 
 
 class TryteStringTestCase(TestCase):
@@ -214,6 +218,121 @@ class TryteStringTestCase(TestCase):
     # There's nothing in it, of course, but you can access it.
     self.assertEqual(ts[42:43], TryteString(b''))
 
+  def test_slice_independent(self):
+    """
+    Modifying a TryteString does not affect slices taken from it, and
+    vice versa.
+    """
+    ts = TryteString(b'RBTC9D9DCDQAEASBYBCCKBFA')
+    sliced = ts[:4]
+
+    ts[0] = 'Z'
+
+    self.assertIs(type(sliced), TryteString)
+    self.assertEqual(sliced, TryteString(b'RBTC'))
+
+    sliced[1] = 'Z'
+
+    self.assertEqual(sliced, TryteString(b'RZTC'))
+    self.assertEqual(ts[:4], TryteString(b'ZBTC'))
+
+  def test_slice_copy_on_write(self):
+    """
+    Objects initialized from a slice share its buffer until one of them
+    is modified.
+    """
+    ts = TryteString(b'RBTC9D9DCDQAEASBYBCCKBFAAAAAAA')
+    tag = Tag(ts[:Tag.LEN])
+
+    ts[0] = 'Z'
+    tag[1] = 'Z'
+
+    self.assertEqual(ts, TryteString(b'ZBTC9D9DCDQAEASBYBCCKBFAAAAAAA'))
+    self.assertEqual(tag, Tag(b'RZTC9D9DCDQAEASBYBCCKBFAAAA'))
+
+  def test_slice_pickle(self):
+    """
+    Slices can be pickled.
+    """
+    sliced = TryteString(b'RBTC9D9DCDQAEASBYBCCKBFA')[4:8]
+
+    self.assertEqual(loads(dumps(sliced)), TryteString(b'9D9D'))
+
+  def test_hash_cached(self):
+    """
+    The hash of a TryteString is cached until it is modified.
+    """
+    ts = TryteString(b'RBTC9D9DCDQAEASBYBCCKBFA')
+    original = hash(ts)
+
+    self.assertEqual(hash(ts), original)
+    self.assertEqual(hash(ts), hash(TryteString(b'RBTC9D9DCDQAEASBYBCCKBFA')))
+
+    ts[0] = 'Z'
+
+    self.assertEqual(hash(ts), hash(TryteString(b'ZBTC9D9DCDQAEASBYBCCKBFA')))
+
+    # Modifying a TryteString also updates its hash in sets/dicts.
+    ts[0] = 'R'
+    self.assertIn(ts, {TryteString(b'RBTC9D9DCDQAEASBYBCCKBFA')})
+
+  def test_hash_cached_reads(self):
+    """
+    Reading a TryteString doesn't clear its cached hash, or make a copy
+    of a shared buffer.
+    """
+    ts = TryteString(b'RBTC9D9DCDQAEASBYBCCKBFA')[:]
+    original = hash(ts)
+
+    self.assertIn(b'9D9D', ts)
+    self.assertEqual(ts.decode(), 'Hello, IOTA!')
+    self.assertEqual(ts.encode(), b'Hello, IOTA!')
+    self.assertEqual(ts.as_json_compatible(), 'RBTC9D9DCDQAEASBYBCCKBFA')
+
+    self.assertEqual(ts._hash_value, original)
+    self.assertIsInstance(ts._buffer, memoryview)
+
+  def test_init_bytearray_copied(self):
+    """
+    Initializing a TryteString from a bytearray makes a copy, so that
+    the caller can still resize their bytearray after the TryteString's
+    buffer is shared.
+    """
+    trytes = bytearray(b'RBTC')
+    ts = TryteString(trytes)
+    sliced = ts[:2]
+
+    trytes += b'9D9D'
+
+    self.assertEqual(ts, TryteString(b'RBTC'))
+    self.assertEqual(sliced, TryteString(b'RB'))
+
+  def test_hash_pickle(self):
+    """
+    The cached hash is not pickled (hashes of byte strings are not the
+    same from one process to the next).
+    """
+    ts = TryteString(b'RBTC9D9DCDQAEASBYBCCKBFA')
+    hash(ts)
+
+    self.assertNotIn('_hash_value', loads(dumps(ts)).__dict__)
+
+  def test_comparison_cached_hashes(self):
+    """
+    Comparing TryteStrings whose hashes have already been computed.
+    """
+    ts1 = TryteString(b'RBTC9D9DCDQAEASBYBCCKBFA')
+    ts2 = TryteString(b'RBTC9D9DCDQAEASBYBCCKBFA')
+    ts3 = TryteString(b'ZBTC9D9DCDQAEASBYBCCKBFA')
+
+    hash(ts1)
+    hash(ts2)
+    hash(ts3)
+
+    self.assertTrue(ts1 == ts1)
+    self.assertTrue(ts1 == ts2)
+    self.assertFalse(ts1 == ts3)
+
   def test_slice_mutator(self):
     """
     Modifying slices of a TryteString.
@@ -363,6 +482,18 @@ class TryteStringTestCase(TestCase):
     with self.assertRaises(ValueError):
       TryteString(b'not valid')
 
+  def test_init_error_invalid_characters_position(self):
+    """
+    The error message identifies the first invalid character.
+    """
+    with self.assertRaises(ValueError) as context:
+      TryteString(b'RBTC9D9Dcdqa')
+
+    self.assertEqual(
+      str(context.exception),
+      "Invalid character 'c' at position 8 (expected A-Z or 9).",
+    )
+
   def test_init_error_int(self):
     """
     Attempting to reset a TryteString from an int.
@@ -728,6 +859,25 @@ class TryteStringTestCase(TestCase):
       ],
     )
 
+  def test_as_trit_array(self):
+    """
+    Converting a TryteString into a compact sequence of trit values.
+    """
+    trytes = TryteString(b'ZJVYUGTDRPDYFGFXMK')
+
+    trits = trytes.as_trit_array()
+
+    self.assertIsInstance(trits, array)
+    self.assertEqual(trits.typecode, 'b')
+    self.assertListEqual(trits.tolist(), trytes.as_trits())
+
+  def test_as_trit_array_empty(self):
+    """
+    Converting an empty TryteString into a compact sequence of trit
+    values.
+    """
+    self.assertEqual(TryteString(b'').as_trit_array(), array('b'))
+
   def test_random(self):
     """
     Generating a random sequence of trytes.
@@ -882,6 +1032,53 @@ class TryteStringTestCase(TestCase):
       b'RBTC',
     )
 
+  def test_from_trits_array(self):
+    """
+    Converting an ``array('b')`` of trit values into a TryteString.
+    """
+    trits = array('b', [0, 0, -1, -1, 1, 0, -1, 1, -1, 0, 1, 0])
+
+    self.assertEqual(
+      bytes(TryteString.from_trits(trits)),
+      b'RBTC',
+    )
+
+  def test_from_trits_memoryview(self):
+    """
+    Converting a memoryview of an ``array('b')`` of trit values into a
+    TryteString.
+    """
+    trits = array('b', [0, 0, -1, -1, 1, 0])
+
+    self.assertEqual(
+      bytes(TryteString.from_trits(memoryview(trits))),
+      b'RB',
+    )
+
+  def test_from_trits_bytes(self):
+    """
+    ``bytes`` values are unsigned, so they aren't read as packed trits.
+    """
+    self.assertEqual(bytes(TryteString.from_trits(b'\x00\x01\x00')), b'C')
+
+  def test_from_trits_round_trip(self):
+    """
+    Converting a TryteString into trits and back again.
+    """
+    trytes = TryteString.random(Hash.LEN)
+
+    self.assertEqual(TryteString.from_trits(trytes.as_trits()), trytes)
+    self.assertEqual(TryteString.from_trits(trytes.as_trit_array()), trytes)
+
+  def test_from_trits_non_trits(self):
+    """
+    Converting a sequence that contains values other than -1, 0 and 1.
+    """
+    self.assertEqual(
+      bytes(TryteString.from_trits([0, 0, -1, 2, 0, 0])),
+      b'RB',
+    )
+
 class HashTestCase(TestCase):
   def test_random(self):
     """
@@ -890,6 +1087,41 @@ class HashTestCase(TestCase):
     rand = Hash.random()
     self.assertEqual(len(rand), Hash.LEN)
 
+  def test_intern(self):
+    """
+    Interning equal hashes returns the same object.
+    """
+    trytes = b'RBTC9D9DCDQAEASBYBCCKBFA'
+
+    first = Hash(trytes).intern()
+
+    self.assertIs(Hash(trytes).intern(), first)
+    self.assertIsNot(Hash(b'ZBTC').intern(), first)
+
+  def test_intern_type(self):
+    """
+    Hashes of different types are interned separately.
+    """
+    trytes = b'RBTC9D9DCDQAEASBYBCCKBFA'
+
+    hash_ = Hash(trytes).intern()
+    txn_hash = TransactionHash(trytes).intern()
+
+    self.assertIs(type(txn_hash), TransactionHash)
+    self.assertIsNot(txn_hash, hash_)
+
+  def test_intern_weak(self):
+    """
+    Interned hashes are discarded once they are no longer used.
+    """
+    hash_ = Hash(b'NNTERNEDHASH').intern()
+    hash_ref = ref(hash_)
+
+    del hash_
+    collect()
+
+    self.assertIsNone(hash_ref())
+
 
 class AddressTestCase(TestCase):
   def test_init_automatic_pad(self):